@@ -0,0 +1,243 @@
+"""
+FAZZ-4 API YÜK TESTİ (In-Process Load Harness)
+
+src/main.py içindeki FastAPI uygulamasını ağ katmanı olmadan, doğrudan ASGI
+arayüzü üzerinden sürer. Her eşzamanlılık (concurrency) seviyesi için kapalı
+döngü istemciler çalıştırılır; throughput eğrisi ve p50/p95/p99 gecikme
+histogramları raporlanır ve JSON olarak kaydedilir.
+
+Kullanım:
+    python -m benchmarks.api_load --concurrency 1,8,64,256 --duration 3 \
+        --mix status:5,snapshot:2,convergence:1 --revalidate
+
+Çıktı varsayılan olarak depo kökündeki bench_api_load.json dosyasına yazılır
+(bench_output.txt ile aynı yer).
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_OUT = Path(__file__).resolve().parent.parent / "bench_api_load.json"
+
+# İstek karışımında kullanılabilen isimli istekler: (method, path, JSON gövde)
+REQUESTS = {
+    "status": ("GET", "/military/status", None),
+    "efficiency": ("GET", "/military/efficiency", None),
+    "transistor": ("GET", "/military/transistor", None),
+    "motor": ("GET", "/military/motor", None),
+    "convergence": ("GET", "/military/convergence", None),
+    "snapshot": ("GET", "/military/snapshot", None),
+    "batch": ("POST", "/military/convergence/batch",
+              {"queries": [{"iterations": 500, "tau": t} for t in (5.0, 10.0, 20.0, 40.0)]}),
+}
+
+# Gecikme histogramı kova sınırları (ms, logaritmik)
+HISTOGRAM_EDGES_MS = np.geomspace(0.01, 10_000, 31)
+
+
+class ASGIClient:
+    """
+    Bir ASGI uygulamasına ağ olmadan istek gönderen asgari istemci.
+
+    Lifespan (startup/shutdown) olaylarını da sürer; böylece uygulamanın
+    başlangıç kancaları gerçek sunucudaki gibi çalışır.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._lifespan_task: Optional[asyncio.Task] = None
+        self._lifespan_queue: Optional[asyncio.Queue] = None
+
+    async def startup(self) -> None:
+        self._lifespan_queue = asyncio.Queue()
+        started = asyncio.get_running_loop().create_future()
+
+        async def receive():
+            return await self._lifespan_queue.get()
+
+        async def send(message):
+            if message["type"].startswith("lifespan.startup") and not started.done():
+                started.set_result(message["type"])
+
+        scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}
+        self._lifespan_task = asyncio.create_task(self.app(scope, receive, send))
+        await self._lifespan_queue.put({"type": "lifespan.startup"})
+        result = await started
+        if result != "lifespan.startup.complete":
+            raise RuntimeError(f"Uygulama başlatılamadı: {result}")
+
+    async def shutdown(self) -> None:
+        if self._lifespan_task is not None:
+            await self._lifespan_queue.put({"type": "lifespan.shutdown"})
+            await self._lifespan_task
+
+    async def request(self, method: str, path: str, body: Optional[dict] = None,
+                      headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], int]:
+        """İsteği gönderir; (durum kodu, yanıt başlıkları, gövde uzunluğu) döndürür."""
+        path, _, query = path.partition("?")
+        payload = json.dumps(body).encode() if body is not None else b""
+        raw_headers = [(b"host", b"bench.local")]
+        if body is not None:
+            raw_headers += [(b"content-type", b"application/json"),
+                            (b"content-length", str(len(payload)).encode())]
+        raw_headers += [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": method, "scheme": "http", "path": path, "raw_path": path.encode(),
+            "query_string": query.encode(), "root_path": "", "headers": raw_headers,
+            "client": ("127.0.0.1", 50000), "server": ("bench.local", 80), "state": {},
+        }
+        sent = False
+        done = asyncio.Event()
+        status, response_headers, size = 0, {}, 0
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": payload, "more_body": False}
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status, response_headers, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers = {k.decode(): v.decode() for k, v in message.get("headers", [])}
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    done.set()
+
+        await self.app(scope, receive, send)
+        done.set()
+        return status, response_headers, size
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """"status:5,snapshot:2" biçimindeki karışımı {isim: ağırlık} sözlüğüne çevirir."""
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.strip().partition(":")
+        if name not in REQUESTS:
+            raise ValueError(f"Bilinmeyen istek '{name}'. Seçenekler: {sorted(REQUESTS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+async def run_level(client: ASGIClient, concurrency: int, duration: float,
+                    mix: Dict[str, float], revalidate: bool, seed: int) -> dict:
+    """Tek bir eşzamanlılık seviyesinde kapalı döngü yük uygular."""
+    names, weights = list(mix), list(mix.values())
+    latencies: List[float] = []
+    by_name: Dict[str, List[float]] = {name: [] for name in names}
+    statuses: Dict[str, int] = {}
+    etags: Dict[str, str] = {}
+    bytes_total = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(worker_id: int):
+        nonlocal bytes_total
+        rng = random.Random(seed * 100_003 + worker_id)
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            method, path, body = REQUESTS[name]
+            headers = {"If-None-Match": etags[name]} if revalidate and name in etags else None
+            start = time.perf_counter()
+            status, response_headers, size = await client.request(method, path, body, headers)
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            latencies.append(elapsed_ms)
+            by_name[name].append(elapsed_ms)
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+            bytes_total += size
+            if "etag" in response_headers:
+                etags[name] = response_headers["etag"]
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    samples = np.asarray(latencies)
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99]) if samples.size else (np.nan,) * 3
+    counts, _ = np.histogram(samples, bins=HISTOGRAM_EDGES_MS)
+    return {
+        "concurrency": concurrency,
+        "requests": int(samples.size),
+        "elapsed_s": elapsed,
+        "throughput_rps": samples.size / elapsed if elapsed else 0.0,
+        "latency_ms": {"p50": float(p50), "p95": float(p95), "p99": float(p99),
+                       "mean": float(samples.mean()) if samples.size else float("nan"),
+                       "max": float(samples.max()) if samples.size else float("nan")},
+        "histogram_ms": {"edges": HISTOGRAM_EDGES_MS.tolist(), "counts": counts.tolist()},
+        "per_request_ms": {
+            name: {"requests": len(values), "p50": float(np.percentile(values, 50)),
+                   "p99": float(np.percentile(values, 99))}
+            for name, values in by_name.items() if values
+        },
+        "status_counts": statuses,
+        "bytes_per_request": bytes_total / samples.size if samples.size else 0.0,
+    }
+
+
+async def run_benchmark(app, levels: List[int], duration: float, mix: Dict[str, float],
+                        revalidate: bool = False, seed: int = 0) -> dict:
+    client = ASGIClient(app)
+    await client.startup()
+    try:
+        results = []
+        for concurrency in levels:
+            result = await run_level(client, concurrency, duration, mix, revalidate, seed)
+            results.append(result)
+            lat = result["latency_ms"]
+            print(f"[YÜK] c={concurrency:4d} | {result['throughput_rps']:9.0f} req/s | "
+                  f"p50 {lat['p50']:7.3f} ms | p95 {lat['p95']:7.3f} ms | p99 {lat['p99']:7.3f} ms | "
+                  f"durum {result['status_counts']}")
+            if len(result["per_request_ms"]) > 1:
+                for name, row in result["per_request_ms"].items():
+                    print(f"        {name:<12} p50 {row['p50']:7.3f} ms | p99 {row['p99']:7.3f} ms")
+    finally:
+        await client.shutdown()
+    return {
+        "benchmark": "api_load",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "mix": mix,
+        "revalidate": revalidate,
+        "duration_s": duration,
+        "levels": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description="FAZZ-4 API in-process yük testi")
+    parser.add_argument("--concurrency", default="1,4,16,64,256",
+                        help="Virgülle ayrılmış eşzamanlılık seviyeleri")
+    parser.add_argument("--duration", type=float, default=2.0, help="Seviye başına süre (s)")
+    parser.add_argument("--mix", default="status:4,efficiency:1,transistor:1,motor:1,convergence:1,snapshot:2",
+                        help="İstek karışımı, ör. status:5,batch:1")
+    parser.add_argument("--revalidate", action="store_true",
+                        help="İstemciler son ETag ile If-None-Match gönderir (polling kokpit)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    args = parser.parse_args(argv)
+
+    from src.main import app
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    report = asyncio.run(run_benchmark(app, levels, args.duration, parse_mix(args.mix),
+                                       args.revalidate, args.seed))
+    args.out.write_text(json.dumps(report, indent=2))
+    print(f"[YÜK] Sonuçlar kaydedildi: {args.out}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+FAZZ-4 SOĞUK BAŞLANGIÇ BÜTÇESİ (Startup Budget Check)
+
+Her hedef ayrı, taze bir Python sürecinde --repeat kez koşturulur; süreç
+başlatmadan çıkışa kadar geçen duvar süresinin medyanından çıplak yorumlayıcının
+medyanı çıkarılır (ek maliyet). Ek maliyet bütçeyi (ms) aşarsa ya da hedef
+yasaklı bir modülü içe aktarırsa çıkış kodu 1'dir; CI'da kapı olarak
+kullanılabilir. Daha yavaş makineler bütçeleri --budget ya da
+FAZZ4_STARTUP_BUDGETS ortam değişkeniyle (ör. "api=900,cli=150")
+geçersiz kılabilir; komut satırı ortam değişkenine üstün gelir.
+
+Hedefler:
+    registry : simülasyon kaydını yükleyip adları listelemek (CLI yolu);
+               NumPy / FastAPI / pydantic / SQLAlchemy yüklenmemeli
+    cli      : fazz komut satırı (click) yüklenip simülasyonlar listelenir;
+               NumPy / FastAPI / pydantic / SQLAlchemy yüklenmemeli
+    api      : yeni bir uvicorn işçisi — src.main içe aktarılır ve lifespan
+               başlangıcı satır içi bir ASGI sürücüsüyle tamamlanır (ölçüme
+               yük testi istemcisinin içe aktarımı girmez);
+               NumPy / SQLAlchemy / pandas yüklenmemeli (ağır rotalar ilk
+               istekte yükler)
+
+Bütçe aşımında en pahalı doğrudan içe aktarmalar (-X importtime) listelenir.
+
+Kullanım:
+    python -m benchmarks.startup --repeat 7
+    python -m benchmarks.startup --target api --budget api=600
+    FAZZ4_STARTUP_BUDGETS=api=900 python -m benchmarks.startup
+
+Çıktı varsayılan olarak depo kökündeki bench_startup.json dosyasına yazılır.
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUT = ROOT / "bench_startup.json"
+
+_API_READY = """
+import asyncio
+from src.main import app
+
+async def _ready():
+    messages = asyncio.Queue()
+    for message in ({"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}):
+        messages.put_nowait(message)
+    sent = []
+
+    async def send(message):
+        sent.append(message["type"])
+
+    await app({"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}, messages.get, send)
+    if sent[:1] != ["lifespan.startup.complete"]:
+        raise SystemExit(f"Uygulama başlatılamadı: {sent}")
+
+asyncio.run(_ready())
+"""
+
+# Hedef -> (kod, ek maliyet bütçesi (ms), yüklenmemesi gereken modüller)
+TARGETS: Dict[str, Tuple[str, float, Tuple[str, ...]]] = {
+    "registry": ("from src.simulation import registry\nregistry.names()\nregistry.describe()",
+                 60.0, ("numpy", "fastapi", "pydantic", "sqlalchemy", "src.simulation.fazz10_mars_arrival")),
+    "cli": ("from src.interfaces.cli import cli\ncli.main(['list'], standalone_mode=False)",
+            100.0, ("numpy", "fastapi", "pydantic", "sqlalchemy", "src.services.batch_runs")),
+    "api": (_API_READY, 750.0, ("numpy", "sqlalchemy", "pandas", "pyarrow")),
+}
+BUDGET_ENV = "FAZZ4_STARTUP_BUDGETS"
+
+# Alt süreçte hedef kodundan sonra çalışır: yasaklı modüllerden yüklenenleri bildirir
+_PROBE = "\nimport json as _json, sys as _sys\nprint(_json.dumps([_m for _m in {forbidden!r} if _m in _sys.modules]))\n"
+
+
+def _run(code: str, importtime: bool = False) -> Tuple[float, str, str]:
+    command = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", code]
+    started = time.perf_counter()
+    done = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+    seconds = time.perf_counter() - started
+    if done.returncode != 0:
+        raise RuntimeError(f"Hedef başarısız (çıkış {done.returncode}):\n{done.stderr[-2000:]}")
+    return seconds, done.stdout, done.stderr
+
+
+def _median_ms(code: str, repeat: int) -> float:
+    _run(code)  # Isınma: .pyc derlemesi ve dosya sistemi önbelleği
+    return statistics.median(_run(code)[0] for _ in range(repeat)) * 1000
+
+
+def top_imports(code: str, limit: int = 8) -> List[Tuple[str, float]]:
+    """Hedefin en pahalı doğrudan içe aktarmaları: (modül, kümülatif ms)."""
+    _, _, stderr = _run(code, importtime=True)
+    rows = []
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|( +)(\S+)", line)
+        if match and len(match.group(2)) <= 3:   # En fazla bir düzey iç içe
+            rows.append((match.group(3), int(match.group(1)) / 1000))
+    return sorted(rows, key=lambda row: -row[1])[:limit]
+
+
+def check(targets: List[str], repeat: int = 5, budgets: Optional[Dict[str, float]] = None) -> dict:
+    budgets = budgets or {}
+    bare = _median_ms("pass", repeat)
+    report = {"python": platform.python_version(), "platform": platform.platform(), "repeat": repeat,
+              "bare_interpreter_ms": bare, "targets": {}}
+    for name in targets:
+        code, default_budget, forbidden = TARGETS[name]
+        budget = budgets.get(name, default_budget)
+        total = _median_ms(code, repeat)
+        loaded = json.loads(_run(code + _PROBE.format(forbidden=forbidden))[1].strip().splitlines()[-1])
+        overhead = total - bare
+        result = {"total_ms": total, "overhead_ms": overhead, "budget_ms": budget,
+                  "forbidden_loaded": loaded, "ok": overhead <= budget and not loaded}
+        if not result["ok"]:
+            result["top_imports_ms"] = top_imports(code)
+        report["targets"][name] = result
+    report["ok"] = all(result["ok"] for result in report["targets"].values())
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description="FAZZ-4 soğuk başlangıç bütçe kontrolü")
+    parser.add_argument("--target", action="append", choices=sorted(TARGETS),
+                        help="Ölçülecek hedef (tekrarlanabilir; varsayılan hepsi)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", action="append", default=[], metavar="HEDEF=MS",
+                        help=f"Ek maliyet bütçesini geçersiz kıl, ör. api=600 (ayrıca {BUDGET_ENV})")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    args = parser.parse_args(argv)
+
+    items = [item for item in os.environ.get(BUDGET_ENV, "").split(",") if item.strip()] + args.budget
+    budgets = {name.strip(): float(ms) for name, ms in (item.split("=", 1) for item in items)}
+    report = check(args.target or list(TARGETS), args.repeat, budgets)
+    print(f"Çıplak yorumlayıcı: {report['bare_interpreter_ms']:.0f} ms")
+    for name, result in report["targets"].items():
+        status = "OK" if result["ok"] else "AŞIM"
+        print(f"  {name:<10} {result['total_ms']:7.0f} ms  (+{result['overhead_ms']:.0f} ms, "
+              f"bütçe {result['budget_ms']:.0f} ms)  {status}")
+        if result["forbidden_loaded"]:
+            print(f"             yasaklı modüller yüklendi: {', '.join(result['forbidden_loaded'])}")
+        for module, ms in result.get("top_imports_ms", []):
+            print(f"             {module:<40} {ms:7.1f} ms")
+    args.out.write_text(json.dumps(report, indent=2))
+    print(f"[BAŞLANGIÇ] Sonuçlar kaydedildi: {args.out}")
+    if not report["ok"]:
+        sys.exit(1)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,29 @@ It demonstrates the 'Endothermic Harvest' principle: converting heat into fuel.
 import time
 import sys
 
+# Bengaluru öğleden sonra ortalaması
+RADIATION_FLUX = 550.0     # W/m2 (Solar Input)
+TARGET_AREA = 5000.0       # m2 (Tech Park Roof)
+EFFICIENCY_FACTOR = 0.92   # Gd-64 Catalyst Efficiency
+COOLING_RATIO = 0.35       # 35% Endothermic abs.
+
+
+def harvest(radiation_flux=RADIATION_FLUX, target_area=TARGET_AREA,
+            efficiency_factor=EFFICIENCY_FACTOR, cooling_ratio=COOLING_RATIO) -> dict:
+    """
+    Saatlik hasat hesabı (yan etkisiz). Girdiler skaler ya da aynı boyda
+    NumPy dizileri olabilir; diziler satır satır (vektörel) hesaplanır.
+
+    Returns:
+        dict: input_mw, harvested_mw, h2_kg_h, cooling_kw
+    """
+    total_input_mw = (radiation_flux * target_area) / 1000000  # Megawatts
+    harvested_mw = total_input_mw * efficiency_factor
+    return {"input_mw": total_input_mw, "harvested_mw": harvested_mw,
+            "h2_kg_h": (harvested_mw * 1000) / 40,                    # kg/hour (Approx)
+            "cooling_kw": (harvested_mw * 1000) * cooling_ratio}
+
+
 def simulate_harvest():
     print("\n" + "="*60)
     print("   FAZZ-4 PROTOCOL: BENGALURU LIVE HARVEST SIMULATION")
@@ -21,8 +44,8 @@ def simulate_harvest():
 
     # Simulation Parameters (Bengaluru Afternoon Average)
     location = "Bengaluru, IN (12.97N, 77.59E)"
-    radiation_flux = 550.0  # W/m2 (Solar Input)
-    target_area = 5000.0    # m2 (Tech Park Roof)
+    radiation_flux = RADIATION_FLUX
+    target_area = TARGET_AREA
     
     print(f"[*] Target Location : {location}")
     print(f"[*] Solar Influx    : {radiation_flux} W/m2")
@@ -33,14 +56,12 @@ def simulate_harvest():
     print("\nInitiating VGT (Vortex-Gate Transistor) Sequence...")
     time.sleep(1)
 
-    # Calculate Totals
-    total_input_mw = (radiation_flux * target_area) / 1000000 # Megawatts
-    efficiency_factor = 0.92 # Gd-64 Catalyst Efficiency
-    
     # Results
-    harvested_mw = total_input_mw * efficiency_factor
-    h2_production = (harvested_mw * 1000) / 40 # kg/hour (Approx)
-    cooling_effect_kw = (harvested_mw * 1000) * 0.35 # 35% Endothermic abs.
+    result = harvest(radiation_flux, target_area)
+    total_input_mw = result["input_mw"]
+    harvested_mw = result["harvested_mw"]
+    h2_production = result["h2_kg_h"]
+    cooling_effect_kw = result["cooling_kw"]
 
     print(f"\n[SUCCESS] Fazz-4 Cycle Stabilized.")
     print(f"\n--- HARVEST RESULTS (HOURLY) ---")
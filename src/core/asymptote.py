@@ -0,0 +1,101 @@
+"""
+FAZZ-4 ASİMPTOTİK YAKINSAMA ÇEKİRDEĞİ
+
+MilitaryCoreEngine'in yakınsama modeli:
+    efficiency(n) = target · (1 - exp(-n / τ))
+    distance(n)   = |target - efficiency(n)|
+
+Bu modül modelin birden çok (target, τ) parametre setini tek NumPy çağrısında
+değerlendiren vektörel sürümünü içerir. Domain katmanıdır; I/O yapmaz.
+"""
+from typing import List, Sequence
+
+import numpy as np
+
+# iterations_to_epsilon'ın döndürebileceği en büyük ufuk (int64'e güvenle dökülür)
+MAX_ITERATIONS = 1e15
+
+
+def convergence_curves(targets: Sequence[float], taus: Sequence[float],
+                       iterations: Sequence[int]) -> List[dict]:
+    """
+    Birden çok yakınsama eğrisini birlikte hesaplar.
+
+    Tüm eğriler en uzun iterasyon sayısına kadar tek bir (k, N) matrisinde
+    hesaplanır, ardından her sorgu kendi uzunluğunda kesilir.
+
+    Args:
+        targets (Sequence[float]): Her sorgunun asimptot hedefi.
+        taus (Sequence[float]): Her sorgunun zaman sabiti τ (> 0).
+        iterations (Sequence[int]): Her sorgunun nokta sayısı.
+
+    Returns:
+        List[dict]: Her sorgu için "iteration", "efficiency" ve
+        "distance_from_target" dizilerini içeren sözlük.
+    """
+    targets = np.asarray(targets, dtype=np.float64)[:, None]
+    taus = np.asarray(taus, dtype=np.float64)[:, None]
+    iterations = np.asarray(iterations, dtype=np.int64)
+    if targets.shape[0] != taus.shape[0] or taus.shape[0] != iterations.shape[0]:
+        raise ValueError("targets, taus ve iterations aynı uzunlukta olmalıdır.")
+    if np.any(taus <= 0):
+        raise ValueError("τ (tau) pozitif olmalıdır.")
+
+    n = np.arange(int(iterations.max(initial=0)), dtype=np.float64)
+    efficiency = targets * (1 - np.exp(-n / taus))
+    distance = np.abs(targets - efficiency)
+    return [
+        {"iteration": n[:count], "efficiency": efficiency[i, :count],
+         "distance_from_target": distance[i, :count]}
+        for i, count in enumerate(iterations)
+    ]
+
+
+def iterations_to_epsilon(targets: Sequence[float], taus: Sequence[float],
+                          epsilons: Sequence[float]) -> dict:
+    """
+    Uzaklığın ε'a indiği iterasyonu analitik olarak çözer.
+
+    distance(n) = |target| · exp(-n / τ) ≤ ε  <=>  n ≥ τ · ln(|target| / ε)
+
+    Eğri üretip taramak yerine her sorgu O(1)'dir; tüm diziler tek NumPy
+    çağrısında çözülür. Tamsayı sonuç sınırda kapalı biçimle doğrulanır; ln
+    yuvarlaması yüzünden bir iterasyon kayma olmaz.
+
+    Args:
+        targets (Sequence[float]): Asimptot hedefleri.
+        taus (Sequence[float]): Zaman sabitleri τ (> 0).
+        epsilons (Sequence[float]): İstenen uzaklık eşikleri ε (> 0).
+
+    Returns:
+        dict: "iterations_exact" (sürekli çözüm, ε ≥ |target| ise 0) ve
+        "iteration" (distance ≤ ε olan ilk tamsayı iterasyon) dizileri.
+
+    Raises:
+        ValueError: τ veya ε pozitif değilse ya da bir ufuk MAX_ITERATIONS'ı
+            aşıyorsa (sonsuz dahil).
+    """
+    targets = np.asarray(targets, dtype=np.float64)
+    taus = np.asarray(taus, dtype=np.float64)
+    epsilons = np.asarray(epsilons, dtype=np.float64)
+    if not (targets.shape == taus.shape == epsilons.shape):
+        raise ValueError("targets, taus ve epsilons aynı uzunlukta olmalıdır.")
+    if np.any(taus <= 0):
+        raise ValueError("τ (tau) pozitif olmalıdır.")
+    if np.any(epsilons <= 0):
+        raise ValueError("ε (epsilon) pozitif olmalıdır.")
+
+    def distance(n):
+        # Kapalı biçim; target - efficiency farkı küçük ε'larda iptal (cancellation) hatası verir
+        return np.abs(targets) * np.exp(-n / taus)
+
+    with np.errstate(divide="ignore", over="ignore"):
+        exact = np.maximum(taus * np.log(np.abs(targets) / epsilons), 0.0)
+    if not np.all(exact < MAX_ITERATIONS):
+        # inf / çok büyük ufuk int64'e dökülürse işaret taşar (ör. -2**63)
+        raise ValueError(f"Ufuk {MAX_ITERATIONS:.0e} iterasyonu aşıyor; τ veya hedef/ε oranı çok büyük.")
+    iteration = np.ceil(exact)
+    # Sınırda yuvarlama düzeltmesi: sonuç ileri modelde distance(n) ≤ ε olan ilk n'dir
+    iteration = np.where((iteration > 0) & (distance(iteration - 1) <= epsilons), iteration - 1, iteration)
+    iteration = np.where(distance(iteration) > epsilons, iteration + 1, iteration)
+    return {"iterations_exact": exact, "iteration": iteration.astype(np.int64)}
@@ -0,0 +1,176 @@
+"""
+FAZZ-4 YÖRÜNGE SEYRELTME (Downsampling) ÇEKİRDEĞİ
+
+Kokpit grafikleri yaklaşık ekran genişliği kadar noktaya ihtiyaç duyar; kayıtlı
+yörüngeler ise milyonlarca nokta içerebilir. Bu modül iki seyreltme yöntemi ve
+kayıt başına önceden hesaplanan çok çözünürlüklü bir piramit sunar:
+
+- lttb_indices   : Largest-Triangle-Three-Buckets; görsel şekli korur.
+- minmax_indices : Kova başına min ve max; tepe/çukur değerlerini asla kaçırmaz.
+- TrajectoryPyramid : 2'nin kuvveti çözünürlüklerde min/max seviyeleri; bir
+  piksel genişliği sorgusu ham veriye değil ona en yakın seviyeye uygulanır.
+
+Fonksiyonlar seçilen satırların indekslerini döndürür; böylece aynı seçim
+kaydın bütün sütunlarına uygulanır. Domain katmanıdır; I/O yapmaz.
+"""
+from typing import Dict, List, Mapping, Optional
+
+import numpy as np
+
+METHODS = ("lttb", "minmax")
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets ile korunacak noktaları seçer.
+
+    İlk ve son nokta her zaman korunur; aradaki noktalar n_out - 2 kovaya
+    bölünür ve her kovadan, önceki seçilen nokta ile sonraki kovanın ortalaması
+    arasında en büyük üçgeni oluşturan nokta seçilir.
+
+    Args:
+        x (np.ndarray): Artan sıralı yatay eksen (zaman, döngü).
+        y (np.ndarray): Dikey eksen.
+        n_out (int): İstenen nokta sayısı (>= 3).
+
+    Returns:
+        np.ndarray: Artan sıralı int64 satır indeksleri.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n <= 2:
+        return np.arange(n, dtype=np.int64)
+    if n_out < 3:
+        raise ValueError("LTTB için n_out en az 3 olmalıdır.")
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Kova ortalamaları tek seferde: bir sonraki kovanın ağırlık merkezi
+    x_mean = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / np.diff(edges)
+    y_mean = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / np.diff(edges)
+    x_mean = np.append(x_mean, x[-1])
+    y_mean = np.append(y_mean, y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for bucket in range(n_out - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        cx, cy = x_mean[bucket + 1], y_mean[bucket + 1]
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[bucket + 1] = a
+    return selected
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Eşit kovalarda min ve max noktalarını seçer (en fazla n_out nokta).
+
+    Her kova iki nokta verir; tek bir uç değer (ör. valf öncesi basınç tepesi)
+    seyreltme sonrasında da görünür kalır. İlk ve son nokta korunur.
+
+    Args:
+        y (np.ndarray): Dikey eksen.
+        n_out (int): İstenen en fazla nokta sayısı (>= 2).
+
+    Returns:
+        np.ndarray: Artan sıralı, tekrarsız int64 satır indeksleri.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n, dtype=np.int64)
+    if n_out < 2:
+        raise ValueError("min/max için n_out en az 2 olmalıdır.")
+
+    n_buckets = max(1, (n_out - 2) // 2)
+    size = -(-n // n_buckets)
+    # Son kova eksikse son değerle doldurulur; indeksler sonra n - 1'e kırpılır
+    padded = np.pad(y, (0, n_buckets * size - n), mode="edge").reshape(n_buckets, size)
+    offsets = np.arange(n_buckets, dtype=np.int64) * size
+    picks = np.concatenate([offsets + padded.argmin(axis=1), offsets + padded.argmax(axis=1), [0, n - 1]])
+    return np.unique(np.minimum(picks, n - 1))
+
+
+def downsample_indices(x: np.ndarray, y: np.ndarray, n_out: int, method: str = "lttb") -> np.ndarray:
+    """Yöntem adına göre lttb_indices veya minmax_indices çağırır."""
+    if method == "lttb":
+        return lttb_indices(x, y, n_out)
+    if method == "minmax":
+        return minmax_indices(y, n_out)
+    raise ValueError(f"Bilinmeyen seyreltme yöntemi: {method} (geçerli: {', '.join(METHODS)})")
+
+
+class TrajectoryPyramid:
+    """
+    Bir kaydın önceden hesaplanmış çok çözünürlüklü min/max piramidi.
+
+    Seviye k, base_points · 2^k noktalık min/max seyreltmesidir; seviyeler ham
+    kaydın uzunluğuna ulaşana kadar üretilir (toplam bellek < 2 × kayıt). Bir
+    genişlik sorgusu, istenen noktanın en az `oversample` katını içeren en kaba
+    seviyeden hesaplanır; sorgu maliyeti kayıt uzunluğundan bağımsızdır.
+
+    Attributes:
+        x (str): Yatay eksen sütunu.
+        y (str): Seyreltmeyi yönlendiren birincil sütun.
+        length (int): Ham kayıttaki nokta sayısı.
+        levels (List[Dict[str, np.ndarray]]): Kabadan inceye seviyeler; son
+            seviye ham kayıttır.
+    """
+
+    def __init__(self, columns: Mapping[str, np.ndarray], x: str, y: str,
+                 base_points: int = 512, oversample: int = 4):
+        if x not in columns or y not in columns:
+            raise ValueError(f"Kayıtta '{x}' ve '{y}' sütunları bulunmalıdır.")
+        raw = {name: np.asarray(values) for name, values in columns.items()}
+        lengths = {len(values) for values in raw.values()}
+        if len(lengths) != 1:
+            raise ValueError("Kaydın tüm sütunları aynı uzunlukta olmalıdır.")
+
+        self.x, self.y = x, y
+        self.length = lengths.pop()
+        self.oversample = oversample
+        self.levels: List[Dict[str, np.ndarray]] = []
+        points = base_points
+        while points < self.length:
+            index = minmax_indices(raw[y], points)
+            self.levels.append({name: values[index] for name, values in raw.items()})
+            points *= 2
+        self.levels.append(raw)
+
+    @property
+    def nbytes(self) -> int:
+        """Tüm seviyelerin (ham kayıt dahil) bellekteki toplam boyutu."""
+        return sum(values.nbytes for level in self.levels for values in level.values())
+
+    def level_for(self, n_out: int) -> Dict[str, np.ndarray]:
+        """n_out noktalık bir seyreltme için kaynak seviyeyi seçer."""
+        needed = n_out * self.oversample
+        for level in self.levels:
+            if len(level[self.y]) >= needed:
+                return level
+        return self.levels[-1]
+
+    def at_width(self, width: int, method: str = "lttb",
+                 columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Kaydı verilen piksel genişliği için seyreltir.
+
+        Args:
+            width (int): Grafik genişliği (piksel). lttb piksel başına bir,
+                minmax piksel başına iki nokta döndürür.
+            method (str): "lttb" veya "minmax".
+            columns (List[str]): Döndürülecek sütunlar; verilmezse hepsi.
+
+        Returns:
+            Dict[str, np.ndarray]: Seçilen satırların sütunları.
+        """
+        n_out = width if method == "lttb" else 2 * width
+        level = self.level_for(n_out)
+        index = downsample_indices(level[self.x], level[self.y], n_out, method)
+        names = columns if columns is not None else list(level)
+        unknown = [name for name in names if name not in level]
+        if unknown:
+            raise ValueError(f"Bilinmeyen sütun(lar): {', '.join(unknown)}")
+        return {name: level[name][index] for name in names}
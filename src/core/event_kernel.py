@@ -0,0 +1,105 @@
+"""
+FAZZ-4 AYRIK OLAY SİMÜLASYON ÇEKİRDEĞİ (Discrete-Event Kernel)
+
+Sabit adımlarla "eşik aşıldı mı?" diye yoklamak yerine, drone keşifleri, gün
+dönümleri ve valf tahliyeleri gibi durumlar zaman damgalı olaylar olarak bir
+yığına (heap) konur. Simülasyon saati doğrudan bir sonraki olaya atlar; toplam
+iş adım sayısıyla değil olay sayısıyla orantılıdır.
+
+Örnek:
+    kernel = EventScheduler()
+    kernel.on("day", lambda k, e: k.schedule_in(24, "day"))
+    kernel.schedule(24, "day")
+    kernel.run(until=24 * 7 * 6)   # 6 haftalık senaryo, 42 olay
+"""
+import heapq
+import itertools
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass(order=True)
+class ScheduledEvent:
+    """Zamana, ardından ekleme sırasına göre sıralanan olay kaydı."""
+    time: float
+    seq: int
+    kind: str = field(compare=False)
+    payload: Any = field(default=None, compare=False)
+
+
+EventHandler = Callable[["EventScheduler", ScheduledEvent], None]
+
+
+class EventScheduler:
+    """
+    Heap tabanlı olay kuyruğu ve işleyici kaydı.
+
+    Aynı zamanlı olaylar eklenme sırasıyla (FIFO) işlenir. İşleyiciler çalışırken
+    yeni olay planlayabilir veya planlanmış olayları iptal edebilir.
+
+    Attributes:
+        now (float): Simülasyon saati (son işlenen olayın zamanı).
+        processed (int): İşlenen olay sayısı.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+        self.processed = 0
+        self._queue: List[ScheduledEvent] = []
+        self._counter = itertools.count()
+        self._handlers: Dict[str, List[EventHandler]] = {}
+        self._cancelled: set = set()
+
+    def on(self, kind: str, handler: EventHandler) -> None:
+        """Bir olay türüne işleyici bağlar; birden çok işleyici kayıt sırasıyla çağrılır."""
+        self._handlers.setdefault(kind, []).append(handler)
+
+    def schedule(self, at: float, kind: str, payload: Any = None) -> ScheduledEvent:
+        """Olayı mutlak simülasyon zamanına planlar."""
+        if at < self.now:
+            raise ValueError(f"Geçmişe olay planlanamaz: {at} < {self.now}")
+        event = ScheduledEvent(at, next(self._counter), kind, payload)
+        heapq.heappush(self._queue, event)
+        return event
+
+    def schedule_in(self, delay: float, kind: str, payload: Any = None) -> ScheduledEvent:
+        """Olayı şimdiki zamandan delay kadar sonraya planlar."""
+        return self.schedule(self.now + delay, kind, payload)
+
+    def cancel(self, event: ScheduledEvent) -> None:
+        """Planlanmış olayı tembel (lazy) olarak iptal eder."""
+        self._cancelled.add(event.seq)
+
+    def peek_time(self) -> Optional[float]:
+        """Sıradaki (iptal edilmemiş) olayın zamanı; kuyruk boşsa None."""
+        while self._queue and self._queue[0].seq in self._cancelled:
+            self._cancelled.discard(heapq.heappop(self._queue).seq)
+        return self._queue[0].time if self._queue else None
+
+    def run(self, until: float = math.inf, max_events: Optional[int] = None) -> int:
+        """
+        Olayları zaman sırasıyla işler.
+
+        Args:
+            until (float): Bu zamandan sonraki olaylar işlenmez (dahil).
+            max_events (int): İşlenecek en fazla olay sayısı.
+
+        Returns:
+            int: Bu çağrıda işlenen olay sayısı.
+        """
+        handled = 0
+        while max_events is None or handled < max_events:
+            next_time = self.peek_time()
+            if next_time is None or next_time > until:
+                # Ufka kadar olay kalmadı: saat doğrudan ufka atlar.
+                if until != math.inf:
+                    self.now = max(self.now, until)
+                break
+            event = heapq.heappop(self._queue)
+            self.now = event.time
+            for handler in self._handlers.get(event.kind, ()):
+                handler(self, event)
+            handled += 1
+        self.processed += handled
+        return handled
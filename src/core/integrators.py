@@ -0,0 +1,201 @@
+"""
+FAZZ-4 VEKTÖREL ODE ENTEGRATÖRLERİ
+
+Kinematik simülasyonların (fırlatma, TMI, Mars varışı, iniş, Dünya'ya giriş)
+ortak zaman entegrasyonu. Durum dizileri (n_runs, n_state) biçimindedir; tüm
+topluluk (ensemble) tek çağrıda entegre edilir.
+
+- rk4            : Sabit adımlı klasik Runge-Kutta 4
+- dormand_prince : Satır başına uyarlamalı adımlı Dormand–Prince 5(4), FSAL
+
+Türev fonksiyonu imzası:
+    f(t, y) -> dy/dt
+        t: (n_runs,) her koşunun kendi zamanı
+        y: (n_runs, n_state)
+    Satırlar birbirinden bağımsız olmalıdır; duran (bitmiş) koşular için de
+    sonlu değer döndürmelidir (adımları sıfır olduğu için sonucu etkilemez).
+
+Durma koşulu:
+    stop(t, y) -> (n_runs,) bool; True olan koşu o adımın sonunda dondurulur.
+"""
+import math
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+import numpy as np
+
+Derivative = Callable[[np.ndarray, np.ndarray], np.ndarray]
+StopCondition = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+@dataclass
+class IntegrationResult:
+    """
+    Topluluk entegrasyonu sonucu.
+
+    Attributes:
+        t (np.ndarray): (n_runs,) koşu başına son zaman.
+        y (np.ndarray): (n_runs, n_state) son durum.
+        steps (np.ndarray): (n_runs,) kabul edilen adım sayısı.
+        finished (np.ndarray): (n_runs,) durma koşulu veya t_end'e ulaşanlar.
+        rejected (np.ndarray): (n_runs,) reddedilen adım sayısı (yalnızca uyarlamalı).
+        trajectory (list): record=True ise her iterasyondaki (t, y) kopyaları.
+    """
+    t: np.ndarray
+    y: np.ndarray
+    steps: np.ndarray
+    finished: np.ndarray
+    rejected: Optional[np.ndarray] = None
+    trajectory: List[tuple] = field(default_factory=list)
+
+
+def _prepare(y0, t0) -> tuple:
+    y = np.array(y0, dtype=np.float64, copy=True)
+    if y.ndim != 2:
+        raise ValueError("y0 (n_runs, n_state) biçiminde olmalıdır.")
+    t = np.broadcast_to(np.asarray(t0, dtype=np.float64), (y.shape[0],)).copy()
+    return t, y
+
+
+def rk4(f: Derivative, y0, t0=0.0, dt: float = 1.0, t_end: float = math.inf,
+        stop: Optional[StopCondition] = None, max_steps: int = 1_000_000,
+        record: bool = False) -> IntegrationResult:
+    """
+    Sabit adımlı RK4 ile topluluğu entegre eder.
+
+    Args:
+        f (Derivative): Türev fonksiyonu f(t, y).
+        y0: (n_runs, n_state) başlangıç durumu.
+        t0: Başlangıç zamanı (skaler veya (n_runs,)).
+        dt (float): Adım büyüklüğü.
+        t_end (float): Bitiş zamanı; son adım buna göre kısaltılır.
+        stop (StopCondition): Koşu bazında durma koşulu.
+        max_steps (int): En fazla iterasyon sayısı.
+        record (bool): Yörünge kaydı tutulsun mu.
+    """
+    if dt <= 0:
+        raise ValueError("dt pozitif olmalıdır.")
+    t, y = _prepare(y0, t0)
+    steps = np.zeros(y.shape[0], dtype=np.int64)
+    active = t < t_end
+    if stop is not None:
+        active &= ~stop(t, y)
+    trajectory = [(t.copy(), y.copy())] if record else []
+
+    for _ in range(max_steps):
+        if not active.any():
+            break
+        h = np.where(active, np.minimum(dt, t_end - t), 0.0)
+        hc = h[:, None]
+        k1 = f(t, y)
+        k2 = f(t + h / 2, y + hc / 2 * k1)
+        k3 = f(t + h / 2, y + hc / 2 * k2)
+        k4 = f(t + h, y + hc * k3)
+        y = y + hc / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+        t = t + h
+        steps += active
+        done = t >= t_end
+        if stop is not None:
+            done |= stop(t, y)
+        active &= ~done
+        if record:
+            trajectory.append((t.copy(), y.copy()))
+
+    return IntegrationResult(t, y, steps, ~active, trajectory=trajectory)
+
+
+# --- Dormand–Prince 5(4) katsayıları ---
+_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+_B5 = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0])
+_B4 = np.array([5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40])
+_E = _B5 - _B4
+
+
+def dormand_prince(f: Derivative, y0, t0=0.0, t_end: float = math.inf,
+                   rtol: float = 1e-6, atol: float = 1e-9, h0: Optional[float] = None,
+                   h_max: float = math.inf, stop: Optional[StopCondition] = None,
+                   max_steps: int = 1_000_000, record: bool = False) -> IntegrationResult:
+    """
+    Uyarlamalı Dormand–Prince 5(4) ile topluluğu entegre eder.
+
+    Her koşu kendi adım büyüklüğünü ve hata kontrolünü taşır; tüm koşular
+    yine de aynı NumPy çağrılarıyla ilerletilir. Hata ölçeği
+    atol + rtol · max(|y|, |y_yeni|) üzerinden RMS normudur.
+
+    Args:
+        f (Derivative): Türev fonksiyonu f(t, y).
+        y0: (n_runs, n_state) başlangıç durumu.
+        t0: Başlangıç zamanı (skaler veya (n_runs,)).
+        t_end (float): Bitiş zamanı.
+        rtol (float): Bağıl tolerans.
+        atol (float): Mutlak tolerans.
+        h0 (float): İlk adım; verilmezse Hairer sezgisiyle seçilir.
+        h_max (float): En büyük adım.
+        stop (StopCondition): Koşu bazında durma koşulu.
+        max_steps (int): En fazla iterasyon (kabul + red) sayısı.
+        record (bool): Yörünge kaydı tutulsun mu.
+    """
+    t, y = _prepare(y0, t0)
+    n_runs = y.shape[0]
+    steps = np.zeros(n_runs, dtype=np.int64)
+    rejected = np.zeros(n_runs, dtype=np.int64)
+    active = t < t_end
+    if stop is not None:
+        active &= ~stop(t, y)
+    trajectory = [(t.copy(), y.copy())] if record else []
+
+    k1 = f(t, y)
+    if h0 is None:
+        scale = atol + rtol * np.abs(y)
+        d0 = np.sqrt(np.mean((y / scale) ** 2, axis=1))
+        d1 = np.sqrt(np.mean((k1 / scale) ** 2, axis=1))
+        h = np.where((d0 < 1e-5) | (d1 < 1e-5), 1e-6, 0.01 * d0 / np.maximum(d1, 1e-300))
+    else:
+        h = np.full(n_runs, float(h0))
+    h = np.minimum(h, h_max)
+
+    for _ in range(max_steps):
+        if not active.any():
+            break
+        h_step = np.where(active, np.minimum(h, t_end - t), 0.0)
+        hc = h_step[:, None]
+        ks = [k1]
+        for stage in range(1, 7):
+            increment = sum(a * k for a, k in zip(_A[stage], ks) if a)
+            ks.append(f(t + _C[stage] * h_step, y + hc * increment))
+        y_new = y + hc * sum(b * k for b, k in zip(_B5, ks) if b)
+        error = hc * sum(e * k for e, k in zip(_E, ks) if e)
+
+        scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+        err_norm = np.sqrt(np.mean((error / scale) ** 2, axis=1))
+        accept = active & (err_norm <= 1.0)
+        reject = active & ~accept
+
+        y = np.where(accept[:, None], y_new, y)
+        t = np.where(accept, t + h_step, t)
+        k1 = np.where(accept[:, None], ks[6], k1)  # FSAL: son aşama bir sonraki ilk aşama
+        steps += accept
+        rejected += reject
+
+        factor = np.clip(0.9 * np.power(np.maximum(err_norm, 1e-10), -0.2), 0.2, 5.0)
+        factor = np.where(reject, np.minimum(factor, 1.0), factor)
+        h = np.where(active, np.minimum(h_step * factor, h_max), h)
+        h = np.where(active & (h <= 0), 1e-12, h)
+
+        done = accept & (t >= t_end)
+        if stop is not None:
+            done |= accept & stop(t, y)
+        active &= ~done
+        if record:
+            trajectory.append((t.copy(), y.copy()))
+
+    return IntegrationResult(t, y, steps, ~active, rejected, trajectory)
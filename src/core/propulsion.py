@@ -0,0 +1,181 @@
+"""
+FAZZ-6 İTKİ ÇEKİRDEĞİ (I/O içermez)
+
+DerzzPropulsionLab'ın hesap kısmı: Ag-Gd alaşım oranları, alaşım mukavemeti ve
+H2 yakıtının itki entegrasyonu. Uyku, yazdırma veya global rastgelelik yoktur;
+laboratuvar sınıfları (konsol) ve /propulsion rotaları (sunucu) aynı
+fonksiyonları kullanır.
+
+Kapalı biçimler:
+    alloy_integrity = (m_Ag + m_Gd) · n / (n + 1)      (= 265.11 · n / (n + 1))
+    thrust_total    = fuel_tank · 4.5 · alloy / 100
+
+Yanma her saniye dalgalansa da toplam yakılan miktar her zaman fuel_tank'tır;
+bu yüzden toplam itki rastgelelikten bağımsızdır. Yanma süresi ve saniyelik en
+yüksek itki ise dalgalanmaya bağlıdır (ignition_monte_carlo).
+"""
+import math
+import random
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator
+
+AG_ATOMIC_MASS = 107.86
+GD_ATOMIC_MASS = 157.25
+BASE_BURN_RATE = 250.0      # Litre/Saniye
+THRUST_PER_LITRE = 4.5      # kN / Litre (alaşım %100'de)
+BURN_JITTER = (0.9, 1.1)    # Saniyelik yanma dalgalanması
+
+
+@dataclass(frozen=True)
+class AlloyComposition:
+    """
+    Nizam Formülü ile hesaplanan Ag-Gd alaşımı.
+
+    Attributes:
+        n_observer (int): Nizam Sabiti.
+        ratio_ag (float): Gümüş oranı n / (n+1).
+        ratio_gd (float): Gadolinyum oranı 1 / (n+1).
+        pct_ag (float): Gümüş yüzdesi.
+        pct_gd (float): Gadolinyum yüzdesi.
+        alloy_code (str): Ag{%}-Gd{%}-DerzzType.
+        alloy_integrity (float): Teorik mukavemet skoru (GPa).
+    """
+    n_observer: int
+    ratio_ag: float
+    ratio_gd: float
+    pct_ag: float
+    pct_gd: float
+    alloy_code: str
+    alloy_integrity: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class IgnitionStep:
+    """Ateşleme testinin bir saniyesi."""
+    t: int
+    burn: float
+    fuel_remaining: float
+    thrust: float
+
+
+def alloy_composition(n_observer: int, ag_atomic_mass: float = AG_ATOMIC_MASS,
+                      gd_atomic_mass: float = GD_ATOMIC_MASS) -> AlloyComposition:
+    """
+    Ag-Gd alaşım oranlarını ve mukavemetini hesaplar.
+
+    Args:
+        n_observer (int): Nizam Sabiti (>= 0).
+        ag_atomic_mass (float): Gümüş'ün atomik kütlesi.
+        gd_atomic_mass (float): Gadolinyum'un atomik kütlesi.
+
+    Returns:
+        AlloyComposition: Oranlar, yüzdeler, alaşım kodu ve mukavemet.
+    """
+    if n_observer < 0:
+        raise ValueError("n_observer negatif olamaz.")
+    ratio_gd = 1 / (n_observer + 1)
+    ratio_ag = n_observer / (n_observer + 1)
+    pct_ag, pct_gd = ratio_ag * 100, ratio_gd * 100
+    # Formül: (Ag_mass * ratio_ag) + (Gd_mass * ratio_gd * n_observer)
+    alloy_integrity = (ag_atomic_mass * ratio_ag) + (gd_atomic_mass * ratio_gd * n_observer)
+    return AlloyComposition(
+        n_observer=n_observer,
+        ratio_ag=ratio_ag,
+        ratio_gd=ratio_gd,
+        pct_ag=pct_ag,
+        pct_gd=pct_gd,
+        alloy_code=f"Ag{int(pct_ag)}-Gd{int(pct_gd)}-DerzzType",
+        alloy_integrity=alloy_integrity,
+    )
+
+
+def thrust_of(burn: float, alloy_strength: float) -> float:
+    """Yakılan H2 miktarının itkisi (F = m · ve, basitleştirilmiş)."""
+    return (burn * THRUST_PER_LITRE) * (alloy_strength / 100.0)
+
+
+def total_thrust(fuel_tank: float, alloy_strength: float) -> float:
+    """Tüm tankın yakılmasıyla elde edilen toplam itki (kapalı biçim)."""
+    return thrust_of(fuel_tank, alloy_strength)
+
+
+def ignition_steps(fuel_tank: float, alloy_strength: float, burn_rate: float = BASE_BURN_RATE,
+                   rng: random.Random = random) -> Iterator[IgnitionStep]:
+    """
+    Yakıt bitene kadar saniye saniye itki entegrasyonu.
+
+    Args:
+        fuel_tank (float): Başlangıç yakıtı (Litre).
+        alloy_strength (float): Alaşım mukavemeti (GPa).
+        burn_rate (float): Baz yanma hızı (Litre/Saniye).
+        rng: uniform() sağlayan rastgelelik kaynağı.
+
+    Yields:
+        IgnitionStep: Her saniyenin yanması, kalan yakıt ve itkisi.
+    """
+    if burn_rate <= 0:
+        raise ValueError("burn_rate pozitif olmalıdır.")
+    t = 0
+    while fuel_tank > 0:
+        t += 1
+        burn = min(fuel_tank, burn_rate * rng.uniform(*BURN_JITTER))
+        fuel_tank -= burn
+        yield IgnitionStep(t, burn, fuel_tank, thrust_of(burn, alloy_strength))
+
+
+def ignition_summary(fuel_tank: float, alloy_strength: float, burn_rate: float = BASE_BURN_RATE) -> dict:
+    """
+    Ateşleme testinin rastgelelikten bağımsız özeti (O(1)).
+
+    Returns:
+        dict: thrust_total, nominal/min/max yanma süresi (s) ve saniyelik
+        en yüksek itki.
+    """
+    if fuel_tank < 0:
+        raise ValueError("fuel_tank negatif olamaz.")
+    if burn_rate <= 0:
+        raise ValueError("burn_rate pozitif olmalıdır.")
+    low, high = BURN_JITTER
+    return {
+        "fuel_tank": fuel_tank,
+        "alloy_strength": alloy_strength,
+        "burn_rate": burn_rate,
+        "thrust_total": total_thrust(fuel_tank, alloy_strength),
+        "burn_seconds_nominal": math.ceil(fuel_tank / burn_rate),
+        "burn_seconds_min": math.ceil(fuel_tank / (burn_rate * high)),
+        "burn_seconds_max": math.ceil(fuel_tank / (burn_rate * low)),
+        "peak_thrust": thrust_of(min(fuel_tank, burn_rate * high), alloy_strength),
+    }
+
+
+def ignition_monte_carlo(fuel_tank: float, alloy_strength: float, burn_rate: float, n_samples: int,
+                         rng: "np.random.Generator") -> Dict[str, "np.ndarray"]:
+    """
+    ignition_steps'in n_samples bağımsız tekrarını tek seferde (vektörel) örnekler.
+
+    Saniyelik yanmalar (n_samples, en fazla saniye) matrisinde çekilir; son
+    saniyede yalnızca kalan yakıt yakılır, bittikten sonraki saniyeler sıfırdır.
+
+    Returns:
+        dict: burn_seconds (int64) ve peak_thrust (kN) dizileri, her biri n_samples uzunluğunda.
+    """
+    import numpy as np   # Kapalı biçimler NumPy'sız kalır; /propulsion rotaları API soğuk başlangıcında yüklenir
+
+    if fuel_tank < 0:
+        raise ValueError("fuel_tank negatif olamaz.")
+    if burn_rate <= 0:
+        raise ValueError("burn_rate pozitif olmalıdır.")
+    low, high = BURN_JITTER
+    max_steps = math.ceil(fuel_tank / (burn_rate * low))
+    if max_steps == 0:
+        return {"burn_seconds": np.zeros(n_samples, dtype=np.int64), "peak_thrust": np.zeros(n_samples)}
+    burns = burn_rate * rng.uniform(low, high, (n_samples, max_steps))
+    remaining_before = fuel_tank - (np.cumsum(burns, axis=1) - burns)
+    actual = np.clip(np.minimum(burns, remaining_before), 0.0, None)
+    return {
+        "burn_seconds": np.count_nonzero(actual, axis=1).astype(np.int64),
+        "peak_thrust": thrust_of(actual.max(axis=1), alloy_strength),
+    }
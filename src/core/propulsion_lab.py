@@ -1,7 +1,7 @@
 import time
 import sys
-import random
-import math
+
+from src.core.propulsion import alloy_composition, ignition_steps
 
 class DerzzPropulsionLab:
     """
@@ -44,27 +44,18 @@ class DerzzPropulsionLab:
         print("\033[1;33m[METALURJİ] Gümüş-Gadolinyum (Ag-Gd) Alaşımı Hesaplanıyor...\033[0m")
         time.sleep(1)
         
-        # Oran Hesaplamaları
-        ratio_gd = 1 / (self.n_observer + 1)
-        ratio_ag = self.n_observer / (self.n_observer + 1)
-        
-        # Yüzdelik Dönüşüm
-        pct_ag = ratio_ag * 100
-        pct_gd = ratio_gd * 100
-        
-        # Alaşım Mukavemeti (Simüle)
-        # Formül: (Ag_mass * ratio_ag) + (Gd_mass * ratio_gd * n_observer)
-        alloy_integrity = (self.ag_atomic_mass * ratio_ag) + (self.gd_atomic_mass * ratio_gd * self.n_observer)
+        # Oranlar ve mukavemet saf hesap çekirdeğinden gelir (src.core.propulsion)
+        alloy = alloy_composition(self.n_observer, self.ag_atomic_mass, self.gd_atomic_mass)
         
         # Raporlama
         print(f" > NİZAM ORANI (n={self.n_observer}): 1'e {self.n_observer}")
-        print(f" > GÜMÜŞ (Ag) ORANI:    %{pct_ag:.2f} (İletken Zırh)")
-        print(f" > GADOLİNYUM (Gd) ORANI: %{pct_gd:.2f} (Nötron Avcısı)")
-        print(f" > ALAŞIM KODU:       Ag{int(pct_ag)}-Gd{int(pct_gd)}-DerzzType")
-        print(f" > MUKAVEMET SKORU:   {alloy_integrity:.2f} GPa (Teorik)")
+        print(f" > GÜMÜŞ (Ag) ORANI:    %{alloy.pct_ag:.2f} (İletken Zırh)")
+        print(f" > GADOLİNYUM (Gd) ORANI: %{alloy.pct_gd:.2f} (Nötron Avcısı)")
+        print(f" > ALAŞIM KODU:       {alloy.alloy_code}")
+        print(f" > MUKAVEMET SKORU:   {alloy.alloy_integrity:.2f} GPa (Teorik)")
         print("-" * 60)
         
-        return alloy_integrity
+        return alloy.alloy_integrity
 
     def ignition_test(self, alloy_strength: float):
         """
@@ -77,21 +68,13 @@ class DerzzPropulsionLab:
         print(f"\033[1;34m[SİSTEM] Ag-Gd Alaşımlı Nozullar Hazır.\033[0m")
         time.sleep(2)
         
-        burn_rate = 250.0  # Litre/Saniye Yanma Hızı (Baz)
         thrust_total = 0.0
-        t = 0
         
         try:
-            while self.fuel_tank > 0:
-                t += 1
-                
-                # Yakıt Tüketimi (Dalgalı Yanma Simülasyonu)
-                burn = min(self.fuel_tank, burn_rate * random.uniform(0.9, 1.1))
-                self.fuel_tank -= burn
-                
-                # İtki Hesabı (F = m * ve) - Basitleştirilmiş
-                # Alaşımın gücü itki verimini (Specific Impulse) artırır
-                thrust = (burn * 4.5) * (alloy_strength / 100.0) 
+            # Dalgalı yanma ve itki entegrasyonu saf çekirdekte; burada yalnızca gösterim var
+            for step in ignition_steps(self.fuel_tank, alloy_strength):
+                self.fuel_tank = step.fuel_remaining
+                thrust = step.thrust
                 thrust_total += thrust
                 
                 # Görselleştirme (Ateş Efekti)
@@ -103,7 +86,7 @@ class DerzzPropulsionLab:
                 
                 # Terminal Çıktısı (Satır içi güncelleme)
                 sys.stdout.write(
-                    f"\r{exhaust_color}[YANMA T+{t:02d}s] "
+                    f"\r{exhaust_color}[YANMA T+{step.t:02d}s] "
                     f"YAKIT: {self.fuel_tank:7.2f} L | "
                     f"GÜÇ: {thrust:6.0f} kN {flame}\033[0m"
                 )
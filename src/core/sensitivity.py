@@ -0,0 +1,198 @@
+"""
+FAZZ-4 GLOBAL DUYARLILIK ÇEKİRDEĞİ (Sobol / Saltelli)
+
+Bir simülasyon çıktısının varyansını parametrelere paylaştırır:
+
+    S1_i = V[E(Y | X_i)] / V(Y)          birinci derece (yalnız X_i'nin etkisi)
+    ST_i = E[V(Y | X_~i)] / V(Y)         toplam derece (etkileşimler dahil)
+
+ST_i ≈ 0 olan parametre, çıktıyı değiştirmeden sabitlenebilir.
+
+Tasarım (Saltelli 2010):
+    - 2d boyutlu Sobol dizisinden A = ilk d sütun, B = son d sütun.
+    - AB_i = A'nın i. sütunu B'ninkiyle değiştirilmiş hali.
+    - Toplam N·(d + 2) değerlendirme; N ikinin kuvveti olduğunda her blok
+      dengeli bir (t, m, s)-ağıdır ve N'yi ikiye katlamak önceki satırları
+      aynen korur (önekler önbellekten yeniden kullanılabilir).
+
+Kestiriciler:
+    S1_i = mean(f_B · (f_ABi - f_A)) / V      (Saltelli 2010)
+    ST_i = mean((f_A - f_ABi)²) / (2V)         (Jansen 1999)
+Güven aralıkları satırların bootstrap yeniden örneklemesiyle hesaplanır.
+
+Sobol dizisi yön sayıları Joe & Kuo (new-joe-kuo-6.21201) tablosunun ilk
+16 boyutudur; rastgeleleştirme ağ özelliğini koruyan dijital kaydırmadır (XOR).
+Domain katmanıdır; I/O yoktur.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+BITS = 32
+
+# (s, a, m_1..m_s): boyut 2..16 için ilkel polinom derecesi, iç katsayıları ve başlangıç yön sayıları
+JOE_KUO: Tuple[Tuple[int, int, Tuple[int, ...]], ...] = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+)
+MAX_DIMENSION = len(JOE_KUO) + 1
+
+
+def direction_numbers(dimension: int) -> np.ndarray:
+    """(dimension, BITS) yön sayıları V[j, k] = m_k · 2^(BITS - k - 1)."""
+    if not 1 <= dimension <= MAX_DIMENSION:
+        raise ValueError(f"Sobol boyutu 1..{MAX_DIMENSION} aralığında olmalıdır: {dimension}")
+    v = np.zeros((dimension, BITS), dtype=np.uint64)
+    v[0] = [1 << (BITS - k - 1) for k in range(BITS)]   # 1. boyut: van der Corput
+    for j, (s, a, initial) in enumerate(JOE_KUO[:dimension - 1], start=1):
+        m = list(initial)
+        for k in range(s, BITS):
+            value = m[k - s] ^ (m[k - s] << s)
+            for i in range(1, s):
+                if (a >> (s - 1 - i)) & 1:
+                    value ^= m[k - i] << i
+            m.append(value)
+        v[j] = [m[k] << (BITS - k - 1) for k in range(BITS)]
+    return v
+
+
+def sobol_sequence(n: int, dimension: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Sobol dizisinin ilk n noktası, (n, dimension), [0, 1) aralığında.
+
+    rng verilirse her boyuta rastgele bir dijital kaydırma (XOR) uygulanır;
+    böylece 0 noktası kaybolur ve bağımsız tekrarlar alınabilir.
+    """
+    v = direction_numbers(dimension)
+    index = np.arange(n, dtype=np.uint64)
+    x = np.zeros((n, dimension), dtype=np.uint64)
+    for bit in range(max(int(n - 1).bit_length(), 1)):
+        # i. nokta = i'nin 1 olan bitlerine karşılık gelen yön sayılarının XOR'u
+        x[((index >> np.uint64(bit)) & np.uint64(1)).astype(bool)] ^= v[:, bit]
+    if rng is not None:
+        x ^= rng.integers(0, 1 << BITS, size=dimension, dtype=np.uint64)
+    return x.astype(np.float64) / float(1 << BITS)
+
+
+@dataclass(frozen=True)
+class SaltelliDesign:
+    """
+    Attributes:
+        a (np.ndarray): (N, d) birim küp örnekleri.
+        b (np.ndarray): (N, d) bağımsız ikinci örnek.
+    """
+    a: np.ndarray
+    b: np.ndarray
+
+    @property
+    def dimension(self) -> int:
+        return self.a.shape[1]
+
+    def blocks(self) -> Dict[str, np.ndarray]:
+        """Değerlendirilecek bloklar: "A", "B", "AB0".."AB{d-1}" -> (N, d)."""
+        out = {"A": self.a, "B": self.b}
+        for i in range(self.dimension):
+            ab = self.a.copy()
+            ab[:, i] = self.b[:, i]
+            out[f"AB{i}"] = ab
+        return out
+
+
+def saltelli_design(n: int, dimension: int, rng: Optional[np.random.Generator] = None) -> SaltelliDesign:
+    """2·dimension boyutlu Sobol dizisinden A/B matrisleri (d <= MAX_DIMENSION // 2)."""
+    base = sobol_sequence(n, 2 * dimension, rng)
+    return SaltelliDesign(a=base[:, :dimension], b=base[:, dimension:])
+
+
+def scale(unit: np.ndarray, bounds: Sequence[Tuple[float, float]]) -> np.ndarray:
+    """Birim küp noktalarını [lo, hi] aralıklarına taşır."""
+    bounds = np.asarray(bounds, dtype=np.float64)
+    return bounds[:, 0] + unit * (bounds[:, 1] - bounds[:, 0])
+
+
+# --- Kestiriciler ---
+
+def _indices(f_a: np.ndarray, f_b: np.ndarray, f_ab: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    both = np.concatenate([f_a, f_b])
+    variance = np.var(both)
+    if variance <= 0:
+        zeros = np.zeros(f_ab.shape[1])
+        return zeros, zeros
+    # Ortalamayı çıkarmak S1 kestiricisinin varyansını büyük ölçüde düşürür (beklenen değeri değişmez)
+    mean = both.mean()
+    f_a, f_b, f_ab = f_a - mean, f_b - mean, f_ab - mean
+    first = np.mean(f_b[:, None] * (f_ab - f_a[:, None]), axis=0) / variance
+    total = 0.5 * np.mean((f_a[:, None] - f_ab) ** 2, axis=0) / variance
+    return first, total
+
+
+@dataclass
+class SobolIndices:
+    """
+    Tek bir çıktının Sobol indisleri.
+
+    Attributes:
+        names (Tuple[str, ...]): Parametre adları.
+        first_order (np.ndarray): (d,) S1.
+        total_order (np.ndarray): (d,) ST.
+        first_order_conf (np.ndarray): (d,) S1 için %95 bootstrap yarı genişliği.
+        total_order_conf (np.ndarray): (d,) ST için %95 bootstrap yarı genişliği.
+        variance (float): Çıktının toplam varyansı.
+    """
+    names: Tuple[str, ...]
+    first_order: np.ndarray
+    total_order: np.ndarray
+    first_order_conf: np.ndarray
+    total_order_conf: np.ndarray
+    variance: float
+
+    def negligible(self, threshold: float = 0.01) -> List[str]:
+        """Toplam etkisi eşik altında kalan (sabitlenebilir) parametreler."""
+        return [name for name, st, conf in zip(self.names, self.total_order, self.total_order_conf)
+                if st + conf < threshold]
+
+    def to_dict(self) -> dict:
+        return {"variance": self.variance, "parameters": {
+            name: {"S1": float(s1), "S1_conf": float(c1), "ST": float(st), "ST_conf": float(ct)}
+            for name, s1, c1, st, ct in zip(self.names, self.first_order, self.first_order_conf,
+                                            self.total_order, self.total_order_conf)}}
+
+
+def sobol_indices(names: Sequence[str], f_a, f_b, f_ab, n_bootstrap: int = 200,
+                  rng: Optional[np.random.Generator] = None) -> SobolIndices:
+    """
+    Args:
+        names: Parametre adları (d).
+        f_a, f_b: (N,) A ve B bloklarındaki çıktılar.
+        f_ab: (N, d) AB_i bloklarındaki çıktılar (i. sütun AB_i).
+        n_bootstrap (int): Güven aralığı için yeniden örnekleme sayısı (0: aralık yok).
+        rng: Bootstrap üreteci.
+    """
+    f_a, f_b = np.asarray(f_a, dtype=np.float64), np.asarray(f_b, dtype=np.float64)
+    f_ab = np.asarray(f_ab, dtype=np.float64).reshape(len(f_a), len(names))
+    first, total = _indices(f_a, f_b, f_ab)
+    first_conf = total_conf = np.zeros(len(names))
+    if n_bootstrap > 0:
+        rng = rng or np.random.default_rng(0)
+        samples = np.empty((n_bootstrap, 2, len(names)))
+        for b in range(n_bootstrap):
+            rows = rng.integers(0, len(f_a), size=len(f_a))
+            samples[b] = _indices(f_a[rows], f_b[rows], f_ab[rows])
+        low, high = np.percentile(samples, [2.5, 97.5], axis=0)
+        first_conf, total_conf = (high - low) / 2
+    return SobolIndices(tuple(names), first, total, first_conf, total_conf,
+                        float(np.var(np.concatenate([f_a, f_b]))))
@@ -0,0 +1,97 @@
+"""
+FAZZ-4 SİMÜLE SAAT (asyncio)
+
+Demo betiklerindeki time.sleep çağrılarının eşzamansız karşılığı. Her canlı
+oturumun kendi saati vardır; saat duraklatılabilir, sürdürülebilir ve hızı
+değiştirilebilir. Bekleme olay döngüsünü bloklamaz, böylece tek bir döngü
+binlerce bağımsız oturumu sürer.
+
+    await clock.sleep(0.3)   # simüle 0.3 s; duvar saatinde 0.3 / speed s
+
+- speed = math.inf: beklemesiz (başsız koşu); yine de her uykuda döngüye
+  kontrol bırakılır ki diğer oturumlar aç kalmasın.
+- Bekleme görev (Task) yaratmaz: tek bir Future ve loop.call_later tutamacı.
+  pause / resume / set_speed bekleyen Future'ı erken uyandırır; kalan simüle
+  süre yeni hızla yeniden planlanır.
+"""
+import asyncio
+import math
+from typing import Optional
+
+
+class SimulatedClock:
+    """
+    Duraklatılabilir, hızı ayarlanabilir simüle saat.
+
+    Args:
+        speed (float): Simüle saniye / duvar saniyesi (> 0; math.inf = beklemesiz).
+        paused (bool): Duraklatılmış başla.
+
+    Attributes:
+        now (float): Geçen simüle süre (s).
+    """
+
+    def __init__(self, speed: float = 1.0, paused: bool = False):
+        self._check(speed)
+        self.speed = speed
+        self.paused = paused
+        self.now = 0.0
+        self._waiter: Optional[asyncio.Future] = None
+
+    @staticmethod
+    def _check(speed: float) -> None:
+        if not speed > 0:
+            raise ValueError(f"Hız pozitif olmalıdır: {speed}")
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    # --- Kontrol ---
+
+    def pause(self) -> None:
+        self.paused = True
+        self._wake()
+
+    def resume(self) -> None:
+        self.paused = False
+        self._wake()
+
+    def set_speed(self, speed: float) -> None:
+        self._check(speed)
+        self.speed = speed
+        self._wake()
+
+    # --- Bekleme ---
+
+    async def _wait(self, delay: Optional[float]) -> None:
+        loop = asyncio.get_running_loop()
+        self._waiter = future = loop.create_future()
+        handle = loop.call_later(delay, self._wake) if delay is not None else None
+        try:
+            await future
+        finally:
+            if handle is not None:
+                handle.cancel()
+            self._waiter = None
+
+    async def sleep(self, seconds: float) -> None:
+        """seconds simüle saniye bekler; duraklatılmışsa önce sürdürülmeyi bekler."""
+        remaining = max(float(seconds), 0.0)
+        loop = asyncio.get_running_loop()
+        while True:
+            if self.paused:
+                await self._wait(None)
+                continue
+            if math.isinf(self.speed) or remaining <= 0:
+                self.now += remaining
+                await asyncio.sleep(0)
+                return
+            started, speed = loop.time(), self.speed
+            await self._wait(remaining / speed)
+            elapsed = min((loop.time() - started) * speed, remaining)
+            self.now += elapsed
+            remaining -= elapsed
+            if remaining <= 1e-9 * max(seconds, 1.0):
+                self.now += remaining
+                return
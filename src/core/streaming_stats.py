@@ -0,0 +1,325 @@
+"""
+FAZZ-4 AKIŞKAN İSTATİSTİK ÇEKİRDEĞİ (Streaming Statistics)
+
+Milyonlarca koşudan oluşan topluluk (ensemble) çıktılarını örnekleri saklamadan
+özetleyen, parça parça (chunk) beslenebilen ve birleştirilebilen (mergeable)
+akümülatörler.
+
+- RunningMoments : Welford / Chan ortalama ve varyans
+- RunningExtrema : min / max
+- FixedHistogram : sabit kenarlı histogram (taşma sayaçlarıyla)
+- TDigest        : t-digest tarzı kantil taslağı (p50/p99 vb.)
+- EnsembleAccumulator : isimli çıktılar için yukarıdakilerin paketi
+
+Her sınıfın `update(chunk)` ve `merge(other)` metotları vardır. Worker parçaları
+(shard) kısmi sonuçlarını `merge` ile sabit (O(1)) bellekte birleştirir.
+"""
+import math
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+
+def _as_chunk(values) -> np.ndarray:
+    """Girdiyi tek boyutlu float64 diziye çevirir ve NaN değerleri atar."""
+    arr = np.asarray(values, dtype=np.float64).ravel()
+    return arr[~np.isnan(arr)]
+
+
+class RunningMoments:
+    """
+    Welford algoritmasının parça (chunk) tabanlı sürümü.
+
+    Her parça önce kendi içinde vektörel olarak özetlenir, sonra Chan et al.
+    paralel birleştirme formülü ile mevcut duruma eklenir.
+
+    Attributes:
+        count (int): Görülen örnek sayısı.
+        mean (float): Akan ortalama.
+        m2 (float): Ortalamadan sapmaların kareleri toplamı.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def update(self, values) -> "RunningMoments":
+        chunk = _as_chunk(values)
+        if chunk.size:
+            chunk_mean = float(chunk.mean())
+            chunk_m2 = float(np.square(chunk - chunk_mean).sum())
+            self._combine(int(chunk.size), chunk_mean, chunk_m2)
+        return self
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        self._combine(other.count, other.mean, other.m2)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Örneklem varyansı (n-1). İki örnekten azsa NaN döner."""
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance) if self.count > 1 else math.nan
+
+
+class RunningExtrema:
+    """
+    Akan minimum ve maksimum takibi.
+
+    Attributes:
+        minimum (float): Görülen en küçük değer (boşsa +inf).
+        maximum (float): Görülen en büyük değer (boşsa -inf).
+    """
+
+    def __init__(self):
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def update(self, values) -> "RunningExtrema":
+        chunk = _as_chunk(values)
+        if chunk.size:
+            self.minimum = min(self.minimum, float(chunk.min()))
+            self.maximum = max(self.maximum, float(chunk.max()))
+        return self
+
+    def merge(self, other: "RunningExtrema") -> "RunningExtrema":
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+
+class FixedHistogram:
+    """
+    Sabit kenarlı histogram. Aralık dışı değerler taşma sayaçlarına yazılır.
+
+    Birleştirme yalnızca aynı kenarlara sahip histogramlar arasında yapılabilir;
+    bu sayede parçaların sonucu tek geçişli sonuçla birebir aynıdır.
+
+    Attributes:
+        edges (np.ndarray): Kutu (bin) kenarları, uzunluk bins + 1.
+        counts (np.ndarray): Kutu başına örnek sayısı (int64).
+        underflow (int): edges[0] altındaki örnek sayısı.
+        overflow (int): edges[-1] üstündeki örnek sayısı.
+    """
+
+    def __init__(self, low: float, high: float, bins: int = 64):
+        if not high > low:
+            raise ValueError("Histogram üst sınırı alt sınırdan büyük olmalıdır.")
+        if bins < 1:
+            raise ValueError("Histogram en az bir kutu içermelidir.")
+        self.edges = np.linspace(low, high, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    def update(self, values) -> "FixedHistogram":
+        chunk = _as_chunk(values)
+        if chunk.size:
+            self.underflow += int(np.count_nonzero(chunk < self.edges[0]))
+            self.overflow += int(np.count_nonzero(chunk > self.edges[-1]))
+            self.counts += np.histogram(chunk, bins=self.edges)[0]
+        return self
+
+    def merge(self, other: "FixedHistogram") -> "FixedHistogram":
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Farklı kenarlara sahip histogramlar birleştirilemez.")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+
+class TDigest:
+    """
+    t-digest tarzı birleştirilebilir kantil taslağı (merging digest).
+
+    Gelen parçalar bir tampona eklenir; tampon dolunca tüm merkezler (centroid)
+    sıralanıp k1 ölçek fonksiyonuna göre vektörel olarak sıkıştırılır:
+        k(q) = δ · (asin(2q - 1) / π + 1/2)
+    Aynı k tamsayı dilimine düşen merkezler tek merkezde birleşir. Bu sayede
+    kuyruklar (p1, p99) dar, medyan geniş merkezlerle temsil edilir ve bellek
+    kullanımı yalnızca `compression` ile sınırlıdır.
+
+    Attributes:
+        compression (float): δ parametresi; merkez sayısı yaklaşık bununla sınırlıdır.
+        means (np.ndarray): Merkez ortalamaları (sıralı).
+        weights (np.ndarray): Merkez ağırlıkları.
+    """
+
+    def __init__(self, compression: float = 200.0, buffer_size: Optional[int] = None):
+        self.compression = float(compression)
+        self.buffer_size = buffer_size or int(self.compression * 50)
+        self.means = np.empty(0, dtype=np.float64)
+        self.weights = np.empty(0, dtype=np.float64)
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._buffer = []
+        self._buffered = 0
+
+    @property
+    def count(self) -> float:
+        self._flush()
+        return float(self.weights.sum())
+
+    def update(self, values) -> "TDigest":
+        chunk = _as_chunk(values)
+        if chunk.size:
+            self.minimum = min(self.minimum, float(chunk.min()))
+            self.maximum = max(self.maximum, float(chunk.max()))
+            self._buffer.append(chunk)
+            self._buffered += chunk.size
+            if self._buffered >= self.buffer_size:
+                self._flush()
+        return self
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        other._flush()
+        self._flush()
+        if other.weights.size:
+            self.minimum = min(self.minimum, other.minimum)
+            self.maximum = max(self.maximum, other.maximum)
+            self._compress(
+                np.concatenate([self.means, other.means]),
+                np.concatenate([self.weights, other.weights]),
+            )
+        return self
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        points = np.concatenate(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+        self._compress(
+            np.concatenate([self.means, points]),
+            np.concatenate([self.weights, np.ones(points.size)]),
+        )
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        cumulative = np.cumsum(weights)
+        q = (cumulative - weights / 2.0) / total
+        k = self.compression * (np.arcsin(2.0 * q - 1.0) / math.pi + 0.5)
+        cluster = np.floor(k).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, cluster[1:] != cluster[:-1]])
+        merged_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged_weights
+        self.weights = merged_weights
+
+    def quantile(self, q: float) -> float:
+        """
+        İstenen kantili merkezler arası doğrusal interpolasyonla tahmin eder.
+
+        Args:
+            q (float): 0 ile 1 arasında kantil seviyesi.
+
+        Returns:
+            float: Kantil tahmini; taslak boşsa NaN.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("Kantil seviyesi 0 ile 1 arasında olmalıdır.")
+        self._flush()
+        if not self.weights.size:
+            return math.nan
+        if self.weights.size == 1:
+            return float(self.means[0])
+        centers = np.cumsum(self.weights) - self.weights / 2.0
+        xs = np.r_[0.0, centers, self.weights.sum()]
+        ys = np.r_[self.minimum, self.means, self.maximum]
+        return float(np.interp(q * self.weights.sum(), xs, ys))
+
+
+class EnsembleAccumulator:
+    """
+    İsimli topluluk çıktıları için akümülatör paketi.
+
+    Örnek:
+        acc = EnsembleAccumulator(histogram_ranges={"max_temp": (2000, 3500)})
+        for chunk in runner:                    # her parça bir dict[str, ndarray]
+            acc.update(chunk)
+        total = shard_a.merge(shard_b)          # worker sonuçlarını birleştir
+        total.summary()["max_temp"]["p99"]
+
+    Args:
+        histogram_ranges (dict): Çıktı adı -> (alt, üst) aralığı. Aralığı verilen
+            çıktılar için histogram da tutulur.
+        bins (int): Histogram kutu sayısı.
+        compression (float): t-digest sıkıştırma parametresi.
+    """
+
+    def __init__(self, histogram_ranges: Optional[Dict[str, tuple]] = None,
+                 bins: int = 64, compression: float = 200.0):
+        self.histogram_ranges = dict(histogram_ranges or {})
+        self.bins = bins
+        self.compression = compression
+        self.moments: Dict[str, RunningMoments] = {}
+        self.extrema: Dict[str, RunningExtrema] = {}
+        self.digests: Dict[str, TDigest] = {}
+        self.histograms: Dict[str, FixedHistogram] = {}
+
+    def _ensure(self, name: str) -> None:
+        if name in self.moments:
+            return
+        self.moments[name] = RunningMoments()
+        self.extrema[name] = RunningExtrema()
+        self.digests[name] = TDigest(self.compression)
+        if name in self.histogram_ranges:
+            low, high = self.histogram_ranges[name]
+            self.histograms[name] = FixedHistogram(low, high, self.bins)
+
+    def update(self, chunk: Dict[str, Iterable[float]]) -> "EnsembleAccumulator":
+        for name, values in chunk.items():
+            self._ensure(name)
+            values = _as_chunk(values)
+            self.moments[name].update(values)
+            self.extrema[name].update(values)
+            self.digests[name].update(values)
+            if name in self.histograms:
+                self.histograms[name].update(values)
+        return self
+
+    def merge(self, other: "EnsembleAccumulator") -> "EnsembleAccumulator":
+        for name in other.moments:
+            self._ensure(name)
+            self.moments[name].merge(other.moments[name])
+            self.extrema[name].merge(other.extrema[name])
+            self.digests[name].merge(other.digests[name])
+            if name in self.histograms and name in other.histograms:
+                self.histograms[name].merge(other.histograms[name])
+        return self
+
+    def summary(self, quantiles: Iterable[float] = (0.5, 0.9, 0.99)) -> Dict[str, dict]:
+        """
+        Her çıktı için sayım, ortalama, std, min/max ve kantilleri raporlar.
+
+        Returns:
+            dict: Çıktı adı -> {"count", "mean", "std", "min", "max", "p50", ...}
+        """
+        report = {}
+        for name, moments in self.moments.items():
+            row = {
+                "count": moments.count,
+                "mean": moments.mean,
+                "std": moments.std,
+                "min": self.extrema[name].minimum,
+                "max": self.extrema[name].maximum,
+            }
+            for q in quantiles:
+                row[f"p{q * 100:g}"] = self.digests[name].quantile(q)
+            report[name] = row
+        return report
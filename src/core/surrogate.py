@@ -0,0 +1,159 @@
+"""
+FAZZ-4 VEKİL MODEL (SURROGATE) ÇEKİRDEĞİ
+
+Topluluk simülasyonlarının parametre uzayı üzerindeki çıktılarını ucuz bir
+regresörle taklit eder: Legendre tabanlı polinom kaos açılımı (PCE) ve ridge
+regresyonu.
+
+    x ∈ [lo, hi]^d  ->  z = 2(x - lo)/(hi - lo) - 1 ∈ [-1, 1]^d
+    f(x) ≈ Σ_α c_α · Π_j P_{α_j}(z_j),    |α| ≤ degree
+
+Hata kestirimi:
+    - Birini-dışarıda-bırak (LOO) artıkları hat matrisinden kapalı biçimde
+      hesaplanır (e_i / (1 - h_ii)); yeniden eğitim gerekmez.
+    - Sorgu noktası x için std(x) = rmse_loo · sqrt(1 + h(x)),
+      h(x) = φ(x)ᵀ (ΦᵀΦ + λI)⁻¹ φ(x) (kaldıraç). Eğitim noktalarından uzak
+      bölgelerde belirsizlik büyür.
+
+Domain katmanıdır; I/O yalnızca save/load içindedir (NumPy .npz, pickle yok).
+"""
+import json
+import os
+import tempfile
+from itertools import product
+from pathlib import Path
+from typing import Dict, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.polynomial import legendre
+
+
+def total_degree_indices(dimension: int, degree: int) -> np.ndarray:
+    """Toplam derecesi degree'yi aşmayan çoklu indeksler (p, d), dereceye göre sıralı."""
+    indices = [alpha for alpha in product(range(degree + 1), repeat=dimension) if sum(alpha) <= degree]
+    indices.sort(key=lambda alpha: (sum(alpha), alpha[::-1]))
+    return np.array(indices, dtype=np.int64).reshape(-1, dimension)
+
+
+class PolynomialChaosSurrogate:
+    """
+    Çok çıktılı Legendre PCE vekil modeli.
+
+    Args:
+        names (Sequence[str]): Girdi parametre adları (sütun sırası).
+        bounds (Sequence[Tuple[float, float]]): Parametre başına eğitim aralığı.
+        outputs (Sequence[str]): Çıktı adları.
+        degree (int): Toplam polinom derecesi.
+        ridge (float): Ridge düzenlileştirme katsayısı λ.
+
+    Attributes:
+        coefficients (np.ndarray): (p, m) açılım katsayıları.
+        loo_rmse (np.ndarray): (m,) LOO kök ortalama kare hata.
+        n_train (int): Eğitim noktası sayısı.
+    """
+
+    def __init__(self, names: Sequence[str], bounds: Sequence[Tuple[float, float]], outputs: Sequence[str],
+                 degree: int = 4, ridge: float = 1e-8):
+        self.names = tuple(names)
+        self.bounds = np.asarray(bounds, dtype=np.float64).reshape(len(self.names), 2)
+        if np.any(self.bounds[:, 1] <= self.bounds[:, 0]):
+            raise ValueError("Her parametre için lo < hi olmalıdır.")
+        self.outputs = tuple(outputs)
+        self.degree = degree
+        self.ridge = ridge
+        self.indices = total_degree_indices(len(self.names), degree)
+        self.coefficients = None
+        self.gram_inverse = None
+        self.loo_rmse = None
+        self.n_train = 0
+
+    # --- Öznitelikler ---
+
+    def _scale(self, x: np.ndarray) -> np.ndarray:
+        lo, hi = self.bounds[:, 0], self.bounds[:, 1]
+        return 2 * (x - lo) / (hi - lo) - 1
+
+    def features(self, x) -> np.ndarray:
+        """(n, d) girdilerin (n, p) PCE öznitelik matrisi."""
+        z = self._scale(np.atleast_2d(np.asarray(x, dtype=np.float64)))
+        phi = np.ones((z.shape[0], len(self.indices)))
+        for j in range(z.shape[1]):
+            vander = legendre.legvander(z[:, j], self.degree)
+            phi *= vander[:, self.indices[:, j]]
+        return phi
+
+    def in_domain(self, x, tolerance: float = 1e-9) -> np.ndarray:
+        """Her satır eğitim aralığının içinde mi (uçlar dahil)."""
+        x = np.atleast_2d(np.asarray(x, dtype=np.float64))
+        span = (self.bounds[:, 1] - self.bounds[:, 0]) * tolerance
+        return np.all((x >= self.bounds[:, 0] - span) & (x <= self.bounds[:, 1] + span), axis=1)
+
+    # --- Eğitim / tahmin ---
+
+    def fit(self, x, y) -> "PolynomialChaosSurrogate":
+        """
+        Args:
+            x: (n, d) parametre noktaları.
+            y: (n, m) çıktılar (m == len(outputs)).
+
+        Raises:
+            ValueError: Nokta sayısı açılım terim sayısından azsa.
+        """
+        phi = self.features(x)
+        y = np.asarray(y, dtype=np.float64).reshape(phi.shape[0], len(self.outputs))
+        if phi.shape[0] <= phi.shape[1]:
+            raise ValueError(f"{phi.shape[1]} terimli açılım için en az {phi.shape[1] + 1} nokta gerekir.")
+        gram = phi.T @ phi + self.ridge * np.eye(phi.shape[1])
+        self.gram_inverse = np.linalg.inv(gram)
+        self.coefficients = self.gram_inverse @ (phi.T @ y)
+        leverage = np.einsum("ij,jk,ik->i", phi, self.gram_inverse, phi)
+        loo = (y - phi @ self.coefficients) / (1 - np.minimum(leverage, 1 - 1e-12))[:, None]
+        self.loo_rmse = np.sqrt(np.mean(loo ** 2, axis=0))
+        self.n_train = phi.shape[0]
+        return self
+
+    def predict(self, x) -> Tuple[np.ndarray, np.ndarray]:
+        """(n, m) tahminler ve (n, m) standart sapma kestirimleri."""
+        if self.coefficients is None:
+            raise RuntimeError("Model eğitilmedi.")
+        phi = self.features(x)
+        leverage = np.einsum("ij,jk,ik->i", phi, self.gram_inverse, phi)
+        return phi @ self.coefficients, np.sqrt(1 + leverage)[:, None] * self.loo_rmse
+
+    # --- Serileştirme ---
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Atomik yazım: aynı dizinde geçici dosya + os.replace; okuyucular yarım dosya görmez."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {"names": self.names, "outputs": self.outputs, "degree": self.degree,
+                "ridge": self.ridge, "n_train": self.n_train}
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                np.savez(handle, meta=np.array(json.dumps(meta)), bounds=self.bounds,
+                         coefficients=self.coefficients, gram_inverse=self.gram_inverse, loo_rmse=self.loo_rmse)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "PolynomialChaosSurrogate":
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            model = cls(meta["names"], data["bounds"], meta["outputs"], meta["degree"], meta["ridge"])
+            model.coefficients = data["coefficients"]
+            model.gram_inverse = data["gram_inverse"]
+            model.loo_rmse = data["loo_rmse"]
+        model.n_train = meta["n_train"]
+        return model
+
+    def describe(self) -> Dict:
+        return {"parameters": {name: list(map(float, bound)) for name, bound in zip(self.names, self.bounds)},
+                "outputs": list(self.outputs), "degree": self.degree, "terms": len(self.indices),
+                "n_train": self.n_train,
+                "loo_rmse": dict(zip(self.outputs, map(float, self.loo_rmse))) if self.loo_rmse is not None else None}
@@ -0,0 +1,230 @@
+"""
+FAZZ-4 SÜTUNSAL DIŞA AKTARIM (Arrow IPC / Parquet)
+
+Topluluk (ensemble) sonuçları — itki toplamları, iniş yakıtı, giriş
+sıcaklıkları, hasat enerjisi — analitik yığına sütunsal biçimde yazılır.
+Yazım kayıt grupları (record batch) hâlinde akar: her parça NumPy dizilerinden
+Arrow dizilerine sıfır kopyayla devredilir ve satır başına Python nesnesi hiç
+oluşturulmaz. 100M satırlık bir topluluk, bellekte yalnızca bir parça tutarak
+dışa aktarılabilir.
+
+Biçimler:
+    "parquet" : pyarrow ParquetWriter (pandas.read_parquet ile okunur)
+    "arrow"   : Arrow IPC dosya biçimi (Feather v2; pandas.read_feather ile okunur)
+
+Sıfır kopya notları:
+    - Bitişik (contiguous) sayısal diziler ve bunların dilimleri kopyalanmaz.
+    - Adımlı (strided) sütunlar (ör. y[:, i]) parça başına bir kez bitişik
+      hâle getirilir; bool sütunlar Arrow'un bit düzenine paketlenir.
+
+CLI:
+    python -m src.infrastructure.export --phase earth_reentry --runs 100000000 \\
+        --chunk-size 1000000 --out reentry.parquet
+"""
+import argparse
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping, Optional, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+FORMATS = ("parquet", "arrow")
+DEFAULT_BATCH_ROWS = 1 << 20
+
+Columns = Mapping[str, np.ndarray]
+
+
+def _format_for(path: Path, format: Optional[str]) -> str:
+    if format is None:
+        format = "parquet" if path.suffix == ".parquet" else "arrow"
+    if format not in FORMATS:
+        raise ValueError(f"Bilinmeyen biçim: {format} (geçerli: {', '.join(FORMATS)})")
+    return format
+
+
+def to_record_batch(columns: Columns, schema: Optional[pa.Schema] = None) -> pa.RecordBatch:
+    """
+    NumPy sütunlarını tek bir RecordBatch'e sarar (sayısal sütunlarda sıfır kopya).
+
+    Raises:
+        ValueError: Sütun uzunlukları farklıysa.
+    """
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Sütun uzunlukları eşit değil: {sorted(lengths)}")
+    arrays = [pa.array(np.ascontiguousarray(values)) for values in columns.values()]
+    if schema is not None:
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+    return pa.RecordBatch.from_arrays(arrays, names=list(columns))
+
+
+class ColumnarWriter:
+    """
+    Parça parça gelen NumPy sütunlarını Arrow IPC veya Parquet dosyasına akıtır.
+
+    Şema ilk parçadan çıkarılır; sonraki parçalar aynı sütunları aynı türlerle
+    vermelidir. Büyük parçalar batch_rows satırlık görünümlere (view) bölünür.
+
+    Attributes:
+        path (Path): Hedef dosya.
+        format (str): "parquet" veya "arrow".
+        rows (int): Yazılan satır sayısı.
+        batches (int): Yazılan kayıt grubu sayısı.
+    """
+
+    def __init__(self, path: Union[str, Path], format: Optional[str] = None,
+                 batch_rows: int = DEFAULT_BATCH_ROWS, compression: Optional[str] = "zstd"):
+        if batch_rows <= 0:
+            raise ValueError("batch_rows pozitif olmalıdır.")
+        self.path = Path(path)
+        self.format = _format_for(self.path, format)
+        self.batch_rows = batch_rows
+        self.compression = compression
+        self.rows = 0
+        self.batches = 0
+        self._schema: Optional[pa.Schema] = None
+        self._writer = None
+        self._sink = None
+
+    def _open(self, schema: pa.Schema) -> None:
+        self._schema = schema
+        if self.format == "parquet":
+            self._writer = pq.ParquetWriter(self.path, schema, compression=self.compression or "none")
+        else:
+            self._sink = pa.OSFile(str(self.path), "wb")
+            options = ipc.IpcWriteOptions(compression=self.compression) if self.compression else None
+            self._writer = ipc.new_file(self._sink, schema, options=options)
+
+    def write(self, columns: Columns) -> int:
+        """Bir parçayı yazar ve yazılan satır sayısını döndürür."""
+        if not columns:
+            return 0
+        n = len(next(iter(columns.values())))
+        for start in range(0, n, self.batch_rows):
+            window = {name: values[start:start + self.batch_rows] for name, values in columns.items()}
+            batch = to_record_batch(window, self._schema)
+            if self._writer is None:
+                self._open(batch.schema)
+            if self.format == "parquet":
+                self._writer.write_batch(batch, row_group_size=self.batch_rows)
+            else:
+                self._writer.write_batch(batch)
+            self.batches += 1
+        self.rows += n
+        return n
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def export_chunks(path: Union[str, Path], chunks: Iterable[Columns], format: Optional[str] = None,
+                  batch_rows: int = DEFAULT_BATCH_ROWS, compression: Optional[str] = "zstd") -> dict:
+    """
+    Bir parça üretecini tek dosyaya akıtır.
+
+    Returns:
+        dict: path, format, rows, batches, bytes, seconds
+    """
+    started = time.perf_counter()
+    with ColumnarWriter(path, format, batch_rows, compression) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    return {"path": str(writer.path), "format": writer.format, "rows": writer.rows,
+            "batches": writer.batches, "bytes": writer.path.stat().st_size,
+            "seconds": time.perf_counter() - started}
+
+
+def read_frame(path: Union[str, Path], columns: Optional[list] = None):
+    """Dışa aktarılmış dosyayı pandas DataFrame olarak okur (analitik tarafı için)."""
+    path = Path(path)
+    if _format_for(path, None) == "parquet":
+        table = pq.read_table(path, columns=columns)
+    else:
+        with pa.memory_map(str(path)) as source:
+            table = ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+    return table.to_pandas()
+
+
+# --- Topluluk kaynakları ---
+
+def phase_chunks(name: str, n_runs: int, chunk_size: int = DEFAULT_BATCH_ROWS, seed: int = 0,
+                 method: str = "rk4", cache=None) -> Iterator[dict]:
+    """
+    Kinematik fazın topluluğunu parça parça entegre eder (src.simulation.dynamics).
+
+    Parça k, (seed, k) alt tohumunu kullanır. Bu yüzden sonuç (seed, chunk_size)
+    ile tekrarlanabilirdir ama parça boyutuna bağlıdır: farklı chunk_size aynı
+    koşulara farklı çekilişler verir. cache (ResultCache) verilirse parçalar
+    içerik adresli disk önbelleğinden okunur / oraya yazılır.
+
+    Yields:
+        dict: run, duration, steps ve fazın son durum sütunları.
+    """
+    from src.simulation.dynamics import PHASE_VERSION, PHASES, simulate_phase
+
+    state_names = PHASES[name].state_names
+
+    def integrate(start, size, index):
+        result = simulate_phase(name, n_runs=size, seed=(seed, index), method=method)
+        final = np.ascontiguousarray(result.y.T)   # (n_state, n) — sütunlar bitişik
+        chunk = {"run": np.arange(start, start + size, dtype=np.int64),
+                 "duration": result.t, "steps": result.steps}
+        chunk.update(zip(state_names, final))
+        return chunk
+
+    for index, start in enumerate(range(0, n_runs, chunk_size)):
+        size = min(chunk_size, n_runs - start)
+        if cache is None:
+            yield integrate(start, size, index)
+        else:
+            params = {"method": method, "chunk_size": chunk_size, "chunk": index, "start": start, "size": size}
+            yield cache.get_or_compute(f"phase:{name}", params, lambda: integrate(start, size, index), seed=seed,
+                                       version=PHASE_VERSION)
+
+
+def main(argv=None) -> None:
+    from src.infrastructure.result_cache import default_cache
+    from src.simulation.dynamics import PHASES
+
+    parser = argparse.ArgumentParser(description="FAZZ-4 topluluk sonuçlarını sütunsal dosyaya aktarır.")
+    parser.add_argument("--phase", choices=sorted(PHASES), default="earth_reentry")
+    parser.add_argument("--runs", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_BATCH_ROWS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--method", choices=("rk4", "dopri"), default="rk4")
+    parser.add_argument("--format", choices=FORMATS, default=None)
+    parser.add_argument("--compression", default="zstd", help="zstd, lz4 veya none")
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--cache", action="store_true",
+                        help="Parçaları disk sonuç önbelleğinden oku / oraya yaz (varsayılan: kapalı)")
+    args = parser.parse_args(argv)
+
+    compression = None if args.compression == "none" else args.compression
+    cache = default_cache() if args.cache else None
+    chunks = phase_chunks(args.phase, args.runs, args.chunk_size, args.seed, args.method, cache)
+    report = export_chunks(args.out, chunks, args.format, args.chunk_size, compression)
+    if cache is not None:
+        stats = cache.stats()
+        print(f"önbellek: {stats['hits']} isabet · {stats['misses']} ıska · {stats['bytes'] / 1e6:.1f} MB")
+    print(f"{report['rows']:,} satır · {report['batches']} grup · {report['bytes'] / 1e6:.1f} MB · "
+          f"{report['seconds']:.2f} s ({report['rows'] / max(report['seconds'], 1e-9):,.0f} satır/s) -> {report['path']}")
+
+
+if __name__ == "__main__":
+    main()
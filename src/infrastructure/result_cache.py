@@ -0,0 +1,199 @@
+"""
+FAZZ-4 İÇERİK ADRESLİ SONUÇ ÖNBELLEĞİ (disk)
+
+Aynı parametre setleri (n_observer=12 alaşımı, aynı reaktör ufku, aynı
+Bengaluru sahası...) tekrar tekrar simüle edilmesin diye sonuçlar diskte,
+(simulation, version, params, seed) dörtlüsünün kararlı özetiyle adreslenir.
+
+Düzen:
+    <root>/<ilk 2 hex>/<anahtar>.npz   NumPy dizileri sözlüğü (pickle yok)
+    <root>/<ilk 2 hex>/<anahtar>.json  JSON'a çevrilebilir diğer sonuçlar
+
+- Yazımlar atomiktir: aynı dizinde geçici dosya + os.replace. Yarım yazılmış
+  bir dosya hiçbir okuyucuya görünmez; eşzamanlı yazarların sonuncusu kazanır.
+- Boyut sınırlıdır: toplam boyut max_bytes'ı aşınca en eski kullanılan
+  (mtime; isabetlerde güncellenir) dosyalar low_watermark oranına inene kadar
+  silinir.
+- hits / misses / writes / evictions sayaçları süreç içindedir.
+
+Kullananlar: dışa aktarım parçaları, /propulsion, /military/convergence
+(toplu ve ufuk), yörünge kayıtları ve `fazz run --cache` toplu koşuları.
+
+Ortam değişkenleri: FAZZ4_CACHE_DIR (varsayılan .fazz4_cache),
+FAZZ4_CACHE_MAX_BYTES (varsayılan 1 GiB), FAZZ4_CACHE=off (devre dışı).
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional, Union
+
+DEFAULT_MAX_BYTES = 1 << 30
+SUFFIXES = (".npz", ".json")
+
+
+def cache_key(simulation: str, version: Union[int, str], params: Mapping, seed: Any = None) -> str:
+    """(simulation, version, params, seed) için kararlı, sıraya duyarsız özet."""
+    payload = {"simulation": simulation, "version": version, "params": params, "seed": seed}
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+def _is_array_mapping(value) -> bool:
+    import numpy as np
+
+    return isinstance(value, Mapping) and bool(value) and all(
+        isinstance(item, np.ndarray) and item.dtype != object for item in value.values())
+
+
+class ResultCache:
+    """
+    Boyut sınırlı, LRU tahliyeli disk önbelleği.
+
+    Attributes:
+        root (Path): Önbellek dizini.
+        max_bytes (int): Toplam boyut üst sınırı.
+        hits, misses, writes, evictions (int): Süreç içi sayaçlar.
+    """
+
+    def __init__(self, root: Union[str, Path] = ".fazz4_cache", max_bytes: int = DEFAULT_MAX_BYTES,
+                 low_watermark: float = 0.9):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.low_watermark = low_watermark
+        self.hits = self.misses = self.writes = self.evictions = 0
+        self._lock = threading.Lock()
+        self._size = sum(path.stat().st_size for path in self._entries())
+
+    def _entries(self):
+        for suffix in SUFFIXES:
+            yield from self.root.glob(f"*/*{suffix}")
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.root / key[:2] / f"{key}{suffix}"
+
+    # --- Okuma / yazma ---
+
+    def get(self, key: str, default=None):
+        """Anahtarın değerini döndürür; yoksa default. İsabet mtime'ı tazeler (LRU)."""
+        for suffix in SUFFIXES:
+            path = self._path(key, suffix)
+            try:
+                if suffix == ".npz":
+                    import numpy as np   # JSON girdileri ve cache_key NumPy yüklemez (API soğuk başlangıcı)
+
+                    with np.load(path, allow_pickle=False) as data:
+                        value = {name: data[name] for name in data.files}
+                else:
+                    value = json.loads(path.read_text())
+            except FileNotFoundError:
+                continue
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                pass  # Okuma ile tahliye arasında silinmiş olabilir; değer zaten okundu
+            with self._lock:
+                self.hits += 1
+            return value
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def put(self, key: str, value) -> Path:
+        """
+        Değeri atomik olarak yazar.
+
+        Args:
+            key (str): cache_key() çıktısı.
+            value: NumPy dizileri sözlüğü (.npz) veya JSON'a çevrilebilir nesne (.json).
+        """
+        suffix = ".npz" if _is_array_mapping(value) else ".json"
+        path = self._path(key, suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=suffix)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                if suffix == ".npz":
+                    import numpy as np
+
+                    np.savez(handle, **value)
+                else:
+                    handle.write(json.dumps(value, separators=(",", ":")).encode())
+                handle.flush()
+                os.fsync(handle.fileno())
+            previous = path.stat().st_size if path.exists() else 0
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self.writes += 1
+            self._size += path.stat().st_size - previous
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+        return path
+
+    def get_or_compute(self, simulation: str, params: Mapping, compute: Callable[[], Any],
+                       seed: Any = None, version: Union[int, str] = 1):
+        """Önbellekte varsa döndürür; yoksa compute() sonucunu yazıp döndürür."""
+        key = cache_key(simulation, version, params, seed)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    # --- Tahliye ---
+
+    def evict(self) -> int:
+        """En eski kullanılan dosyaları low_watermark · max_bytes altına inene kadar siler."""
+        with self._lock:
+            entries = []
+            for path in self._entries():
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            self._size = sum(size for _, size, _ in entries)
+            target = self.max_bytes * self.low_watermark
+            removed = 0
+            for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                if self._size <= target:
+                    break
+                path.unlink(missing_ok=True)
+                self._size -= size
+                removed += 1
+            self.evictions += removed
+            return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in list(self._entries()):
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"root": str(self.root), "bytes": self._size, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses, "writes": self.writes,
+                    "evictions": self.evictions, "hit_rate": self.hits / lookups if lookups else 0.0}
+
+
+_default: Optional[ResultCache] = None
+
+
+def default_cache() -> Optional[ResultCache]:
+    """Ortam değişkenlerinden yapılandırılan süreç geneli önbellek (FAZZ4_CACHE=off ise None)."""
+    global _default
+    if os.environ.get("FAZZ4_CACHE", "on").lower() in ("0", "off", "false", "no"):
+        return None
+    if _default is None:
+        _default = ResultCache(os.environ.get("FAZZ4_CACHE_DIR", ".fazz4_cache"),
+                               int(os.environ.get("FAZZ4_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)))
+    return _default
@@ -0,0 +1,316 @@
+"""
+FAZZ-4 PAYLAŞIMLI ÖNBELLEK KATMANI (Redis / bellek içi)
+
+Birden çok API örneği çalıştığında yakınsama eğrileri ve durum anlık
+görüntüleri her örnekte yeniden hesaplanmasın diye sonuçlar ortak bir arka
+uçta tutulur. İki katman vardır:
+
+    L1  : süreç içi, kısa TTL'li sözlük (ağ gidiş-dönüşü yok)
+    L2  : arka uç — RedisBackend (örnekler arası) veya MemoryBackend
+          (yerel koşular ve testler için aynı API)
+
+Toplu okuma/yazma tek gidiş-dönüştür: Redis'te MGET ve pipeline'lı SET EX.
+
+Tıkanma (stampede) koruması: bir anahtarın süresi dolduğunda
+    - aynı süreçteki eşzamanlı istekler tek bir hesaplamayı bekler
+      (anahtar başına asyncio.Future),
+    - örnekler arasında yalnızca SET NX kilidini alan hesaplar; diğerleri
+      değer yazılana ya da kilit süresi dolana kadar arka ucu yoklar.
+
+Değerler JSON olarak saklanır. Adres FAZZ4_REDIS_URL ortam değişkeninden
+okunur; ayarlı değilse MemoryBackend kullanılır.
+"""
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+DEFAULT_TTL = 300.0
+DEFAULT_L1_TTL = 5.0
+LOCK_TTL = 30.0
+LOCK_POLL = 0.05
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _decode(raw: Optional[bytes]) -> Any:
+    return None if raw is None else json.loads(raw)
+
+
+# --- Arka uçlar ---
+
+class MemoryBackend:
+    """Redis arka ucuyla aynı API'yi sunan süreç içi arka uç."""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, float]] = {}
+        self._locks: Dict[str, Tuple[str, float]] = {}
+
+    def _live(self, key: str) -> Optional[bytes]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        if item[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return item[0]
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return [self._live(key) for key in keys]
+
+    async def set_many(self, items: Mapping[str, bytes], ttl: float) -> None:
+        expires = time.monotonic() + ttl
+        for key, raw in items.items():
+            self._data[key] = (raw, expires)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    async def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        held = self._locks.get(key)
+        if held is not None and held[1] > time.monotonic():
+            return False
+        self._locks[key] = (token, time.monotonic() + ttl)
+        return True
+
+    async def release_lock(self, key: str, token: str) -> None:
+        held = self._locks.get(key)
+        if held is not None and held[0] == token:
+            del self._locks[key]
+
+    async def close(self) -> None:
+        self._data.clear()
+        self._locks.clear()
+
+
+class RedisBackend:
+    """
+    redis.asyncio üzerinde arka uç.
+
+    Args:
+        url (str): redis://host:6379/0 biçiminde bağlantı adresi.
+        max_connections (int): Bağlantı havuzu sınırı.
+    """
+
+    # Kilidi yalnızca sahibi (token eşleşirse) bırakabilir
+    _RELEASE = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+
+    def __init__(self, url: str, max_connections: int = 32):
+        import redis.asyncio as redis
+
+        self.url = url
+        self._client = redis.Redis.from_url(url, max_connections=max_connections)
+        self._release = self._client.register_script(self._RELEASE)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        return await self._client.mget(list(keys))
+
+    async def set_many(self, items: Mapping[str, bytes], ttl: float) -> None:
+        if not items:
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, raw in items.items():
+                pipe.set(key, raw, px=int(ttl * 1000))
+            await pipe.execute()
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._client.delete(*keys)
+
+    async def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        return bool(await self._client.set(key, token, nx=True, px=int(ttl * 1000)))
+
+    async def release_lock(self, key: str, token: str) -> None:
+        await self._release(keys=[key], args=[token])
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+# --- Katmanlı önbellek ---
+
+class TieredCache:
+    """
+    L1 (süreç içi) + L2 (arka uç) önbellek ve tıkanma koruması.
+
+    Args:
+        backend: MemoryBackend veya RedisBackend.
+        namespace (str): Tüm anahtarların öneki.
+        ttl (float): L2 yaşam süresi (s).
+        l1_ttl (float): L1 yaşam süresi (s); L2'den kısa tutulur ki örnekler
+            arası tutarsızlık penceresi küçük kalsın.
+        l1_max_entries (int): L1'deki en fazla anahtar (LRU).
+        lock_ttl (float): Hesaplama kilidinin en uzun süresi (s).
+    """
+
+    def __init__(self, backend, namespace: str = "fazz4", ttl: float = DEFAULT_TTL,
+                 l1_ttl: float = DEFAULT_L1_TTL, l1_max_entries: int = 1024, lock_ttl: float = LOCK_TTL):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self.l1_ttl = l1_ttl
+        self.l1_max_entries = l1_max_entries
+        self.lock_ttl = lock_ttl
+        self._l1: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.l1_hits = self.l2_hits = self.misses = self.computes = self.lock_waits = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    # --- L1 ---
+
+    def _l1_get(self, key: str):
+        item = self._l1.get(key)
+        if item is None:
+            return None
+        if item[1] <= time.monotonic():
+            del self._l1[key]
+            return None
+        self._l1.move_to_end(key)
+        return item[0]
+
+    def _l1_set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._l1[key] = (value, time.monotonic() + min(self.l1_ttl, ttl or self.ttl))
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.l1_max_entries:
+            self._l1.popitem(last=False)
+
+    # --- Toplu erişim ---
+
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Bulunan anahtarların değerleri; L1'de olmayanlar tek gidiş-dönüşte L2'den okunur."""
+        found, remote = {}, []
+        for key in keys:
+            value = self._l1_get(key)
+            if value is None:
+                remote.append(key)
+            else:
+                found[key] = value
+                self.l1_hits += 1
+        if remote:
+            for key, raw in zip(remote, await self.backend.get_many([self._key(key) for key in remote])):
+                if raw is None:
+                    self.misses += 1
+                    continue
+                value = _decode(raw)
+                self._l1_set(key, value)
+                found[key] = value
+                self.l2_hits += 1
+        return found
+
+    async def set_many(self, items: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        ttl = ttl or self.ttl
+        await self.backend.set_many({self._key(key): _encode(value) for key, value in items.items()}, ttl)
+        for key, value in items.items():
+            self._l1_set(key, value, ttl)
+
+    async def get(self, key: str):
+        return (await self.get_many([key])).get(key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self.set_many({key: value}, ttl)
+
+    async def invalidate(self, *keys: str) -> None:
+        for key in keys:
+            self._l1.pop(key, None)
+        await self.backend.delete(*(self._key(key) for key in keys))
+
+    # --- Tıkanma korumalı hesaplama ---
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]],
+                             ttl: Optional[float] = None):
+        """
+        Değeri önbellekten döndürür; yoksa tek bir hesaplama yapılır.
+
+        Aynı süreçte eşzamanlı çağıranlar aynı Future'ı bekler; örnekler arasında
+        kilidi alamayan çağıranlar sahibin yazdığı değeri okur.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._compute_once(key, compute, ttl)
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # Bekleyen yoksa "hiç alınmadı" uyarısını bastır
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    async def _compute_once(self, key: str, compute, ttl: Optional[float]):
+        lock_key, token = self._key(f"lock:{key}"), uuid.uuid4().hex
+        deadline = time.monotonic() + self.lock_ttl
+        while not await self.backend.acquire_lock(lock_key, token, self.lock_ttl):
+            # Başka bir örnek hesaplıyor: değer yazılana ya da kilit düşene kadar bekle
+            self.lock_waits += 1
+            await asyncio.sleep(LOCK_POLL)
+            raw = (await self.backend.get_many([self._key(key)]))[0]
+            if raw is not None:
+                value = _decode(raw)
+                self._l1_set(key, value, ttl)
+                self.l2_hits += 1
+                return value
+            if time.monotonic() > deadline:
+                break  # Sahip çökmüş olabilir; kendimiz hesaplarız
+        try:
+            # Kilidi beklerken başka bir örnek yazmış olabilir
+            raw = (await self.backend.get_many([self._key(key)]))[0]
+            if raw is not None:
+                value = _decode(raw)
+                self._l1_set(key, value, ttl)
+                return value
+            value = await compute()
+            self.computes += 1
+            await self.set(key, value, ttl)
+            return value
+        finally:
+            await self.backend.release_lock(lock_key, token)
+
+    async def close(self) -> None:
+        self._l1.clear()
+        await self.backend.close()
+
+    def stats(self) -> dict:
+        lookups = self.l1_hits + self.l2_hits + self.misses
+        return {"backend": type(self.backend).__name__, "l1_entries": len(self._l1),
+                "l1_hits": self.l1_hits, "l2_hits": self.l2_hits, "misses": self.misses,
+                "computes": self.computes, "lock_waits": self.lock_waits,
+                "hit_rate": (self.l1_hits + self.l2_hits) / lookups if lookups else 0.0}
+
+
+def cache_from_env(namespace: str = "fazz4") -> TieredCache:
+    """FAZZ4_REDIS_URL ayarlıysa Redis, değilse bellek içi arka uçla önbellek kurar."""
+    url = os.environ.get("FAZZ4_REDIS_URL")
+    backend = RedisBackend(url) if url else MemoryBackend()
+    return TieredCache(backend, namespace=namespace,
+                       ttl=float(os.environ.get("FAZZ4_CACHE_TTL", DEFAULT_TTL)),
+                       l1_ttl=float(os.environ.get("FAZZ4_L1_TTL", DEFAULT_L1_TTL)))
+
+
+_default: Optional[TieredCache] = None
+
+
+def default_shared_cache() -> TieredCache:
+    """API rotalarının paylaştığı süreç geneli önbellek (tek bağlantı havuzu)."""
+    global _default
+    if _default is None:
+        _default = cache_from_env()
+    return _default
@@ -0,0 +1,162 @@
+"""
+FAZZ-4 API - Kabul Kontrolü (Admission Control)
+
+Pahalı rotalar (ör. /military/convergence/batch) olay döngüsünü tekeline
+almasın diye her rota sınıfı kendi semaforu ve kuyruk derinliği sınırıyla
+korunur. Sınırı aşan istemciler beklemeden 429/503 + Retry-After alır;
+kuyrukta geçen süre ölçülür ve /system/admission üzerinden raporlanır.
+
+Ucuz rotalar (/military/status gibi) bu katmandan geçmez; yük altında da
+gecikmeleri düşük kalır. Önbellekli rotalarda yalnızca önbellek ıskasındaki
+kurulum korunur (wrap): hazır gövde ve 304 yanıtları kuyruğa girmez.
+"""
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, TypeVar
+
+from fastapi import HTTPException
+
+T = TypeVar("T")
+
+
+class AdmissionRejected(HTTPException):
+    """Kapasite dolu olduğunda fırlatılan, Retry-After başlıklı HTTP hatası."""
+
+    def __init__(self, route_class: str, status_code: int, retry_after: float, reason: str):
+        super().__init__(
+            status_code=status_code,
+            detail=f"'{route_class}' rota sınıfı kapasitesi dolu: {reason}",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+class AdmissionLimiter:
+    """
+    Tek bir rota sınıfı için eşzamanlılık ve kuyruk sınırı.
+
+    Args:
+        name (str): Rota sınıfı adı.
+        max_concurrency (int): Aynı anda çalışabilecek istek sayısı.
+        max_queue (int): Yer bekleyebilecek en fazla istek sayısı.
+        max_wait_s (float): Kuyrukta beklemenin üst sınırı; aşılırsa 503 döner.
+        retry_after_s (float): Reddedilen istemcilere önerilen bekleme süresi.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int,
+                 max_wait_s: float = 5.0, retry_after_s: float = 1.0):
+        if max_concurrency < 1 or max_queue < 0:
+            raise ValueError("max_concurrency >= 1 ve max_queue >= 0 olmalıdır.")
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait_s = max_wait_s
+        self.retry_after_s = retry_after_s
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.wait_ms = None       # RunningMoments; ilk kabulde kurulur (NumPy soğuk başlangıçta yüklenmez)
+        self.wait_digest = None   # TDigest
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """
+        Bir çalışma yeri (slot) ayırır; kuyrukta geçen süreyi (ms) verir.
+
+        Raises:
+            AdmissionRejected: Kuyruk doluysa 429, bekleme süresi aşılırsa 503.
+        """
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejected(self.name, 429, self.retry_after_s, "kuyruk dolu")
+
+        self.waiting += 1
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.max_wait_s)
+        except asyncio.TimeoutError:
+            self.rejected_timeout += 1
+            raise AdmissionRejected(self.name, 503, self.retry_after_s, "bekleme süresi aşıldı") from None
+        finally:
+            self.waiting -= 1
+
+        waited_ms = (time.perf_counter() - start) * 1000.0
+        self._record_wait(waited_ms)
+        self.admitted += 1
+        self.in_flight += 1
+        try:
+            yield waited_ms
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def _record_wait(self, waited_ms: float) -> None:
+        if self.wait_ms is None:
+            from src.core.streaming_stats import RunningMoments, TDigest
+
+            self.wait_ms, self.wait_digest = RunningMoments(), TDigest(compression=100)
+        self.wait_ms.update([waited_ms])
+        self.wait_digest.update([waited_ms])
+
+    def stats(self) -> dict:
+        measured = self.wait_ms is not None and self.wait_ms.count
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "queue_wait_ms": {
+                "mean": self.wait_ms.mean if measured else 0.0,
+                "p50": self.wait_digest.quantile(0.5) if measured else 0.0,
+                "p99": self.wait_digest.quantile(0.99) if measured else 0.0,
+            },
+        }
+
+
+class AdmissionController:
+    """
+    Rota sınıfı -> AdmissionLimiter eşlemesi ve FastAPI bağımlılık fabrikası.
+
+    Örnek:
+        admission = AdmissionController({"heavy": {"max_concurrency": 4, "max_queue": 16}})
+
+        @app.get("/agir", dependencies=[Depends(admission.guard("heavy"))])
+        async def agir_rota(): ...
+    """
+
+    def __init__(self, limits: Dict[str, dict]):
+        self.limiters = {name: AdmissionLimiter(name, **config) for name, config in limits.items()}
+
+    def register(self, limiter: AdmissionLimiter) -> None:
+        """Rota modülünün kendi tuttuğu sınırlayıcıyı istatistiklere ekler."""
+        self.limiters[limiter.name] = limiter
+
+    def guard(self, route_class: str):
+        """Rotayı ilgili sınıfın semaforu arkasında çalıştıran yield bağımlılığı döndürür."""
+        limiter = self.limiters[route_class]
+
+        async def dependency() -> AsyncIterator[float]:
+            async with limiter.slot() as waited_ms:
+                yield waited_ms
+
+        return dependency
+
+    def wrap(self, route_class: str, build: Callable[[], Awaitable[T]]) -> Callable[[], Awaitable[T]]:
+        """build coroutine'ini yalnızca çağrıldığında (ör. önbellek ıskası) sınıfın semaforu arkasında çalıştırır."""
+        limiter = self.limiters[route_class]
+
+        async def guarded() -> T:
+            async with limiter.slot():
+                return await build()
+
+        return guarded
+
+    def stats(self) -> Dict[str, dict]:
+        return {name: limiter.stats() for name, limiter in self.limiters.items()}
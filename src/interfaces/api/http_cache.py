@@ -0,0 +1,112 @@
+"""
+FAZZ-4 API - Önceden Serileştirilmiş Yanıt Önbelleği (Conditional GET)
+
+MilitaryCoreEngine çıktıları yalnızca motor durum sürümü (state_version)
+değiştiğinde değişir. Bu modül, her rota için pydantic doğrulaması ve JSON
+serileştirmesini sürüm başına bir kez yapar; sonraki isteklerde hazır baytları
+ETag ile birlikte döndürür. If-None-Match eşleşirse gövdesiz 304 yanıtı verilir.
+
+Anayasa Referansları: Madde 2.1 (Presentation Layer)
+"""
+import hashlib
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    """Bir rotanın belirli bir durum sürümüne ait hazır yanıt gövdesi."""
+    version: Hashable
+    body: bytes
+    etag: str
+
+
+def make_etag(body: bytes) -> str:
+    """Gövdenin içerik özetinden güçlü (strong) bir ETag üretir."""
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    If-None-Match başlığını RFC 9110'a göre zayıf karşılaştırma ile değerlendirir.
+
+    Args:
+        if_none_match (str): İstemcinin gönderdiği başlık değeri.
+        etag (str): Sunucudaki güncel ETag.
+
+    Returns:
+        bool: Başlık "*" ise veya listedeki etiketlerden biri eşleşirse True.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
+class PreSerializedResponseCache:
+    """
+    Rota anahtarı başına (sürüm, gövde, ETag) saklayan önbellek.
+
+    Args:
+        cache_control (str): Tüm önbellekli yanıtlara eklenen Cache-Control değeri.
+            Varsayılan "no-cache": istemci saklayabilir ama her seferinde ETag ile
+            yeniden doğrular; sürüm değişince anında yeni veri görür.
+    """
+
+    def __init__(self, cache_control: str = "no-cache"):
+        self.cache_control = cache_control
+        self._entries: Dict[str, CachedBody] = {}
+        self.builds = 0
+
+    async def get(self, key: str, version: Hashable,
+                  build: Callable[[], Awaitable[BaseModel]]) -> CachedBody:
+        """
+        Güncel sürümün hazır gövdesini döndürür; sürüm değiştiyse yeniden kurar.
+
+        Args:
+            key (str): Rota anahtarı (ör. "status").
+            version (Hashable): Motorun güncel durum sürümü.
+            build (Callable): Doğrulanmış pydantic modelini döndüren coroutine.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.version != version:
+            model = await build()
+            body = model.model_dump_json().encode()
+            entry = CachedBody(version=version, body=body, etag=make_etag(body))
+            self._entries[key] = entry
+            self.builds += 1
+        return entry
+
+    def compose(self, key: str, version: Hashable, parts: Dict[str, CachedBody]) -> CachedBody:
+        """
+        Hazır bölüm gövdelerini yeniden serileştirmeden tek bir JSON nesnesinde birleştirir.
+
+        Args:
+            key (str): Birleşik yanıtın önbellek anahtarı.
+            version (Hashable): Motorun güncel durum sürümü.
+            parts (dict): Bölüm adı -> o bölümün hazır gövdesi (sıra korunur).
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.version != version:
+            body = b"{" + b",".join(
+                b'"' + name.encode() + b'":' + part.body for name, part in parts.items()
+            ) + b"}"
+            entry = CachedBody(version=version, body=body, etag=make_etag(body))
+            self._entries[key] = entry
+            self.builds += 1
+        return entry
+
+    def invalidate(self) -> None:
+        self._entries.clear()
+
+    def respond(self, request: Request, entry: CachedBody) -> Response:
+        """Koşullu isteği değerlendirip 200 (hazır gövde) veya 304 yanıtı üretir."""
+        headers = {"ETag": entry.etag, "Cache-Control": self.cache_control}
+        if etag_matches(request.headers.get("if-none-match", ""), entry.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
@@ -0,0 +1,71 @@
+"""
+FAZZ-6 İtki Laboratuvarı Rotaları
+
+Alaşım ve ateşleme sonuçları src.core.propulsion çekirdeğinin kapalı
+biçimlerinden hesaplanır; uyku, yazdırma veya saniye saniye döngü yoktur.
+Her parametre seti için JSON gövdesi bir kez serileştirilip önbellekte tutulur,
+tekrar eden istekler doğrudan hazır baytlarla yanıtlanır. Süreç içi önbellekte
+olmayan parametre setleri önce disk sonuç önbelleğine bakar (FAZZ4_CACHE=off
+ile kapanır); böylece yeniden başlatmalar ve diğer örnekler aynı sonucu paylaşır.
+"""
+import json
+from functools import lru_cache
+
+from fastapi import APIRouter, Query, Response
+
+from src.core.propulsion import BASE_BURN_RATE, alloy_composition, ignition_summary
+from src.infrastructure.result_cache import default_cache
+
+router = APIRouter(prefix="/propulsion", tags=["propulsion"])
+
+NObserverQuery = Query(12, ge=0, le=1_000_000, description="Nizam Sabiti")
+
+
+def _json(payload: dict) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _disk_cached(simulation: str, params: dict, compute) -> dict:
+    cache = default_cache()
+    return compute() if cache is None else cache.get_or_compute(simulation, params, compute)
+
+
+@lru_cache(maxsize=4096)
+def _alloy_body(n_observer: int) -> bytes:
+    return _json(_disk_cached("propulsion_alloy", {"n_observer": n_observer},
+                              lambda: alloy_composition(n_observer).to_dict()))
+
+
+def _ignition(n_observer: int, fuel_tank: float, burn_rate: float) -> dict:
+    alloy = alloy_composition(n_observer)
+    summary = ignition_summary(fuel_tank, alloy.alloy_integrity, burn_rate)
+    return {"n_observer": n_observer, "alloy_code": alloy.alloy_code, **summary}
+
+
+@lru_cache(maxsize=4096)
+def _ignition_body(n_observer: int, fuel_tank: float, burn_rate: float) -> bytes:
+    params = {"n_observer": n_observer, "fuel_tank": fuel_tank, "burn_rate": burn_rate}
+    return _json(_disk_cached("propulsion_ignition", params, lambda: _ignition(**params)))
+
+
+@router.get("/alloy")
+async def get_alloy(n_observer: int = NObserverQuery):
+    """Ag-Gd oranları, alaşım kodu ve teorik mukavemet (GPa)."""
+    return Response(_alloy_body(n_observer), media_type="application/json")
+
+
+@router.get("/ignition")
+async def get_ignition(
+    n_observer: int = NObserverQuery,
+    fuel_tank: float = Query(7812.45, ge=0, le=1e12, description="H2 yakıtı (Litre)"),
+    burn_rate: float = Query(BASE_BURN_RATE, ge=1e-3, le=1e6, description="Baz yanma hızı (Litre/Saniye)"),
+):
+    """Toplam itki (kN), yanma süresi aralığı ve saniyelik en yüksek itki."""
+    return Response(_ignition_body(n_observer, fuel_tank, burn_rate), media_type="application/json")
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """Parametre seti önbelleklerinin isabet istatistikleri."""
+    return {name: body.cache_info()._asdict()
+            for name, body in (("alloy", _alloy_body), ("ignition", _ignition_body))}
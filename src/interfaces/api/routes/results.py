@@ -0,0 +1,61 @@
+"""
+FAZZ-4 Sonuç Deposu Rotaları
+
+Kayıtlı toplulukları listeler ve metrikleri veritabanında toplanmış olarak
+döndürür. Depo adresi FAZZ4_RESULTS_URL ortam değişkeninden okunur; motor ilk
+istekte oluşturulur ve bağlantı havuzu süreç boyunca paylaşılır. Kurulum bir
+asyncio.Lock ile korunur: eşzamanlı ilk istekler tek depo ve tek havuz görür.
+
+SQLAlchemy de ilk istekte içe aktarılır (~0.3 s); API işçilerinin soğuk
+başlangıcı sonuç deposu kullanılmadıkça bu maliyeti ödemez.
+"""
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Query
+
+router = APIRouter(prefix="/results", tags=["results"])
+
+_store = None   # ResultsStore; ilk istekte kurulur
+_store_lock = asyncio.Lock()
+
+
+async def get_store():
+    global _store
+    if _store is not None:
+        return _store
+    async with _store_lock:
+        if _store is None:
+            from src.infrastructure.results_store import DEFAULT_URL, ResultsStore
+
+            store = ResultsStore(DEFAULT_URL)
+            await store.create_schema()
+            _store = store   # Şema hazır olmadan diğer isteklere görünmez
+    return _store
+
+
+async def close_store() -> None:
+    global _store
+    async with _store_lock:
+        if _store is not None:
+            await _store.close()
+            _store = None
+
+
+@router.get("/ensembles")
+async def list_ensembles(simulation: Optional[str] = Query(None, description="Simülasyon adı filtresi")):
+    """Kayıtlı topluluklar: simülasyon, parametre özeti, tohum, koşu sayısı ve metrikler."""
+    store = await get_store()
+    return await store.list_ensembles(simulation)
+
+
+@router.get("/aggregate")
+async def aggregate_metric(
+    simulation: str = Query(..., description="Simülasyon adı"),
+    metric: str = Query(..., description="Toplanacak metrik"),
+    param_hash: Optional[str] = Query(None, description="Tek bir parametre seti"),
+    seed: Optional[int] = Query(None),
+):
+    """Topluluk başına count, mean, std, min ve max."""
+    store = await get_store()
+    return await store.aggregate(simulation, metric, param_hash, seed)
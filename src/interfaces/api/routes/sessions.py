@@ -0,0 +1,108 @@
+"""
+FAZZ-4 Canlı Oturum Rotaları
+
+Kokpitin demo oturumlarını (FAZZ-10 varış, FAZZ-13 dönüş) aynı olay
+döngüsünde eşzamansız görevler olarak açar, duraklatır, sürdürür, hızlandırır
+ve kare akışını text/event-stream olarak yayınlar. Oturum başına iş parçacığı
+yoktur (src.services.live_sessions).
+"""
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from src.interfaces.api.sse import format_event
+from src.services.live_sessions import SIMULATIONS, Session, SessionLimitExceeded, SessionManager
+
+router = APIRouter(prefix="/sessions", tags=["sessions"])
+
+manager = SessionManager()
+
+
+class SessionRequest(BaseModel):
+    simulation: str = Field(..., description=f"Simülasyon: {', '.join(SIMULATIONS)}")
+    speed: float = Field(1.0, gt=0, le=10_000, description="Simüle s / duvar s")
+    seed: Optional[int] = Field(None, description="Tekrarlanabilir oturum için rastgelelik tohumu")
+    paused: bool = False
+
+
+def _session(session_id: str) -> Session:
+    try:
+        return manager.get(session_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Bilinmeyen oturum: {session_id}") from None
+
+
+async def close_sessions() -> None:
+    await manager.close()
+
+
+@router.post("", status_code=201)
+async def create_session(body: SessionRequest):
+    """Yeni oturum açar; simülasyon hemen (paused=False ise) ilerlemeye başlar."""
+    try:
+        return manager.create(body.simulation, body.speed, body.seed, body.paused).to_dict()
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Bilinmeyen simülasyon: {body.simulation}") from None
+    except SessionLimitExceeded as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+
+
+@router.get("")
+async def list_sessions(limit: int = Query(100, ge=0, le=10_000)):
+    """Oturum sayaçları ve en fazla limit oturumun özeti."""
+    return {"stats": manager.stats(),
+            "sessions": [session.to_dict() for session in manager.list()[:limit]]}
+
+
+@router.get("/{session_id}")
+async def get_session(session_id: str):
+    return _session(session_id).to_dict()
+
+
+@router.post("/{session_id}/pause")
+async def pause_session(session_id: str):
+    session = _session(session_id)
+    session.pause()
+    return session.to_dict()
+
+
+@router.post("/{session_id}/resume")
+async def resume_session(session_id: str):
+    session = _session(session_id)
+    session.resume()
+    return session.to_dict()
+
+
+@router.post("/{session_id}/speed")
+async def set_session_speed(session_id: str, speed: float = Query(..., gt=0, le=10_000)):
+    session = _session(session_id)
+    session.set_speed(speed)
+    return session.to_dict()
+
+
+@router.delete("/{session_id}", status_code=204)
+async def delete_session(session_id: str):
+    _session(session_id)
+    await manager.remove(session_id)
+
+
+@router.get("/{session_id}/stream")
+async def stream_session(session_id: str, request: Request):
+    """Son kareden başlayarak oturum karelerini SSE olarak akıtır; oturum bitince "end" olayı."""
+    session = _session(session_id)
+
+    async def events():
+        frames = session.subscribe()
+        try:
+            async for frame in frames:
+                if await request.is_disconnected():
+                    return
+                yield format_event(frame, "frame", frame["seq"])
+            yield format_event({"state": session.state, "frames": session.frames}, "end")
+        finally:
+            await frames.aclose()
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
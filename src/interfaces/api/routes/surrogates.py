@@ -0,0 +1,79 @@
+"""
+FAZZ-4 Vekil Model Rotaları (What-if)
+
+Eğitilmiş PCE modellerinden tahmin ve hata kestirimi döndürür. Alan içindeki
+sorgular vekil modelle mikro saniyelerde yanıtlanır; alan dışındakiler (veya
+model eğitilmemişse) gerçek simülasyon iş parçacığında koşturulur. Yedek yol
+doğrulanır (yedek alan dışı veya çok fazla nokta -> 422) ve kabul kontrolü
+arkasındadır (fallback_limiter; src.main bunu /system/admission'a kaydeder).
+Kayıt (ve NumPy) ilk istekte yüklenir; API işçilerinin soğuk başlangıcı bu
+maliyeti ödemez.
+
+Modeller eğitim CLI'ı ile üretilir:
+    python -m src.services.surrogates --target ignition --points 400
+"""
+import asyncio
+from typing import Dict, List
+
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel, Field
+
+from src.interfaces.api.admission import AdmissionLimiter
+
+router = APIRouter(prefix="/surrogates", tags=["surrogates"])
+
+_registry = None   # SurrogateRegistry; ilk istekte kurulur
+fallback_limiter = AdmissionLimiter("surrogate_fallback", max_concurrency=2, max_queue=8, max_wait_s=5.0)
+
+
+class PredictRequest(BaseModel):
+    points: List[Dict[str, float]] = Field(..., min_length=1, max_length=10_000)
+
+
+def get_registry():
+    global _registry
+    if _registry is None:
+        from src.services.surrogates import SurrogateRegistry
+
+        _registry = SurrogateRegistry()
+    return _registry
+
+
+async def _predict(name: str, points: List[Dict[str, float]]) -> List[dict]:
+    from src.services.surrogates import TARGETS
+
+    registry = get_registry()
+    if name not in TARGETS:
+        raise HTTPException(status_code=404, detail=f"Bilinmeyen hedef: {name}")
+    try:
+        if registry.validate(name, points) == 0:
+            return registry.predict(name, points)
+        # En az bir nokta simülasyona düşecek: sınırlı eşzamanlılıkla, olay döngüsünü bloklamadan
+        async with fallback_limiter.slot():
+            return await asyncio.to_thread(registry.predict, name, points)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+@router.get("")
+async def list_surrogates():
+    """Hedefler, parametre aralıkları, eğitim durumu ve LOO hataları."""
+    registry = get_registry()
+    return {"targets": registry.describe(),
+            "stats": {"surrogate_hits": registry.surrogate_hits, "fallbacks": registry.fallbacks}}
+
+
+@router.get("/{name}/predict")
+async def predict_one(name: str, request: Request):
+    """Tek nokta; parametreler sorgu dizesinden okunur (ör. ?n_observer=12&burn_rate=250&fuel_tank=7812)."""
+    try:
+        point = {key: float(value) for key, value in request.query_params.items()}
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=f"Parametreler sayısal olmalıdır: {exc}") from exc
+    return (await _predict(name, [point]))[0]
+
+
+@router.post("/{name}/predict")
+async def predict_batch(name: str, batch: PredictRequest):
+    """Çok nokta; alan içindekiler tek vektörel çağrıda değerlendirilir."""
+    return {"results": await _predict(name, batch.points)}
@@ -0,0 +1,49 @@
+"""
+FAZZ-4 Canlı Telemetri Rotaları (Server-Sent Events)
+
+Fırlatma tırmanışı (FAZZ-8), Mars frenlemesi (FAZZ-10) ve Dünya'ya giriş
+(FAZZ-13) simülasyonlarını adım adım text/event-stream olarak yayınlar.
+"""
+import random
+from typing import Optional
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+
+from src.interfaces.api.sse import stream_frames
+from src.simulation.fazz8_launch_control import ascent_frames
+from src.simulation.fazz10_mars_arrival import suicide_burn_frames
+from src.simulation.fazz13_earth_return import reentry_frames
+
+router = APIRouter(prefix="/telemetry", tags=["telemetry"])
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+HzQuery = Query(10.0, ge=0, le=120, description="Saniyedeki en fazla kare; 0 = beklemesiz")
+EveryQuery = Query(1, ge=1, le=100_000, description="Her N simülasyon adımında bir kare")
+SeedQuery = Query(None, description="Tekrarlanabilir akış için rastgelelik tohumu")
+
+
+def _event_stream(request: Request, frames, every: int, hz: float) -> StreamingResponse:
+    return StreamingResponse(stream_frames(request, frames, every, hz),
+                             media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+@router.get("/launch")
+async def stream_launch(request: Request, hz: float = HzQuery, every: int = EveryQuery):
+    """FAZZ-8 tırmanışı: irtifa, hız ve G-kuvveti."""
+    return _event_stream(request, ascent_frames(), every, hz)
+
+
+@router.get("/arrival")
+async def stream_arrival(request: Request, hz: float = HzQuery, every: int = EveryQuery,
+                         seed: Optional[int] = SeedQuery):
+    """FAZZ-10 frenleme (suicide burn): hız, Mars'a mesafe ve zırh bütünlüğü."""
+    return _event_stream(request, suicide_burn_frames(rng=random.Random(seed)), every, hz)
+
+
+@router.get("/reentry")
+async def stream_reentry(request: Request, hz: float = HzQuery, every: int = EveryQuery,
+                         seed: Optional[int] = SeedQuery):
+    """FAZZ-13 atmosferik giriş: irtifa ve gövde sıcaklığı."""
+    return _event_stream(request, reentry_frames(rng=random.Random(seed)), every, hz)
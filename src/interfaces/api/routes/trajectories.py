@@ -0,0 +1,177 @@
+"""
+FAZZ-4 Yörünge Grafikleri Rotaları
+
+Hiper-ölçek seyir (FAZZ-4) ve Gadolinium reaktörü (FAZZ-5.1) kayıtlarını
+istenen piksel genişliğine seyreltilmiş olarak döndürür. Ham kayıtlar disk
+önbelleğinde (result_cache), çok çözünürlüklü piramitler bellekte tutulur; yanıt
+boyutu kaydın uzunluğundan bağımsız olarak genişlikle sınırlıdır. Hazır yanıtlar
+paylaşımlı önbellekte (shared_cache) tutulur; diğer API örnekleri piramidi
+yeniden kurmaz.
+
+Kimlik doğrulamasız bir rota olduğu için kaynaklar sınırlıdır: kayıt boyu
+max_size ile, bellekteki piramitler toplam bayt (PYRAMID_CACHE_BYTES) ile
+sınırlanır ve PERSIST_MAX_BYTES'tan büyük ham kayıtlar diske yazılmaz.
+
+NumPy ve simülasyon modülleri ilk istekte yüklenir (API soğuk başlangıcı).
+"""
+import asyncio
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Query
+
+from src.infrastructure.result_cache import cache_key, default_cache
+from src.infrastructure.shared_cache import default_shared_cache
+
+router = APIRouter(prefix="/trajectories", tags=["trajectories"])
+
+PYRAMID_CACHE_BYTES = 64 * 1024 * 1024   # Bellekteki piramitlerin toplam üst sınırı
+PERSIST_MAX_BYTES = 8 * 1024 * 1024      # Bundan büyük ham kayıtlar disk önbelleğine yazılmaz
+MAX_SEED = 2 ** 32 - 1
+
+
+@dataclass(frozen=True)
+class Recording:
+    """Bir kayıt türünün üreticisi ve grafik eksenleri."""
+    record: Callable[[float, int], dict]
+    x: str
+    y: str
+    default_size: float
+    max_size: float
+    size_unit: str
+    version: int = 1    # Kayıt mantığı değişince artırılır (disk önbelleği anahtarına girer)
+
+
+def _cruise(size: float, seed: int) -> dict:
+    from src.simulation.fazz4_hyperscale_mars import cruise_trajectory
+
+    return cruise_trajectory(target_dist=size, seed=seed)
+
+
+def _reactor(size: float, seed: int) -> dict:
+    from src.simulation.fazz5_gadolinium_h2 import reactor_trajectory
+
+    return reactor_trajectory(total_cycles=int(size), seed=seed)
+
+
+RECORDINGS: Dict[str, Recording] = {
+    "cruise": Recording(_cruise, "cycle", "energy", 225_000_000, 1e9, "km"),   # 1e9 km ≈ 3.5 bin nokta
+    "reactor": Recording(_reactor, "cycle", "pressure", 250, 1_000_000, "cycles"),
+}
+
+
+class PyramidCache:
+    """
+    Piramitlerin toplam bayt boyutuyla sınırlı, iş parçacığı güvenli LRU önbelleği.
+
+    Tek başına max_bytes'ı aşan bir piramit döndürülür ama saklanmaz.
+    """
+
+    def __init__(self, max_bytes: int = PYRAMID_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: "OrderedDict[Tuple, TrajectoryPyramid]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: Tuple, build: Callable[[], "TrajectoryPyramid"]) -> "TrajectoryPyramid":
+        with self._lock:
+            pyramid = self._entries.get(key)
+            if pyramid is not None:
+                self._entries.move_to_end(key)
+                return pyramid
+        pyramid = build()
+        if pyramid.nbytes > self.max_bytes:
+            return pyramid
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = pyramid
+                self.bytes += pyramid.nbytes
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted.nbytes
+        return pyramid
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+
+_pyramids = PyramidCache()
+
+
+def _record(name: str, size: float, seed: int) -> dict:
+    recording = RECORDINGS[name]
+    cache = default_cache()
+    key = cache_key(f"trajectory:{name}", recording.version, {"size": size}, seed)
+    columns = cache.get(key) if cache is not None else None
+    if columns is None:
+        columns = recording.record(size, seed)
+        if cache is not None and sum(values.nbytes for values in columns.values()) <= PERSIST_MAX_BYTES:
+            cache.put(key, columns)
+    return columns
+
+
+def _pyramid(name: str, size: float, seed: int, y: str) -> "TrajectoryPyramid":
+    from src.core.downsampling import TrajectoryPyramid
+
+    return _pyramids.get_or_build((name, size, seed, y),
+                                  lambda: TrajectoryPyramid(_record(name, size, seed), x=RECORDINGS[name].x, y=y))
+
+
+@router.get("")
+async def list_recordings():
+    """Kayıt türleri, eksenleri ve boyut sınırları."""
+    return {
+        name: {"x": rec.x, "y": rec.y, "default_size": rec.default_size,
+               "max_size": rec.max_size, "size_unit": rec.size_unit}
+        for name, rec in RECORDINGS.items()
+    }
+
+
+@router.get("/{name}")
+async def get_trajectory(
+    name: str,
+    width: int = Query(1000, ge=16, le=8192, description="Grafik genişliği (piksel)"),
+    method: str = Query("lttb", description="Seyreltme yöntemi: lttb veya minmax"),
+    y: Optional[str] = Query(None, description="Seyreltmeyi yönlendiren sütun"),
+    size: Optional[float] = Query(None, gt=0, description="Kayıt uzunluğu (km veya döngü)"),
+    seed: int = Query(0, ge=0, le=MAX_SEED, description="Kaydın rastgelelik tohumu"),
+):
+    """Kaydı width pikselde çizilecek kadar noktaya seyreltir."""
+    from src.core.downsampling import METHODS
+
+    recording = RECORDINGS.get(name)
+    if recording is None:
+        raise HTTPException(status_code=404, detail=f"Bilinmeyen kayıt: {name}")
+    if method not in METHODS:
+        raise HTTPException(status_code=422, detail=f"method şunlardan biri olmalı: {', '.join(METHODS)}")
+    size = recording.default_size if size is None else size
+    if size > recording.max_size:
+        raise HTTPException(status_code=422, detail=f"size en fazla {recording.max_size:g} {recording.size_unit}")
+
+    key = cache_key(f"trajectory:{name}", recording.version,
+                    {"size": size, "y": y or recording.y, "width": width, "method": method}, seed)
+    return await default_shared_cache().get_or_compute(
+        f"trajectory:{key}", lambda: _downsampled(name, recording, width, method, y, size, seed))
+
+
+async def _downsampled(name: str, recording: Recording, width: int, method: str, y: Optional[str],
+                       size: float, seed: int) -> dict:
+    try:
+        pyramid = await asyncio.to_thread(_pyramid, name, size, seed, y or recording.y)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    columns = await asyncio.to_thread(pyramid.at_width, width, method)
+    return {
+        "name": name,
+        "method": method,
+        "width": width,
+        "x": pyramid.x,
+        "y": pyramid.y,
+        "source_points": pyramid.length,
+        "points": len(columns[pyramid.x]),
+        "columns": {column: values.tolist() for column, values in columns.items()},
+    }
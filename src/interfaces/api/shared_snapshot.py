@@ -0,0 +1,276 @@
+"""
+FAZZ-4 API - Paylaşımlı Bellek Motor Anlık Görüntüsü (Shared-Memory Snapshot)
+
+Birden çok uvicorn worker'ı çalıştığında her süreç kendi MilitaryCoreEngine'ini
+hesaplamak yerine, tek bir yayıncı (publisher) sürecin multiprocessing.shared_memory
+segmentine yazdığı anlık görüntüyü okur.
+
+Segment düzeni (little-endian):
+    [0:8)    magic      b"FAZZ4SNP"
+    [8:16)   seq        uint64  seqlock sayacı (tek = yazım sürüyor)
+    [16:24)  version    int64   motor durum sürümü (state_version)
+    [24:32)  length     uint64  yük (payload) uzunluğu
+    [32:40)  heartbeat  float64 yayıncının son nabzı (time.time())
+    [40:48)  pid        int64   nabzı yazan yayıncı süreç
+    [64:...) payload    JSON baytları
+
+Seqlock: yazar önce seq'i tek sayıya çeker, veriyi yazar, sonra çift sayıya
+çeker. Okuyucu seq'i yazımdan önce ve sonra okur; ikisi eşit ve çiftse kopya
+tutarlıdır. Okuyucular yalnızca başlığı okuyarak (sıfır kopya) sürümün değişip
+değişmediğini anlar; yükü yalnızca sürüm değişince kopyalar ve çözer.
+
+Yayıncı seçimi: segmentten ayrı bir kilit dosyasında (geçici dizin,
+<ad>.fazz4.lock) fcntl.flock tutan süreç yayıncıdır. publish_loop'u her worker
+çalıştırır; kilidi alamayanlar her turda yeniden dener. Yayıncı çıkar veya
+çökerse çekirdek kilidi bırakır ve sıradaki worker devralıp yayına başlar.
+Yayıncı asılı kalırsa (kilit tutulur ama nabız gelmez) nabız stale_after
+saniyeden eskidiğinde okuyucuların version()/read() çağrıları None döndürür ve
+worker'lar yerel hesaplamaya düşer.
+
+Kullanım:
+    # Bağımsız yayıncı süreç
+    python -m src.interfaces.api.shared_snapshot --name fazz4 --interval 0.5
+    # HTTP worker'ları
+    FAZZ4_SHARED_SNAPSHOT=fazz4 uvicorn src.main:app --workers 8
+"""
+import argparse
+import asyncio
+import fcntl
+import json
+import os
+import struct
+import tempfile
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Tuple
+
+MAGIC = b"FAZZ4SNP"
+HEADER_SIZE = 64
+DEFAULT_CAPACITY = 1 << 20  # 1 MiB
+DEFAULT_STALE_AFTER = 2.0   # s; yayın aralığının (0.5 s) dört katı
+_SEQ = struct.Struct("<Q")
+_META = struct.Struct("<qQ")  # version, length
+_BEAT = struct.Struct("<dq")  # heartbeat, pid
+
+
+def _lock_path(name: str) -> str:
+    return os.path.join(tempfile.gettempdir(), f"{name}.fazz4.lock")
+
+
+class SharedSnapshot:
+    """
+    Paylaşımlı bellek segmenti üzerinde seqlock korumalı tek yazarlı anlık görüntü.
+
+    Args:
+        segment (shared_memory.SharedMemory): Açılmış segment.
+        unlink (bool): close() segmenti de silsin mi (yalnızca bağımsız yayıncı).
+        stale_after (float): Bu kadar saniye nabız gelmezse yayın bayat sayılır.
+
+    Attributes:
+        owner (bool): Bu süreç yayıncı kilidini tutuyorsa True (claim() ile değişir).
+    """
+
+    def __init__(self, segment: shared_memory.SharedMemory, unlink: bool = False,
+                 stale_after: float = DEFAULT_STALE_AFTER):
+        self.segment = segment
+        self.owner = False
+        self.stale_after = stale_after
+        self._unlink = unlink
+        self._lock_fd: Optional[int] = None
+        self._buf = segment.buf
+        self._cached_seq = -1
+        self._cached: Optional[Tuple[int, dict]] = None
+
+    # --- Oluşturma / Bağlanma ---
+
+    @classmethod
+    def create(cls, name: str, capacity: int = DEFAULT_CAPACITY, unlink: bool = True) -> "SharedSnapshot":
+        """Segmenti oluşturur ve yayıncı kilidini almayı dener."""
+        segment = shared_memory.SharedMemory(name=name, create=True, size=HEADER_SIZE + capacity)
+        segment.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+        segment.buf[0:8] = MAGIC
+        if not unlink:
+            # Segment yaratan worker'dan uzun yaşar; çıkışta takipçi silmesin
+            resource_tracker.unregister(segment._name, "shared_memory")
+        snapshot = cls(segment, unlink=unlink)
+        snapshot.claim()
+        return snapshot
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedSnapshot":
+        segment = shared_memory.SharedMemory(name=name, create=False)
+        # Python 3.11 okuyucu süreç çıkarken segmenti kendi takipçisinden siler;
+        # segmentin ömrü bağlananlara ait olmadığı için kaydı geri alınır.
+        resource_tracker.unregister(segment._name, "shared_memory")
+        if bytes(segment.buf[0:8]) != MAGIC:
+            segment.close()
+            raise ValueError(f"'{name}' bir FAZZ-4 snapshot segmenti değil.")
+        return cls(segment)
+
+    @classmethod
+    def attach_or_create(cls, name: str, capacity: int = DEFAULT_CAPACITY) -> "SharedSnapshot":
+        """
+        Worker modu: segment yoksa oluşturur, varsa bağlanır; ikisinde de yayıncı
+        kilidini almayı dener. Segment silinmez, yayıncılık worker'lar arasında el değiştirir.
+        """
+        try:
+            return cls.create(name, capacity, unlink=False)
+        except FileExistsError:
+            snapshot = cls.attach(name)
+            snapshot.claim()
+            return snapshot
+
+    def claim(self) -> bool:
+        """Yayıncı kilidini bloklamadan almayı dener; tutuluyorsa veya alınırsa True."""
+        if self.owner:
+            return True
+        fd = os.open(_lock_path(self.segment.name), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._lock_fd = fd
+        self.owner = True
+        return True
+
+    def close(self) -> None:
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)   # Kilit bırakılır; sıradaki worker devralır
+            self._lock_fd = None
+        self.owner = False
+        self._buf = None
+        self.segment.close()
+        if self._unlink:
+            self.segment.unlink()
+
+    # --- Yazar ---
+
+    @property
+    def capacity(self) -> int:
+        return self.segment.size - HEADER_SIZE
+
+    def publish(self, version: int, payload: dict) -> None:
+        """Yükü JSON olarak yazar; okuyucular yarım yazımı asla görmez."""
+        data = json.dumps(payload, separators=(",", ":")).encode()
+        if len(data) > self.capacity:
+            raise ValueError(f"Snapshot {len(data)} bayt, segment kapasitesi {self.capacity} bayt.")
+        seq = _SEQ.unpack_from(self._buf, 8)[0]
+        _SEQ.pack_into(self._buf, 8, seq + 1)           # tek: yazım başladı
+        self._buf[HEADER_SIZE:HEADER_SIZE + len(data)] = data
+        _META.pack_into(self._buf, 16, version, len(data))
+        _SEQ.pack_into(self._buf, 8, seq + 2)           # çift: yazım tamamlandı
+        self.beat()
+
+    def beat(self) -> None:
+        """Yayıncının canlı olduğunu başlığa yazar."""
+        _BEAT.pack_into(self._buf, 32, time.time(), os.getpid())
+
+    # --- Okuyucu ---
+
+    def heartbeat(self) -> Tuple[float, int]:
+        """(son nabız zamanı, yayıncı pid); hiç nabız yoksa (0.0, 0)."""
+        return _BEAT.unpack_from(self._buf, 32)
+
+    def stale(self) -> bool:
+        """Son nabız stale_after saniyeden eskiyse (veya hiç yoksa) True."""
+        return time.time() - self.heartbeat()[0] > self.stale_after
+
+    def version(self, max_spins: int = 10_000) -> Optional[int]:
+        """
+        Yalnızca başlıktan güncel sürümü okur; henüz yayın yoksa veya nabız
+        bayatsa None (çağıran yerel motora düşer).
+
+        Yayıncı publish() ortasında ölürse seq tek sayıda kalır; okuyucu olay
+        döngüsünde sonsuza dek dönmek yerine max_spins denemeden sonra None
+        döndürür (çağıran yerel motora düşer).
+        """
+        if self.stale():
+            return None
+        for _ in range(max_spins):
+            seq = _SEQ.unpack_from(self._buf, 8)[0]
+            if seq == 0:
+                return None
+            if seq & 1:
+                continue
+            version = _META.unpack_from(self._buf, 16)[0]
+            if _SEQ.unpack_from(self._buf, 8)[0] == seq:
+                return version
+        return None
+
+    def read(self, max_spins: int = 10_000) -> Optional[Tuple[int, dict]]:
+        """
+        Tutarlı (version, payload) çiftini döndürür; henüz yayın yoksa veya
+        nabız bayatsa None.
+
+        seq değişmediyse önceki çözülmüş yük kopyalanmadan yeniden kullanılır.
+        """
+        if self.stale():
+            return None
+        for _ in range(max_spins):
+            seq = _SEQ.unpack_from(self._buf, 8)[0]
+            if seq == 0:
+                return None
+            if seq == self._cached_seq:
+                return self._cached
+            if seq & 1:
+                continue
+            version, length = _META.unpack_from(self._buf, 16)
+            data = bytes(self._buf[HEADER_SIZE:HEADER_SIZE + length])
+            if _SEQ.unpack_from(self._buf, 8)[0] != seq:
+                continue
+            self._cached_seq = seq
+            self._cached = (version, json.loads(data))
+            return self._cached
+        raise TimeoutError("Snapshot okunamadı: yazar sürekli güncelliyor.")
+
+
+async def engine_payload(engine) -> dict:
+    """Motorun HTTP worker'larının ihtiyaç duyduğu tüm çıktılarını tek yükte toplar."""
+    return {
+        "status": await engine.get_full_status(),
+        "convergence": await engine.calculate_asymptotic_convergence(iterations=100),
+        "asymptote_target": engine.asymptote_target,
+    }
+
+
+async def publish_loop(engine, snapshot: SharedSnapshot, interval: float = 0.5) -> None:
+    """
+    Yayıncı kilidi bu süreçteyse sürüm her değiştiğinde yeniden yayınlar ve her
+    turda nabız yazar; değilse kilidi her turda yeniden dener (yayıncı ölünce devralır).
+    """
+    published = None
+    while True:
+        if snapshot.claim():
+            if engine.state_version != published:
+                published = engine.state_version
+                snapshot.publish(published, await engine_payload(engine))
+            else:
+                snapshot.beat()
+        await asyncio.sleep(interval)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="FAZZ-4 motor snapshot yayıncısı")
+    parser.add_argument("--name", default="fazz4", help="Paylaşımlı bellek segment adı")
+    parser.add_argument("--interval", type=float, default=0.5, help="Sürüm kontrol aralığı (s)")
+    parser.add_argument("--capacity", type=int, default=DEFAULT_CAPACITY)
+    args = parser.parse_args()
+
+    from src.main import military_core
+
+    snapshot = SharedSnapshot.create(args.name, args.capacity)
+    if not snapshot.owner:
+        snapshot.close()
+        parser.error(f"'{args.name}' için başka bir süreç yayıncı kilidini tutuyor.")
+    print(f"[SNAPSHOT] '{args.name}' segmenti yayında ({snapshot.capacity} bayt).")
+    try:
+        asyncio.run(publish_loop(military_core, snapshot, args.interval))
+    except KeyboardInterrupt:
+        print("\n[SNAPSHOT] Yayıncı durduruldu.")
+    finally:
+        snapshot.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+FAZZ-4 API - Server-Sent Events (SSE) Yardımcıları
+
+WebSocket kullanamayan istemciler için simülasyon telemetrisini text/event-stream
+olarak akıtır. Simülasyon adım üreteci tembel (lazy) olarak tüketilir: istemci
+bağlantıyı kestiği anda üreteç kapatılır ve bir sonraki adım hiç hesaplanmaz.
+"""
+import asyncio
+import json
+from typing import AsyncIterator, Iterator, Optional
+
+from fastapi import Request
+
+# Bağlantı kopukluğu kontrolü en az bu kadar adımda bir yapılır (hz=0 modunda).
+DISCONNECT_CHECK_EVERY = 64
+
+
+def format_event(data: dict, event: Optional[str] = None, event_id: Optional[int] = None) -> bytes:
+    """Tek bir SSE olayını satır protokolüne göre kodlar."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.append("data: " + json.dumps(data, separators=(",", ":")))
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+async def stream_frames(request: Request, frames: Iterator[dict], every: int = 1,
+                        hz: float = 10.0, event: str = "frame") -> AsyncIterator[bytes]:
+    """
+    Simülasyon adımlarını seyreltilmiş (decimated) SSE olaylarına dönüştürür.
+
+    Args:
+        request (Request): Bağlantı kopukluğunu izlemek için istek nesnesi.
+        frames (Iterator[dict]): Simülasyonun I/O içermeyen adım üreteci.
+        every (int): Her kaç adımda bir kare gönderileceği. Son adım her zaman gönderilir.
+        hz (float): Saniyedeki en fazla kare sayısı; 0 ise beklemeden akıtılır.
+        event (str): Kare olaylarının SSE olay adı.
+
+    Yields:
+        bytes: Kodlanmış SSE olayları; akış sonunda "end" olayı.
+    """
+    interval = 1.0 / hz if hz > 0 else 0.0
+    pending, sent, step = None, 0, 0
+    try:
+        for step, frame in enumerate(frames, start=1):
+            pending = frame
+            if step % every:
+                if step % DISCONNECT_CHECK_EVERY == 0:
+                    if await request.is_disconnected():
+                        return
+                    await asyncio.sleep(0)
+                continue
+            if await request.is_disconnected():
+                return
+            yield format_event(frame, event, sent)
+            sent += 1
+            pending = None
+            await asyncio.sleep(interval)
+        if pending is not None:
+            yield format_event(pending, event, sent)
+            sent += 1
+        yield format_event({"steps": step, "frames": sent}, "end")
+    finally:
+        close = getattr(frames, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,111 @@
+"""
+FAZZ-4 KOMUT SATIRI (fazz)
+
+Kayıtlı her simülasyon ve kinematik topluluk için tek giriş noktası.
+
+    list : simülasyonları (ve --ensembles ile toplulukları) listeler
+    run  : --headless / --ensemble ile koşuları süreç havuzunda çalıştırır;
+           sonuçlar parçalar tamamlandıkça JSON satırları (JSONL) olarak
+           --out'a akar, ilerleme ve koşu/s stderr'e yazılır. Bayraksız
+           çağrı simülasyonun etkileşimli __main__ demosunu oynatır.
+
+Modülün kendisi yalnızca click ve simülasyon kaydını yükler; NumPy ve
+simülasyon modülleri ilk koşuda içe aktarılır (bkz. benchmarks/startup.py).
+
+Kullanım:
+    python -m src.interfaces.cli list --ensembles
+    python -m src.interfaces.cli run mars_arrival --headless --runs 100000 --workers 8 --seed 1 --out results.jsonl
+    python -m src.interfaces.cli run earth_reentry --ensemble --runs 10000000 --workers 8 --out reentry.jsonl
+    python -m src.interfaces.cli run mars_landing --headless --runs 10000 --cache
+    python -m src.interfaces.cli run fazz9
+"""
+import runpy
+import time
+
+import click
+
+from src.simulation import registry
+
+PROGRESS_INTERVAL = 0.5   # İlerleme satırının en sık güncellenme aralığı (s)
+
+
+@click.group(name="fazz", context_settings={"help_option_names": ["-h", "--help"]})
+def cli() -> None:
+    """FAZZ-4 simülasyonları için toplu koşu aracı."""
+
+
+@cli.command(name="list")
+@click.option("--ensembles", is_flag=True, help="Kinematik toplulukları da listele (NumPy yükler).")
+def list_command(ensembles: bool) -> None:
+    """Kayıtlı simülasyonlar."""
+    for name, info in registry.describe().items():
+        click.echo(f"{name:<22} {info['title']}")
+    if ensembles:
+        from src.services.batch_runs import ensembles as ensemble_names
+
+        click.echo("\nTopluluklar (--ensemble):")
+        for name in ensemble_names():
+            click.echo(f"  {name}")
+
+
+@cli.command()
+@click.argument("simulation")
+@click.option("--headless", is_flag=True, help="Konsol demosu yerine başsız toplu koşu.")
+@click.option("--ensemble", is_flag=True, help="SIMULATION bir kinematik fazdır; vektörel topluluk koşusu.")
+@click.option("--runs", type=click.IntRange(min=1), default=1, show_default=True)
+@click.option("--workers", type=click.IntRange(min=0), default=0, show_default=True,
+              help="Süreç sayısı; 0 veya 1 ise aynı süreçte.")
+@click.option("--seed", type=click.IntRange(min=0), default=0, show_default=True)
+@click.option("--chunk-size", type=click.IntRange(min=1), default=None, help="Parça başına koşu.")
+@click.option("--method", type=click.Choice(["rk4", "dopri"]), default="rk4", show_default=True,
+              help="Topluluk entegrasyon yöntemi.")
+@click.option("--out", type=click.File("w", encoding="utf-8"), default="-", show_default=True,
+              help="JSONL çıktısı ('-' stdout).")
+@click.option("--quiet", is_flag=True, help="stderr ilerleme ve özet satırlarını yazma.")
+@click.option("--cache", "use_cache", is_flag=True,
+              help="Parçaları disk sonuç önbelleğinden oku / oraya yaz (FAZZ4_CACHE_DIR).")
+def run(simulation: str, headless: bool, ensemble: bool, runs: int, workers: int, seed: int,
+        chunk_size, method: str, out, quiet: bool, use_cache: bool) -> None:
+    """SIMULATION'ı koşturur (kayıt adı, modül adı veya fazzN)."""
+    if not (headless or ensemble):
+        if runs > 1 or workers > 1:
+            raise click.UsageError("--runs ve --workers yalnızca --headless veya --ensemble ile kullanılabilir.")
+        try:
+            module = registry.resolve(simulation).qualified_module
+        except KeyError as exc:
+            raise click.BadParameter(exc.args[0], param_hint="SIMULATION") from None
+        runpy.run_module(module, run_name="__main__")
+        return
+
+    from src.infrastructure.result_cache import default_cache
+    from src.services.batch_runs import run_batch
+
+    cache = default_cache() if use_cache else None
+    try:
+        batches = run_batch(simulation, runs, workers, seed, ensemble, chunk_size, method, cache)
+    except KeyError as exc:
+        raise click.BadParameter(exc.args[0], param_hint="SIMULATION") from None
+
+    started = last_report = time.perf_counter()
+    completed = 0
+    for count, lines in batches:
+        out.write(lines)
+        out.flush()
+        completed += count
+        now = time.perf_counter()
+        if not quiet and now - last_report >= PROGRESS_INTERVAL:
+            last_report = now
+            click.echo(f"\r[TOPLU] {completed:,}/{runs:,} koşu · {completed / (now - started):,.0f} koşu/s",
+                       err=True, nl=False)
+    seconds = time.perf_counter() - started
+    if not quiet:
+        click.echo(f"\r[TOPLU] {completed:,} koşu · {seconds:.2f} s · "
+                   f"{completed / max(seconds, 1e-9):,.0f} koşu/s -> {out.name}", err=True)
+
+
+def main(argv=None) -> None:
+    cli.main(args=argv, prog_name="fazz")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,22 @@ Anayasa Referansları: Madde 2.1, Madde 8.3, Madde 12.1
 """
 import asyncio
 import math
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
+from src.infrastructure.result_cache import cache_key, default_cache
+from src.infrastructure.shared_cache import default_shared_cache
+from src.interfaces.api.admission import AdmissionController
+from src.interfaces.api.http_cache import PreSerializedResponseCache
+from src.interfaces.api.routes import propulsion, results, sessions, surrogates, telemetry, trajectories
+from src.interfaces.api.shared_snapshot import SharedSnapshot, engine_payload, publish_loop
+
 # --- ANASAYA MADDE 2.1: KATMANLI MİMARİ - DOMAIN & APPLICATION AYRIMI ---
 # Domain Layer (Çekirdek Motor) ve Application Layer (API Modelleri) burada tanımlanır.
 
@@ -37,6 +47,18 @@ class MilitaryCoreEngine:
         self.transistor = TransistorConfig()
         self.target_efficiency = 0.35
         self.asymptote_target = 0.99
+        # Durum sürümü: motor parametreleri her değiştiğinde artar.
+        # API önbellekleri bu sayaç değişmedikçe hazır yanıtları yeniden kullanır.
+        self.state_version = 0
+
+    def update_parameters(self, **changes) -> int:
+        """Motor parametrelerini günceller ve yeni durum sürümünü döndürür."""
+        for name, value in changes.items():
+            if not hasattr(self, name):
+                raise AttributeError(f"Bilinmeyen motor parametresi: {name}")
+            setattr(self, name, value)
+        self.state_version += 1
+        return self.state_version
 
     async def get_full_status(self) -> dict:
         input_power = 100.0
@@ -53,13 +75,53 @@ class MilitaryCoreEngine:
         tau = 10.0
         return [{"iteration": n, "efficiency": self.asymptote_target * (1 - math.exp(-n / tau)), "distance_from_target": abs(self.asymptote_target - (self.asymptote_target * (1 - math.exp(-n / tau))))} for n in range(iterations)]
 
+    async def calculate_convergence_batch(self, queries: List[dict]) -> List[dict]:
+        """
+        Birden çok (iterations, tau, target) parametre setini tek vektörel çağrıda değerlendirir.
+        target verilmeyen sorgular motorun asimptot hedefini kullanır.
+        """
+        # CPU yoğun kısım olay döngüsünü bloklamasın diye iş parçacığı havuzunda çalışır.
+        return await asyncio.to_thread(self._convergence_batch, queries)
+
+    def _convergence_batch(self, queries: List[dict]) -> List[dict]:
+        from src.core.asymptote import convergence_curves   # NumPy ilk hesapta yüklenir (soğuk başlangıç)
+
+        targets = [q.get("target") or self.asymptote_target for q in queries]
+        curves = convergence_curves(targets, [q["tau"] for q in queries], [q["iterations"] for q in queries])
+        return [
+            {"target_asymptote": target, "tau": query["tau"], "convergence_points": [
+                {"iteration": int(n), "efficiency": e, "distance_from_target": d}
+                for n, e, d in zip(curve["iteration"].tolist(), curve["efficiency"].tolist(), curve["distance_from_target"].tolist())
+            ]}
+            for target, query, curve in zip(targets, queries, curves)
+        ]
+
+    async def calculate_convergence_horizon(self, queries: List[dict]) -> List[dict]:
+        """
+        Her (epsilon, tau, target) sorgusu için uzaklığın epsilon'a indiği iterasyonu döndürür.
+        Eğri üretilmez; çözüm analitiktir (n = tau · ln(target / epsilon)).
+        """
+        from src.core.asymptote import iterations_to_epsilon
+
+        targets = [q.get("target") or self.asymptote_target for q in queries]
+        taus = [q["tau"] for q in queries]
+        epsilons = [q["epsilon"] for q in queries]
+        solved = iterations_to_epsilon(targets, taus, epsilons)
+        return [
+            {"target_asymptote": target, "tau": tau, "epsilon": epsilon, "iteration": n, "iterations_exact": exact}
+            for target, tau, epsilon, n, exact in zip(targets, taus, epsilons, solved["iteration"].tolist(),
+                                                      solved["iterations_exact"].tolist())
+        ]
+
 # --- Presentation Layer: API Modelleri (OpenAPI spesifikasyonuna göre) ---
 
 class MilitaryCoreStatus(BaseModel):
     system_status: str = Field(..., example="OPTIMIZED")
     asymptote: float = Field(..., example=0.99)
     thermal_efficiency_boost_percent: int = Field(..., example=35)
-    timestamp: datetime
+    # Gövde durum sürümü başına bir kez kurulup ETag ile önbelleklenir; bu alan yanıt
+    # anını değil kurulum anını verir. Yanıt anı her yanıttaki Date başlığındadır.
+    built_at: datetime = Field(..., description="Gövdenin kurulduğu an (UTC)")
 
 class EfficiencyMetrics(BaseModel):
     input_power_watts: float = Field(..., example=100.0)
@@ -89,42 +151,277 @@ class AsymptoticConvergence(BaseModel):
     target_asymptote: float = Field(..., example=0.99)
     convergence_points: List[ConvergencePoint]
 
+class MilitarySnapshot(BaseModel):
+    """Kokpit karesi için tek yanıtta toplanan bölümler (yalnızca istenenler döner)."""
+    status: Optional[MilitaryCoreStatus] = None
+    efficiency: Optional[EfficiencyMetrics] = None
+    transistor: Optional[TransistorState] = None
+    motor: Optional[MotorOptimization] = None
+    convergence: Optional[AsymptoticConvergence] = None
+
+class ConvergenceQuery(BaseModel):
+    iterations: int = Field(100, ge=1, le=10_000)
+    tau: float = Field(10.0, gt=0)
+    target: Optional[float] = Field(None, gt=0, description="Boş bırakılırsa motorun asimptot hedefi kullanılır.")
+
+class ConvergenceBatchRequest(BaseModel):
+    queries: List[ConvergenceQuery] = Field(..., min_length=1, max_length=64)
+
+class ConvergenceCurve(AsymptoticConvergence):
+    tau: float
+
+class ConvergenceBatchResponse(BaseModel):
+    results: List[ConvergenceCurve]
+
+# Ufuk sorgularının üst sınırları; kalan taşmalar (ör. target / ε → inf) çekirdekte reddedilir (422)
+MAX_HORIZON_TAU = 1e12
+MAX_HORIZON_TARGET = 1e12
+
+class HorizonQuery(BaseModel):
+    epsilon: float = Field(..., gt=0, example=1e-3, description="Hedefe istenen en büyük uzaklık.")
+    tau: float = Field(10.0, gt=0, le=MAX_HORIZON_TAU)
+    target: Optional[float] = Field(None, gt=0, le=MAX_HORIZON_TARGET,
+                                    description="Boş bırakılırsa motorun asimptot hedefi kullanılır.")
+
+class HorizonRequest(BaseModel):
+    queries: List[HorizonQuery] = Field(..., min_length=1, max_length=10_000)
+
+class ConvergenceHorizon(BaseModel):
+    target_asymptote: float = Field(..., example=0.99)
+    tau: float = Field(..., example=10.0)
+    epsilon: float = Field(..., example=1e-3)
+    iteration: int = Field(..., example=69, description="distance_from_target <= epsilon olan ilk iterasyon.")
+    iterations_exact: float = Field(..., example=68.977)
+
+class HorizonResponse(BaseModel):
+    results: List[ConvergenceHorizon]
+
 
 # --- API Sunucusu ve Rotalar ---
 
+# Çoklu worker modu: FAZZ4_SHARED_SNAPSHOT ayarlıysa motor çıktıları paylaşımlı
+# bellekten okunur. Yayıncı kilidini alan worker yayınlar; o çıkınca diğeri devralır.
+shared_snapshot: Optional[SharedSnapshot] = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global shared_snapshot
+    publisher = None
+    segment_name = os.environ.get("FAZZ4_SHARED_SNAPSHOT")
+    if segment_name:
+        shared_snapshot = SharedSnapshot.attach_or_create(segment_name)
+        publisher = asyncio.create_task(publish_loop(military_core, shared_snapshot))
+    yield
+    if publisher is not None:
+        publisher.cancel()
+    if shared_snapshot is not None:
+        shared_snapshot.close()
+        shared_snapshot = None
+    await sessions.close_sessions()
+    await results.close_store()
+    await shared_cache.close()
+
 app = FastAPI(
     title="FAZZ-4 Military Core API",
     version="1.0.0-alpha",
     description="FAZZ-4 Military Core protokolünün durumunu, verimlilik metriklerini ve operasyonel parametrelerini sunan resmi API.",
     contact={"name": "Mimar Emrah Uzuçar, CEO", "email": "admin@blueline-arch.company"},
+    lifespan=lifespan,
 )
 
+app.include_router(telemetry.router)
+app.include_router(trajectories.router)
+app.include_router(propulsion.router)
+app.include_router(results.router)
+app.include_router(surrogates.router)
+app.include_router(sessions.router)
+
 military_core = MilitaryCoreEngine()
+response_cache = PreSerializedResponseCache()
+# Örnekler arası önbellek (FAZZ4_REDIS_URL); anahtarlar yerel state_version'a değil
+# motor parametrelerine bağlıdır ki aynı parametreli örnekler sonucu paylaşsın.
+shared_cache = default_shared_cache()
+
+# --- Kabul Kontrolü: Ağır rota sınıfları kendi semaforu ve kuyruk sınırıyla korunur ---
+ADMISSION_LIMITS = {
+    "convergence": {"max_concurrency": 4, "max_queue": 32, "max_wait_s": 2.0},
+    "snapshot": {"max_concurrency": 16, "max_queue": 128, "max_wait_s": 1.0},
+}
+admission = AdmissionController(ADMISSION_LIMITS)
+admission.register(surrogates.fallback_limiter)
+
+# --- Motor Durumu Kaynağı: yerel motor veya paylaşımlı bellek snapshot'ı ---
+
+def _engine_fingerprint() -> str:
+    return cache_key("military_core", 1, {
+        "asymptote_target": military_core.asymptote_target,
+        "target_efficiency": military_core.target_efficiency,
+        "i_ceo_leakage": military_core.transistor.i_ceo_leakage,
+    })
+
+def _state_version():
+    if shared_snapshot is not None and not shared_snapshot.owner:
+        version = shared_snapshot.version()
+        if version is not None:
+            return ("shared", version)
+    return military_core.state_version
+
+async def _engine_state() -> dict:
+    if shared_snapshot is not None and not shared_snapshot.owner:
+        try:
+            published = shared_snapshot.read()
+        except TimeoutError:
+            # Yayıncı yazım ortasında kaldı (seq tek): yerel motora düş
+            published = None
+        if published is not None:
+            return published[1]
+    return await shared_cache.get_or_compute(f"engine:{_engine_fingerprint()}",
+                                             lambda: engine_payload(military_core))
+
+# --- Yanıt Kurucuları: Durum sürümü başına bir kez doğrulanır ve serileştirilir ---
+
+async def _build_status() -> MilitaryCoreStatus:
+    state = await _engine_state()
+    return MilitaryCoreStatus(**state["status"], built_at=datetime.utcnow())
+
+async def _build_efficiency() -> EfficiencyMetrics:
+    state = await _engine_state()
+    return EfficiencyMetrics(**state["status"]["efficiency"])
+
+async def _build_transistor() -> TransistorState:
+    state = await _engine_state()
+    return TransistorState(**state["status"]["transistor"])
+
+async def _build_motor() -> MotorOptimization:
+    state = await _engine_state()
+    return MotorOptimization(**state["status"]["motor"])
+
+async def _build_convergence() -> AsymptoticConvergence:
+    state = await _engine_state()
+    return AsymptoticConvergence(target_asymptote=state["asymptote_target"], convergence_points=state["convergence"])
+
+async def _cached_response(request: Request, key: str, build) -> Response:
+    entry = await response_cache.get(key, _state_version(), build)
+    return response_cache.respond(request, entry)
 
 @app.get("/military/status", response_model=MilitaryCoreStatus, tags=["military-core"])
-async def get_military_status():
-    status = await military_core.get_full_status()
-    return {**status, "timestamp": datetime.utcnow()}
+async def get_military_status(request: Request):
+    return await _cached_response(request, "status", _build_status)
 
 @app.get("/military/efficiency", response_model=EfficiencyMetrics, tags=["military-core"])
-async def get_efficiency_metrics():
-    status = await military_core.get_full_status()
-    return status["efficiency"]
+async def get_efficiency_metrics(request: Request):
+    return await _cached_response(request, "efficiency", _build_efficiency)
 
 @app.get("/military/transistor", response_model=TransistorState, tags=["military-core"])
-async def get_transistor_config():
-    status = await military_core.get_full_status()
-    return status["transistor"]
+async def get_transistor_config(request: Request):
+    return await _cached_response(request, "transistor", _build_transistor)
 
 @app.get("/military/motor", response_model=MotorOptimization, tags=["military-core"])
-async def get_motor_optimization():
-    status = await military_core.get_full_status()
-    return status["motor"]
+async def get_motor_optimization(request: Request):
+    return await _cached_response(request, "motor", _build_motor)
 
+# Önbellekli GET rotalarında kabul kontrolü yalnızca ıskadaki kurulumu korur;
+# hazır gövdeler ve 304 yanıtları semafor kuyruğuna girmez.
 @app.get("/military/convergence", response_model=AsymptoticConvergence, tags=["military-core"])
-async def get_asymptotic_convergence():
-    points = await military_core.calculate_asymptotic_convergence(iterations=100)
-    return {"target_asymptote": military_core.asymptote_target, "convergence_points": points}
+async def get_asymptotic_convergence(request: Request):
+    return await _cached_response(request, "convergence", admission.wrap("convergence", _build_convergence))
+
+SNAPSHOT_SECTIONS = {
+    "status": _build_status,
+    "efficiency": _build_efficiency,
+    "transistor": _build_transistor,
+    "motor": _build_motor,
+    "convergence": _build_convergence,
+}
+
+@app.get("/military/snapshot", response_model=MilitarySnapshot, tags=["military-core"])
+async def get_military_snapshot(
+    request: Request,
+    sections: str = Query(",".join(SNAPSHOT_SECTIONS), description="Virgülle ayrılmış bölüm listesi"),
+):
+    names = list(dict.fromkeys(name.strip() for name in sections.split(",") if name.strip()))
+    unknown = [name for name in names if name not in SNAPSHOT_SECTIONS]
+    if unknown or not names:
+        raise HTTPException(status_code=422, detail=f"Geçersiz bölüm: {unknown or sections!r}. Seçenekler: {list(SNAPSHOT_SECTIONS)}")
+    version = _state_version()
+    parts = {name: await response_cache.get(name, version, admission.wrap("snapshot", SNAPSHOT_SECTIONS[name]))
+             for name in names}
+    entry = response_cache.compose("snapshot:" + ",".join(names), version, parts)
+    return response_cache.respond(request, entry)
+
+@app.post("/military/convergence/batch", response_model=ConvergenceBatchResponse, tags=["military-core"],
+          dependencies=[Depends(admission.guard("convergence"))])
+async def get_convergence_batch(batch: ConvergenceBatchRequest):
+    queries = [query.model_dump() for query in batch.queries]
+    for query in queries:
+        query["target"] = query["target"] or military_core.asymptote_target
+    keys = [f"convergence:{cache_key('convergence', 1, query)}" for query in queries]
+    # Tek gidiş-dönüşte toplu okuma; yalnızca eksik sorgular tek vektörel çağrıda hesaplanır
+    found = await shared_cache.get_many(keys)
+    missing = [index for index, key in enumerate(keys) if key not in found]
+    if missing:
+        computed = await _disk_cached("convergence", [queries[index] for index in missing],
+                                      military_core.calculate_convergence_batch)
+        fresh = {keys[index]: curve for index, curve in zip(missing, computed)}
+        await shared_cache.set_many(fresh)
+        found.update(fresh)
+    return {"results": [found[key] for key in keys]}
+
+async def _disk_cached(simulation: str, queries: List[dict], compute) -> List[dict]:
+    """
+    Sorgu başına disk sonuç önbelleği (FAZZ4_CACHE=off ise doğrudan compute).
+    Yalnızca ıskalanan sorgular tek çağrıda hesaplanır; disk G/Ç iş parçacığında yapılır.
+    """
+    cache = default_cache()
+    if cache is None:
+        return await compute(queries)
+    keys = [cache_key(simulation, 1, query) for query in queries]
+    results = await asyncio.to_thread(lambda: [cache.get(key) for key in keys])
+    missing = [index for index, result in enumerate(results) if result is None]
+    if missing:
+        computed = await compute([queries[index] for index in missing])
+        await asyncio.to_thread(lambda: [cache.put(keys[index], result) for index, result in zip(missing, computed)])
+        for index, result in zip(missing, computed):
+            results[index] = result
+    return results
+
+async def _horizon(queries: List[dict]) -> List[dict]:
+    for query in queries:
+        query["target"] = query["target"] or military_core.asymptote_target
+    try:
+        return await _disk_cached("convergence_horizon", queries, military_core.calculate_convergence_horizon)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+@app.get("/military/convergence/horizon", response_model=ConvergenceHorizon, tags=["military-core"])
+async def get_convergence_horizon(
+    epsilon: float = Query(..., gt=0, description="Hedefe istenen en büyük uzaklık"),
+    tau: float = Query(10.0, gt=0, le=MAX_HORIZON_TAU),
+    target: Optional[float] = Query(None, gt=0, le=MAX_HORIZON_TARGET),
+):
+    results = await _horizon([{"epsilon": epsilon, "tau": tau, "target": target}])
+    return results[0]
+
+@app.post("/military/convergence/horizon", response_model=HorizonResponse, tags=["military-core"])
+async def get_convergence_horizon_batch(batch: HorizonRequest):
+    results = await _horizon([query.model_dump() for query in batch.queries])
+    return {"results": results}
+
+@app.get("/system/admission", tags=["system"])
+async def get_admission_stats():
+    """Rota sınıfı başına kabul, red ve kuyruk bekleme istatistikleri."""
+    return admission.stats()
+
+@app.get("/system/cache", tags=["system"])
+async def get_result_cache_stats():
+    """Disk sonuç önbelleğinin boyut ve isabet istatistikleri."""
+    cache = default_cache()
+    return cache.stats() if cache is not None else {"enabled": False}
+
+@app.get("/system/shared-cache", tags=["system"])
+async def get_shared_cache_stats():
+    """L1 / paylaşımlı (Redis veya bellek içi) önbellek isabetleri ve tıkanma kilidi beklemeleri."""
+    return shared_cache.stats()
 
 # Bu kod bir sunucuda `uvicorn src.main:app --reload` komutu ile çalıştırıldığında,
 # http://127.0.0.1:8000/docs adresinde interaktif Swagger UI dokümantasyonu otomatik olarak oluşacaktır.
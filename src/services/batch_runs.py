@@ -0,0 +1,310 @@
+"""
+FAZZ-4 TOPLU KOŞULAR (Headless batch runs)
+
+Her fazzN betiğinin __main__ demosu uyuyan ve konsola yazan etkileşimli bir
+gösteridir; gece boyu süren bir çalışma için işe yaramaz. Burada kayıtlı her
+simülasyonun başsız (headless) bir koşucusu vardır: tohum -> tek koşunun
+özet sözlüğü. Koşucular uyumaz, yazdırmaz ve global rastgeleliğe dokunmaz;
+mevcut saf çekirdekleri (cruise_trajectory, suicide_burn_frames,
+reentry_frames, run_event_driven, ...) kullanır.
+
+Kaynaklar:
+    simülasyon : RUNNERS (registry adları) — koşu başına bir kayıt
+    topluluk   : src.simulation.dynamics fazları — parça başına tek vektörel
+                 entegrasyon, koşu başına bir kayıt
+
+Koşular parçalara bölünür ve süreç havuzunda çalışır. Kayıtlar işçide
+JSON satırlarına çevrilir (serileştirme de paralel) ve parçalar tamamlandıkça
+sırasız verilir; her kayıt "run" indisini taşır. Havada en fazla 2·workers
+parça bulunur, bellek toplam koşu sayısından bağımsızdır.
+
+Tohumlar:
+    simülasyon : koşu i'nin tohumu (seed, i) çiftinin blake2b özetinden
+                 türetilir; sonuç parça boyutundan ve işçi sayısından bağımsızdır.
+    topluluk   : parça k, src.infrastructure.export.phase_chunks ile aynı
+                 (seed, k) alt tohumunu kullanır; (seed, chunk_size) ile
+                 tekrarlanabilir.
+
+Önbellek:
+    cache (ResultCache; CLI'da --cache) verilirse her parçanın JSON satırları
+    (ad, parça düzeni, tohum) anahtarıyla disk sonuç önbelleğinden okunur /
+    oraya yazılır; yalnızca ıskalanan parçalar havuza gönderilir.
+
+CLI: python -m src.interfaces.cli run mars_arrival --headless --runs 100000 --workers 8
+"""
+import hashlib
+import json
+import math
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.infrastructure.result_cache import cache_key
+from src.simulation import registry
+
+BATCH_CACHE_VERSION = 1   # Koşucuların kayıt biçimi değişince artırılır (topluluklar dynamics.PHASE_VERSION'ı da kullanır)
+MAX_SIMULATION_CHUNK = 1_000
+DEFAULT_ENSEMBLE_CHUNK = 100_000
+
+
+# --- Başsız koşucular: tohum -> özet (süreç havuzunda çalışır; modül düzeyinde olmalı) ---
+
+def _hyperscale_mars(seed: int) -> dict:
+    from src.simulation.fazz4_hyperscale_mars import cruise_trajectory
+
+    track = cruise_trajectory(seed=seed)
+    return {"cycles": int(track["cycle"][-1]), "distance_km": float(track["distance_km"][-1]),
+            "integrity": float(track["integrity"][-1]), "energy": float(track["energy"][-1])}
+
+
+def _chernobyl_harvest(seed: int) -> dict:
+    # run_harvest ile aynı 50 döngü
+    return registry.create("chernobyl_harvest").run_harvest_chunked(total_cycles=50, seed=seed)
+
+
+def _gadolinium_h2(seed: int) -> dict:
+    return registry.create("gadolinium_h2").run_reactor_event_driven(seed=seed)
+
+
+def _metallurgy_ignition(seed: int) -> dict:
+    from src.core.propulsion import alloy_composition, ignition_steps
+
+    lab = registry.create("metallurgy_ignition")
+    alloy = alloy_composition(lab.n_observer)
+    steps = list(ignition_steps(lab.fuel_tank, alloy.alloy_integrity, rng=random.Random(seed)))
+    return {"alloy_code": alloy.alloy_code, "alloy_integrity": alloy.alloy_integrity,
+            "burn_seconds": len(steps), "thrust_total": sum(step.thrust for step in steps),
+            "peak_thrust": max((step.thrust for step in steps), default=0.0)}
+
+
+def _starship_yard(seed: int) -> dict:
+    # FAZZ-7: assemble_hull (4 bölüm) ve alignment_check döngüleri
+    rng = random.Random(seed)
+    yard = registry.create("starship_yard")
+    integrity = sum((yard.N_OBSERVER + 1) * rng.uniform(980, 1020) for _ in range(4))
+    alignment, alignment_steps = 0, 0
+    while alignment < 100:
+        alignment += rng.randint(5, 15)
+        alignment_steps += 1
+    return {"alloy_code": yard.alloy_code, "ship_integrity": integrity, "alignment_steps": alignment_steps}
+
+
+def _launch_control(seed: int) -> dict:
+    # Tırmanış rastgelelik içermez; tohum yalnızca kayıt biçimini korur
+    from src.simulation.fazz8_launch_control import ascent_frames
+
+    frame = {"step": 0, "altitude_km": 0.0, "velocity_kmh": 0.0, "g_force": 1.0, "stage": None}
+    for frame in ascent_frames():
+        pass
+    return frame
+
+
+def _trans_mars_injection(seed: int) -> dict:
+    # FAZZ-9: alignment_check + execute_burn (kaçış hızının 1.5 katına kadar)
+    rng = random.Random(seed)
+    tmi = registry.create("trans_mars_injection")
+    alignment, alignment_steps = 0, 0
+    while alignment < 100:
+        alignment += rng.randint(5, 15)
+        alignment_steps += 1
+    burn_seconds = 0
+    while tmi.current_velocity < tmi.escape_velocity * 1.5:
+        burn_seconds += 1
+        tmi.current_velocity += (tmi.fuel_pressure * 100) + (burn_seconds * 50)
+    return {"alignment_steps": alignment_steps, "burn_seconds": burn_seconds,
+            "velocity_kmh": tmi.current_velocity}
+
+
+def _mars_arrival(seed: int) -> dict:
+    from src.simulation.fazz10_mars_arrival import suicide_burn_frames
+
+    frame = None
+    for frame in suicide_burn_frames(rng=random.Random(seed)):
+        pass
+    return frame
+
+
+def _mars_landing(seed: int) -> dict:
+    # Özgün giriş döngüsü 10 km'ye inmez; landing_estimation'ın varsayımsal
+    # ENTRY_TICKS girişini koşturur (kayıt entry_ticks'i taşır).
+    import numpy as np
+
+    from src.services.landing_estimation import LandingScenario
+    from src.simulation.fazz11_mars_landing import entry_peak_temperature
+
+    scenario = LandingScenario()
+    u = np.random.default_rng(seed).uniform(size=(1, scenario.entry_ticks))
+    peak = float(entry_peak_temperature(u, scenario.start_temp)[0])
+    fuel = scenario.fuel_remaining()
+    return {"entry_ticks": scenario.entry_ticks, "peak_hull_temp_c": peak, "fuel_pct": fuel,
+            "success": peak < scenario.hull_limit_c and fuel > 0}
+
+
+def _mars_colonization(seed: int) -> dict:
+    result = registry.create("mars_colonization").run_event_driven(seed=seed)
+    result.pop("day_reports")
+    return result
+
+
+def _earth_return(seed: int) -> dict:
+    # FAZZ-13: kalkış (5 × %0.5), 6 günlük seyir (6 × %5), atmosferik giriş
+    from src.simulation.fazz13_earth_return import reentry_frames
+
+    home = registry.create("earth_return")
+    fuel = home.fuel - 5 * 0.5 - 6 * 5.0
+    max_temp, critical = 0, 0
+    for frame in reentry_frames(100000, rng=random.Random(seed)):
+        max_temp = frame["max_temp_c"]
+        critical += frame["hull_critical"]
+    return {"fuel_pct": fuel, "reentry_max_temp_c": max_temp, "critical_frames": critical}
+
+
+def _gemini3_pilot(seed: int) -> dict:
+    # flight_sim döngüsü; sistem olayları yalnızca konsol metnidir
+    rng = random.Random(seed)
+    pilot = registry.create("gemini3_pilot")
+    while pilot.distance_traveled < pilot.TARGET_DIST:
+        pilot.cycle += 1
+        boost = rng.uniform(1.0, 1.5) if pilot.cycle % 5 == 0 else 1.0
+        step_dist = pilot.C * 500 * boost
+        pilot.distance_traveled += step_dist
+        pilot.total_energy += (step_dist * 0.00001) * rng.random()
+    return {"cycles": pilot.cycle, "distance_km": pilot.distance_traveled,
+            "integrity": (pilot.distance_traveled / 1000) * (pilot.N_OBSERVER + 1),
+            "total_energy": pilot.total_energy}
+
+
+RUNNERS: Dict[str, Callable[[int], dict]] = {
+    "hyperscale_mars": _hyperscale_mars,
+    "chernobyl_harvest": _chernobyl_harvest,
+    "gadolinium_h2": _gadolinium_h2,
+    "metallurgy_ignition": _metallurgy_ignition,
+    "starship_yard": _starship_yard,
+    "launch_control": _launch_control,
+    "trans_mars_injection": _trans_mars_injection,
+    "mars_arrival": _mars_arrival,
+    "mars_landing": _mars_landing,
+    "mars_colonization": _mars_colonization,
+    "earth_return": _earth_return,
+    "gemini3_pilot": _gemini3_pilot,
+}
+
+
+def ensembles() -> List[str]:
+    """Topluluk olarak koşturulabilen kinematik fazlar (NumPy yükler)."""
+    from src.simulation.dynamics import PHASES
+
+    return list(PHASES)
+
+
+def run_seed(seed: int, run: int) -> int:
+    """Koşu run'ın 64 bitlik tohumu; parça düzeninden bağımsızdır."""
+    digest = hashlib.blake2b(f"{seed}:{run}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _dumps(record: dict) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+def _simulation_chunk(name: str, start: int, size: int, seed: int) -> Tuple[int, str]:
+    runner = RUNNERS[name]
+    lines = [_dumps({"simulation": name, "run": run, **runner(run_seed(seed, run))})
+             for run in range(start, start + size)]
+    return size, "".join(line + "\n" for line in lines)
+
+
+def _ensemble_chunk(name: str, start: int, size: int, seed: int, index: int, method: str) -> Tuple[int, str]:
+    from src.simulation.dynamics import PHASES, simulate_phase
+
+    result = simulate_phase(name, n_runs=size, seed=(seed, index), method=method)
+    columns = {"duration": result.t.tolist(), "steps": result.steps.tolist()}
+    columns.update(zip(PHASES[name].state_names, result.y.T.tolist()))
+    lines = [_dumps({"ensemble": name, "run": start + row, **{key: values[row] for key, values in columns.items()}})
+             for row in range(size)]
+    return size, "".join(line + "\n" for line in lines)
+
+
+def run_batch(name: str, runs: int, workers: int = 0, seed: int = 0, ensemble: bool = False,
+              chunk_size: Optional[int] = None, method: str = "rk4", cache=None) -> Iterator[Tuple[int, str]]:
+    """
+    Bir simülasyonu veya topluluğu runs kez koşturur.
+
+    Args:
+        name (str): Kayıt adı, modül adı veya FAZZ numarası; ensemble=True iken
+            dynamics.PHASES içindeki faz adı.
+        runs (int): Koşu sayısı.
+        workers (int): Süreç sayısı; 0 veya 1 ise aynı süreçte çalışır.
+        seed (int): Kök tohum (negatif olmamalı).
+        ensemble (bool): Kinematik fazı vektörel topluluk olarak koştur.
+        chunk_size (int): Parça başına koşu; verilmezse işçi başına ~8 parça
+            (simülasyon, en fazla MAX_SIMULATION_CHUNK) veya DEFAULT_ENSEMBLE_CHUNK.
+        method (str): Topluluk entegrasyon yöntemi ("rk4" veya "dopri").
+        cache (ResultCache): Verilirse parçalar disk önbelleğinden okunur / oraya yazılır.
+
+    Returns:
+        Iterator[Tuple[int, str]]: Tamamlanan her parça için (koşu sayısı,
+        JSON satırları); tamamlanma sırasıyla.
+
+    Raises:
+        KeyError: Simülasyon veya faz bilinmiyorsa (üreteç oluşturulurken).
+        ValueError: runs, seed veya chunk_size geçersizse.
+    """
+    if runs < 0 or seed < 0 or (chunk_size is not None and chunk_size < 1):
+        raise ValueError("runs ve seed negatif, chunk_size sıfır olamaz.")
+    if ensemble:
+        if name not in ensembles():
+            raise KeyError(f"Topluluk bilinmiyor: {name!r} (geçerli: {', '.join(ensembles())})")
+        from src.simulation.dynamics import PHASE_VERSION
+
+        chunk_size = chunk_size or DEFAULT_ENSEMBLE_CHUNK
+        tasks = [(_ensemble_chunk, (name, start, min(chunk_size, runs - start), seed, index, method))
+                 for index, start in enumerate(range(0, runs, chunk_size))]
+        namespace, version = f"batch:ensemble:{name}", f"{BATCH_CACHE_VERSION}.{PHASE_VERSION}"
+    else:
+        name = registry.resolve(name).name
+        chunk_size = chunk_size or max(1, min(MAX_SIMULATION_CHUNK, math.ceil(runs / (max(workers, 1) * 8))))
+        tasks = [(_simulation_chunk, (name, start, min(chunk_size, runs - start), seed))
+                 for start in range(0, runs, chunk_size)]
+        namespace, version = f"batch:{name}", BATCH_CACHE_VERSION
+    if cache is None:
+        return (result for _, result in _execute([(function, args, None) for function, args in tasks], workers))
+    return _cached(tasks, workers, cache, namespace, version, method if ensemble else None)
+
+
+def _cached(tasks: list, workers: int, cache, namespace: str, version, method: Optional[str]
+            ) -> Iterator[Tuple[int, str]]:
+    todo = []
+    for function, args in tasks:
+        # args: (name, start, size, seed, ...); satırlar parça düzeni ve tohumla belirlenir
+        key = cache_key(namespace, version, {"start": args[1], "size": args[2], "method": method}, args[3])
+        hit = cache.get(key)
+        if hit is None:
+            todo.append((function, args, key))
+        else:
+            yield hit["count"], hit["lines"]
+    for key, (count, lines) in _execute(todo, workers):
+        cache.put(key, {"count": count, "lines": lines})
+        yield count, lines
+
+
+def _execute(tasks: list, workers: int) -> Iterator[Tuple[Optional[str], Tuple[int, str]]]:
+    """(işlev, argümanlar, etiket) görevlerini koşturur; (etiket, sonuç) çiftlerini tamamlanma sırasıyla verir."""
+    if workers <= 1 or len(tasks) <= 1:
+        for function, args, tag in tasks:
+            yield tag, function(*args)
+        return
+    queue = iter(tasks)
+    with ProcessPoolExecutor(workers) as pool:
+        pending = {}
+        for function, args, tag in queue:
+            pending[pool.submit(function, *args)] = tag
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+                task = next(queue, None)
+                if task is not None:
+                    pending[pool.submit(task[0], *task[1])] = task[2]
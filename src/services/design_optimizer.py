@@ -0,0 +1,272 @@
+"""
+FAZZ-6 ALAŞIM / ATEŞLEME TASARIM OPTİMİZASYONU
+
+DerzzPropulsionLab n_observer=12 ve burn_rate=250 sabitleriyle çalışır. Bu
+modül (n_observer, burn_rate, fuel_tank) uzayını toplu (batched) olarak arar
+ve kısıtlar altında beklenen toplam itkiyi en büyükler.
+
+Amaç:
+    thrust_total kapalı biçimdedir (src.core.propulsion) ve rastgelelikten
+    bağımsızdır; rastgele olan, saniyelik yanma dalgalanmasına bağlı yanma
+    süresi ve saniyelik en yüksek itkidir. Kısıtı (yanma süresi penceresi,
+    yapısal itki sınırı) ihlal eden ateşleme iptal edilir ve itki üretmez:
+
+        E[itki] = thrust_total · P(burn_seconds <= max_burn_seconds
+                                   ve peak_thrust <= max_peak_thrust)
+
+    Olasılık her aday için vektörel Monte Carlo ile (ignition_monte_carlo)
+    kestirilir; aday grupları süreç havuzuna dağıtılır.
+
+Arama: tam kovaryanslı çapraz entropi yöntemi (CEM). Her nesilde population
+aday örneklenir, en iyi elite_frac oranı dağılımı (yumuşatılarak) günceller. En iyi değer patience nesil
+boyunca rel_tol'dan fazla iyileşmezse veya dağılım daralırsa arama erken
+durur. En iyi aday bağımsız tohumla final_samples örnekle yeniden
+değerlendirilir; güven aralıkları bu değerlendirmeden (Wilson) gelir.
+
+CLI:
+    python -m src.services.design_optimizer --population 64 --samples 2048 --workers 4
+"""
+import argparse
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.propulsion import BASE_BURN_RATE, alloy_composition, ignition_monte_carlo, total_thrust
+
+Z_95 = 1.959963984540054
+# Tohum akışları: (seed, akış, ...) — arama, CEM örneklemesi ve final değerlendirme birbirinden bağımsız
+SEARCH_STREAM, CEM_STREAM, FINAL_STREAM, BASELINE_STREAM = range(4)
+
+
+@dataclass(frozen=True)
+class DesignSpace:
+    """Arama sınırları (uçlar dahil). n_observer tam sayıya yuvarlanır."""
+    n_observer: Tuple[int, int] = (1, 64)
+    burn_rate: Tuple[float, float] = (50.0, 1000.0)
+    fuel_tank: Tuple[float, float] = (1000.0, 10000.0)
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return ("n_observer", "burn_rate", "fuel_tank")
+
+    def bounds(self) -> np.ndarray:
+        return np.array([self.n_observer, self.burn_rate, self.fuel_tank], dtype=float)
+
+
+@dataclass(frozen=True)
+class Constraints:
+    """
+    Ateşleme kısıtları.
+
+    Attributes:
+        max_burn_seconds (int): Yanma bu süreyi aşarsa manevra penceresi kaçar.
+        max_peak_thrust (float): Saniyelik itkinin yapısal üst sınırı (kN).
+    """
+    max_burn_seconds: int = 35
+    max_peak_thrust: float = 3000.0
+
+
+@dataclass
+class Evaluation:
+    """Bir adayın Monte Carlo değerlendirmesi."""
+    params: Dict[str, float]
+    thrust_total: float
+    feasible_rate: float
+    expected_thrust: float
+    n_samples: int
+
+    def interval(self, z: float = Z_95) -> Dict[str, Tuple[float, float]]:
+        """Olurluk oranı için Wilson aralığı ve bunun beklenen itkiye ölçeklenmesi."""
+        n, p = self.n_samples, self.feasible_rate
+        center = (p + z * z / (2 * n)) / (1 + z * z / n)
+        half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+        low, high = max(0.0, center - half), min(1.0, center + half)
+        return {"feasible_rate": (low, high),
+                "expected_thrust": (self.thrust_total * low, self.thrust_total * high)}
+
+
+@dataclass
+class OptimizationResult:
+    """
+    Attributes:
+        best (Evaluation): final_samples ile yeniden değerlendirilmiş en iyi aday.
+        ci95 (dict): best için %95 güven aralıkları.
+        generations (int): Çalıştırılan nesil sayısı.
+        evaluations (int): Değerlendirilen aday sayısı.
+        converged (bool): Erken durdurma ölçütü sağlandı mı.
+        history (List[dict]): Nesil başına en iyi ve elit ortalama skor.
+        seconds (float): Toplam süre.
+    """
+    best: Evaluation
+    ci95: Dict[str, Tuple[float, float]]
+    generations: int
+    evaluations: int
+    converged: bool
+    history: List[dict] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {"best": asdict(self.best), "ci95": self.ci95, "generations": self.generations,
+                "evaluations": self.evaluations, "converged": self.converged,
+                "history": self.history, "seconds": self.seconds}
+
+
+# --- Değerlendirme (süreç havuzunda çalışır; modül düzeyinde olmalı) ---
+
+def evaluate(params: Dict[str, float], constraints: Constraints, n_samples: int, seed) -> Evaluation:
+    """Tek adayı n_samples Monte Carlo tekrarıyla değerlendirir."""
+    alloy = alloy_composition(int(params["n_observer"]))
+    rng = np.random.default_rng(seed)
+    samples = ignition_monte_carlo(params["fuel_tank"], alloy.alloy_integrity, params["burn_rate"], n_samples, rng)
+    feasible = ((samples["burn_seconds"] <= constraints.max_burn_seconds)
+                & (samples["peak_thrust"] <= constraints.max_peak_thrust))
+    thrust = total_thrust(params["fuel_tank"], alloy.alloy_integrity)
+    rate = float(feasible.mean())
+    return Evaluation(params=params, thrust_total=thrust, feasible_rate=rate,
+                      expected_thrust=thrust * rate, n_samples=n_samples)
+
+
+def evaluate_batch(candidates: Sequence[Dict[str, float]], constraints: Constraints, n_samples: int,
+                   seeds: Sequence) -> List[Evaluation]:
+    return [evaluate(params, constraints, n_samples, seed) for params, seed in zip(candidates, seeds)]
+
+
+# --- Optimizasyon ---
+
+class DesignOptimizer:
+    """
+    CEM tabanlı, süreç havuzunda toplu değerlendiren tasarım optimizasyonu.
+
+    Args:
+        space (DesignSpace): Arama sınırları.
+        constraints (Constraints): Ateşleme kısıtları.
+        population (int): Nesil başına aday sayısı.
+        elite_frac (float): Dağılımı güncelleyen en iyi adayların oranı.
+        smoothing (float): Dağılım güncellemesinde yeni elit istatistiklerinin ağırlığı.
+        samples (int): Arama sırasında aday başına Monte Carlo tekrarı.
+        final_samples (int): En iyi adayın yeniden değerlendirme tekrarı.
+        max_generations (int): Nesil üst sınırı.
+        patience (int): İyileşmesiz nesil sayısı sınırı (erken durdurma).
+        rel_tol (float): "İyileşme" sayılan en küçük göreli artış.
+        workers (int): Süreç sayısı; 0 veya 1 ise aynı süreçte çalışır.
+        seed (int): Kök tohum; nesil ve aday tohumları bundan türetilir.
+    """
+
+    def __init__(self, space: DesignSpace = DesignSpace(), constraints: Constraints = Constraints(),
+                 population: int = 64, elite_frac: float = 0.1, smoothing: float = 0.5, samples: int = 2048,
+                 final_samples: int = 32768, max_generations: int = 50, patience: int = 6,
+                 rel_tol: float = 1e-3, workers: int = 0, seed: int = 0):
+        if population < 2 or not 0 < elite_frac <= 1:
+            raise ValueError("population >= 2 ve 0 < elite_frac <= 1 olmalıdır.")
+        self.space = space
+        self.constraints = constraints
+        self.population = population
+        self.n_elite = max(2, int(round(population * elite_frac)))
+        self.smoothing = smoothing
+        self.samples = samples
+        self.final_samples = final_samples
+        self.max_generations = max_generations
+        self.patience = patience
+        self.rel_tol = rel_tol
+        self.workers = workers
+        self.seed = seed
+
+    def _candidates(self, mean: np.ndarray, cov: np.ndarray, rng: np.random.Generator) -> List[Dict[str, float]]:
+        # Örnekleme [0, 1]^3 birim küpünde yapılır; sınırlar dışı kırpılır, n_observer yuvarlanır
+        bounds = self.space.bounds()
+        unit = np.clip(rng.multivariate_normal(mean, cov, self.population), 0.0, 1.0)
+        points = bounds[:, 0] + unit * (bounds[:, 1] - bounds[:, 0])
+        points[:, 0] = np.round(points[:, 0])
+        return [dict(zip(self.space.names, (int(row[0]), float(row[1]), float(row[2])))) for row in points]
+
+    def _evaluate(self, pool: Optional[ProcessPoolExecutor], candidates, generation: int) -> List[Evaluation]:
+        seeds = [(self.seed, SEARCH_STREAM, generation, index) for index in range(len(candidates))]
+        if pool is None:
+            return evaluate_batch(candidates, self.constraints, self.samples, seeds)
+        # İşçi başına tek görev: süreçler arası gidiş-dönüş nesil başına workers kadar
+        step = math.ceil(len(candidates) / self.workers)
+        futures = [pool.submit(evaluate_batch, candidates[i:i + step], self.constraints, self.samples,
+                               seeds[i:i + step]) for i in range(0, len(candidates), step)]
+        return [evaluation for future in futures for evaluation in future.result()]
+
+    def run(self) -> OptimizationResult:
+        started = time.perf_counter()
+        bounds = self.space.bounds()
+        width = bounds[:, 1] - bounds[:, 0]
+        # Tam kovaryans: olurlu bölge yanma hızı ile yakıt arasında eğik, ince bir sırttır;
+        # eksen hizalı dağılım bu sırtta erken daralır.
+        mean, cov = np.full(len(width), 0.5), np.eye(len(width)) / 4
+        rng = np.random.default_rng((self.seed, CEM_STREAM))
+
+        best: Optional[Evaluation] = None
+        history, stale, converged, evaluations = [], 0, False, 0
+        pool = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        try:
+            for generation in range(self.max_generations):
+                scored = self._evaluate(pool, self._candidates(mean, cov, rng), generation)
+                evaluations += len(scored)
+                scored.sort(key=lambda evaluation: evaluation.expected_thrust, reverse=True)
+                elite = scored[:self.n_elite]
+                points = np.array([[e.params[name] for name in self.space.names] for e in elite])
+                unit = (points - bounds[:, 0]) / width
+                mean = self.smoothing * unit.mean(axis=0) + (1 - self.smoothing) * mean
+                cov = (self.smoothing * np.cov(unit, rowvar=False) + (1 - self.smoothing) * cov
+                       + np.eye(len(width)) * 1e-8)
+
+                improved = best is None or elite[0].expected_thrust > best.expected_thrust * (1 + self.rel_tol)
+                if best is None or elite[0].expected_thrust > best.expected_thrust:
+                    best = elite[0]
+                stale = 0 if improved else stale + 1
+                history.append({"generation": generation, "best": best.expected_thrust,
+                                "elite_mean": float(np.mean([e.expected_thrust for e in elite]))})
+                if stale >= self.patience or np.sqrt(np.diag(cov)).max() < 1e-3:
+                    converged = True
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        # Seçim yanlılığını (winner's curse) önlemek için bağımsız tohumla yeniden değerlendir
+        final = evaluate(best.params, self.constraints, self.final_samples, (self.seed, FINAL_STREAM))
+        return OptimizationResult(best=final, ci95=final.interval(), generations=len(history),
+                                  evaluations=evaluations, converged=converged, history=history,
+                                  seconds=time.perf_counter() - started)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="FAZZ-6 alaşım / ateşleme tasarım optimizasyonu")
+    parser.add_argument("--population", type=int, default=64)
+    parser.add_argument("--samples", type=int, default=2048)
+    parser.add_argument("--final-samples", type=int, default=32768)
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-burn-seconds", type=int, default=Constraints.max_burn_seconds)
+    parser.add_argument("--max-peak-thrust", type=float, default=Constraints.max_peak_thrust)
+    args = parser.parse_args(argv)
+
+    optimizer = DesignOptimizer(constraints=Constraints(args.max_burn_seconds, args.max_peak_thrust),
+                                population=args.population, samples=args.samples,
+                                final_samples=args.final_samples, max_generations=args.generations,
+                                workers=args.workers, seed=args.seed)
+    result = optimizer.run()
+    best, ci = result.best, result.ci95
+    baseline = evaluate({"n_observer": 12, "burn_rate": BASE_BURN_RATE, "fuel_tank": 7812.45},
+                        optimizer.constraints, args.final_samples, (args.seed, BASELINE_STREAM))
+    print(f"En iyi: n_observer={best.params['n_observer']} · burn_rate={best.params['burn_rate']:.1f} L/s · "
+          f"fuel_tank={best.params['fuel_tank']:.1f} L")
+    print(f"  E[itki] = {best.expected_thrust:,.0f} kN  (%95: {ci['expected_thrust'][0]:,.0f} – "
+          f"{ci['expected_thrust'][1]:,.0f})  · olurluk {best.feasible_rate:.4f} "
+          f"({ci['feasible_rate'][0]:.4f} – {ci['feasible_rate'][1]:.4f})")
+    print(f"  Referans (n=12, 250 L/s, 7812.45 L): E[itki] = {baseline.expected_thrust:,.0f} kN "
+          f"· olurluk {baseline.feasible_rate:.4f}")
+    print(f"  {result.generations} nesil · {result.evaluations} aday · "
+          f"{'yakınsadı' if result.converged else 'nesil sınırı'} · {result.seconds:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+FAZZ-11 İNİŞ BAŞARISI KESTİRİMİ (Varyans azaltma)
+
+İniş başarılıdır ⇔ temasta yakıt > 0 ve atmosferik girişte gövde sıcaklığı
+hull_limit_c'ye hiç ulaşmamıştır (Gd boşaltımı hiç tetiklenmemiştir).
+
+    - Yakıt koşulu rastgelelik içermez (descent_fuel); giriş süresi ve yakıt
+      rezervinden kesin olarak hesaplanır.
+    - Rastgele olan, giriş tick'lerinin ısı çekilişleridir (U(50, 150) °C).
+      Kırpmadan önce sıcaklık yolu tekdüze arttığı için hull_limit_c <= 1500
+      iken arıza ⇔ ısı toplamı eşiği aşar; nadir bir olaydır.
+
+Senaryo varsayımı (özgün döngüden sapma):
+    atmospheric_entry döngüsü 10 km'ye hiç inmez. Hız 8000 km/h'ten her
+    tick'te 0.95 ile çarpılır ve irtifa v/100 m düşer; toplam iniş
+    Σ 80·0.95^k ≈ 1.6 km'dir. Döngü 398.4 km'ye yakınsar ve sonsuza dek
+    ısınır. Gövde ~17. tick'te 1500 °C kırpmasına ulaşır, yani özgün
+    döngüde P(arıza) = 1'dir. Bu modül bunun yerine girişin ENTRY_TICKS
+    tick sürüp 10 km'de bittiği varsayımsal bir giriş modeller. Varsayılan
+    12 tick, arızanın hem mümkün hem nadir olduğu en küçük değerdir:
+    N <= 10'da Σ ısı sınıra hiç ulaşamaz (P = 0), N = 11'de P ≈ 4e-14
+    (sayısal olarak sıfır), N = 12'de P ≈ 2.4e-6, N = 16'da P ≈ 0.43'tür.
+    Varyans azaltmanın ölçüldüğü nadir olay rejimi budur. Farklı bir giriş
+    süresi --entry-ticks ile verilir (en çok MAX_ENTRY_TICKS).
+
+    Yakıt rezervi: itkili iniş, giriş süresinden neredeyse bağımsız olarak
+    110–130 tick sürer (1 km altında hız irtifa/2'ye kırpılır, 5 m'ye inmek
+    ~100 tick alır) ve tick başına %0.1 yakıt harcar. Betiğin %12 rezervi
+    12 tick'lik girişten sonraki 122 tick'e yetmez. O rezervle başarı
+    olasılığı her kestiricide 0 olurdu ve yalnızca P(arıza) kestirilmiş
+    olurdu. Varsayılan senaryo bu yüzden DEFAULT_FUEL_PCT = %15 rezervle
+    temas eder (temasta ~%2.8 kalır). Böylece p_success birleşik olayı,
+    P(yakıt > 0 ∧ gövde sınırın altında) = 1 - P(arıza), kestirir. Betiğin
+    rezervi --fuel 12 ile seçilebilir.
+
+Kestiriciler (hepsi yansız; aynı koşu bütçesiyle karşılaştırılır):
+    plain       : düz Monte Carlo
+    antithetic  : u ve 1 - u çiftleri (arıza u'da tekdüze → negatif korelasyon)
+    control     : kontrol değişkenleri S - N/2 ve (S - N/2)² - N/12 (S = Σu,
+                  beklenen değerleri bilinir); katsayılar en küçük karelerle
+    importance  : her çekiliş üstel eğimli yoğunluktan, g_θ(u) ∝ e^{θu};
+                  θ, eğimli ortalama Σu eşiğe denk gelecek şekilde seçilir
+                  (büyük sapmalar baskın noktası). Ağırlık Π (e^θ - 1)/(θ e^{θu}).
+
+Her kestirim varyansı, %95 aralığı ve etkin örnek boyutunu (ess: aynı
+varyansa ulaşmak için gereken düz Monte Carlo koşusu) raporlar; önem
+örneklemesi ayrıca arıza bölgesindeki ağırlıkların ESS'ini ((Σw)² / Σw²) verir.
+
+CLI:
+    python -m src.services.landing_estimation --runs 100000 --entry-ticks 12
+"""
+import argparse
+import math
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from src.simulation.fazz11_mars_landing import (ENTRY_HEATING, HULL_LIMIT_C, MAX_ENTRY_TICKS, descent_fuel,
+                                                entry_peak_temperature)
+
+Z_95 = 1.959963984540054
+ENTRY_TICKS = 12          # Varsayımsal giriş süresi; arızanın nadir olduğu en küçük N (bkz. modül belgesi)
+DEFAULT_FUEL_PCT = 15.0   # Temasta yakıtın kaldığı rezerv; betiğin %12'si inişe yetmez (bkz. modül belgesi)
+
+
+@dataclass(frozen=True)
+class LandingScenario:
+    """
+    Attributes:
+        entry_ticks (int): Varsayımsal girişin 10 km'de bittiği tick sayısı
+            (özgün döngü 10 km'ye inmez; bkz. modül belgesi).
+        hull_limit_c (float): Gövde sıcaklığı sınırı (°C).
+        fuel_pct (float): İniş yakıt rezervi (%); varsayılanı temasta yakıt bırakır.
+        start_temp (float): Giriş öncesi gövde sıcaklığı (°C).
+    """
+    entry_ticks: int = ENTRY_TICKS
+    hull_limit_c: float = HULL_LIMIT_C
+    fuel_pct: float = DEFAULT_FUEL_PCT
+    start_temp: float = -120.0
+
+    def failures(self, u: np.ndarray) -> np.ndarray:
+        return entry_peak_temperature(u, self.start_temp) >= self.hull_limit_c
+
+    def fuel_remaining(self) -> float:
+        return descent_fuel(self.entry_ticks, fuel=self.fuel_pct)
+
+    def threshold(self) -> float:
+        """Arıza için gereken Σu (kırpmasız yol): hull_limit_c - start - N·50 = 100·Σu."""
+        low, high = ENTRY_HEATING
+        return (self.hull_limit_c - self.start_temp - low * self.entry_ticks) / (high - low)
+
+
+@dataclass
+class Estimate:
+    """
+    Attributes:
+        method (str): Kestirici adı.
+        p_failure (float): Gövde sıcaklığı arızası olasılığı.
+        p_success (float): Yakıt koşuluyla birlikte iniş başarısı olasılığı.
+        variance (float): p_failure kestiriminin varyansı.
+        std_error (float): sqrt(variance).
+        ci95 (Tuple[float, float]): Normal yaklaşımla %95 aralığı.
+        n_runs (int): Harcanan simülasyon koşusu.
+        ess (float | None): Aynı varyans için gereken düz MC koşusu.
+        weight_ess (float | None): Arıza bölgesindeki önem ağırlıklarının ESS'i (yalnızca importance).
+        fuel_remaining (float): Temasta kalan yakıt (%).
+        seconds (float): Süre.
+    """
+    method: str
+    p_failure: float
+    p_success: float
+    variance: float
+    std_error: float
+    ci95: Tuple[float, float]
+    n_runs: int
+    ess: Optional[float]
+    weight_ess: Optional[float]
+    fuel_remaining: float
+    seconds: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _estimate(method: str, scenario: LandingScenario, samples: np.ndarray, n_runs: int, started: float,
+              weight_ess: Optional[float] = None) -> Estimate:
+    # samples: ortalaması yansız kestirim olan bağımsız değerler
+    p = float(samples.mean())
+    variance = float(samples.var(ddof=1) / len(samples)) if len(samples) > 1 else 0.0
+    se = math.sqrt(variance)
+    fuel = scenario.fuel_remaining()
+    return Estimate(method=method, p_failure=p, p_success=(1 - p) if fuel > 0 else 0.0, variance=variance,
+                    std_error=se, ci95=(max(0.0, p - Z_95 * se), min(1.0, p + Z_95 * se)), n_runs=n_runs,
+                    ess=p * (1 - p) / variance if variance > 0 else None, weight_ess=weight_ess,
+                    fuel_remaining=fuel, seconds=time.perf_counter() - started)
+
+
+# --- Kestiriciler ---
+
+def plain(scenario: LandingScenario, n_runs: int, rng: np.random.Generator) -> Estimate:
+    started = time.perf_counter()
+    failures = scenario.failures(rng.uniform(size=(n_runs, scenario.entry_ticks)))
+    return _estimate("plain", scenario, failures.astype(np.float64), n_runs, started)
+
+
+def antithetic(scenario: LandingScenario, n_runs: int, rng: np.random.Generator) -> Estimate:
+    started = time.perf_counter()
+    u = rng.uniform(size=(n_runs // 2, scenario.entry_ticks))
+    pairs = (scenario.failures(u).astype(np.float64) + scenario.failures(1.0 - u)) / 2
+    return _estimate("antithetic", scenario, pairs, 2 * len(u), started)
+
+
+def control_variate(scenario: LandingScenario, n_runs: int, rng: np.random.Generator) -> Estimate:
+    started = time.perf_counter()
+    n = scenario.entry_ticks
+    u = rng.uniform(size=(n_runs, n))
+    failures = scenario.failures(u).astype(np.float64)
+    centered = u.sum(axis=1) - n / 2
+    controls = np.column_stack([centered, centered ** 2 - n / 12])   # E = 0 (Var Σu = N/12)
+    beta, *_ = np.linalg.lstsq(controls - controls.mean(axis=0), failures - failures.mean(), rcond=None)
+    return _estimate("control", scenario, failures - controls @ beta, n_runs, started)
+
+
+def tilt_for_mean(target_mean: float) -> float:
+    """g_θ ∝ e^{θu} ([0, 1]) ortalaması target_mean olacak θ (ikiye bölme)."""
+    if target_mean <= 0.5:
+        return 0.0
+    target_mean = min(target_mean, 1 - 2e-3)   # θ <= ~500: expm1(θ) taşmaz
+    low, high = 0.0, 1.0
+    mean = lambda theta: 1 / -math.expm1(-theta) - 1 / theta
+    while mean(high) < target_mean:
+        high *= 2
+    for _ in range(100):
+        mid = (low + high) / 2
+        low, high = (mid, high) if mean(mid) < target_mean else (low, mid)
+    return (low + high) / 2
+
+
+def importance(scenario: LandingScenario, n_runs: int, rng: np.random.Generator,
+               theta: Optional[float] = None) -> Estimate:
+    started = time.perf_counter()
+    n = scenario.entry_ticks
+    theta = tilt_for_mean(scenario.threshold() / n) if theta is None else theta
+    v = rng.uniform(size=(n_runs, n))
+    if theta == 0.0:
+        u, weights = v, np.ones(n_runs)
+    else:
+        u = np.log1p(v * math.expm1(theta)) / theta
+        # log((e^θ - 1)/θ) = θ + log(1 - e^{-θ}) - log θ  (büyük θ'da taşmasız)
+        log_norm = theta + math.log(-math.expm1(-theta)) - math.log(theta)
+        weights = np.exp(n * log_norm - theta * u.sum(axis=1))
+    samples = scenario.failures(u) * weights
+    # Kestirime katkı veren (arıza bölgesindeki) ağırlıkların ESS'i; tüm ağırlıkların ESS'i
+    # nadir olayda arıza dışı örneklerin küçük ağırlıkları yüzünden yanıltıcı derecede düşüktür.
+    total = samples.sum()
+    weight_ess = float(total ** 2 / np.square(samples).sum()) if total > 0 else 0.0
+    return _estimate("importance", scenario, samples, n_runs, started, weight_ess=weight_ess)
+
+
+ESTIMATORS: Dict[str, Callable[..., Estimate]] = {
+    "plain": plain, "antithetic": antithetic, "control": control_variate, "importance": importance,
+}
+
+
+def estimate(method: str = "importance", n_runs: int = 100_000, seed: int = 0,
+             scenario: LandingScenario = LandingScenario()) -> Estimate:
+    if method not in ESTIMATORS:
+        raise ValueError(f"Bilinmeyen kestirici: {method} (geçerli: {', '.join(ESTIMATORS)})")
+    return ESTIMATORS[method](scenario, n_runs, np.random.default_rng(seed))
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="FAZZ-11 iniş başarısı kestirimi (varyans azaltma)")
+    parser.add_argument("--method", choices=["all", *ESTIMATORS], default="all")
+    parser.add_argument("--runs", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--entry-ticks", type=int, default=LandingScenario.entry_ticks)
+    parser.add_argument("--hull-limit", type=float, default=HULL_LIMIT_C)
+    parser.add_argument("--fuel", type=float, default=LandingScenario.fuel_pct, help="Yakıt rezervi (%)")
+    args = parser.parse_args(argv)
+
+    if not 0 <= args.entry_ticks <= MAX_ENTRY_TICKS:
+        parser.error(f"--entry-ticks 0 ile {MAX_ENTRY_TICKS} arasında olmalıdır")
+    scenario = LandingScenario(args.entry_ticks, args.hull_limit, args.fuel)
+    methods = list(ESTIMATORS) if args.method == "all" else [args.method]
+    fuel = scenario.fuel_remaining()
+    print(f"Giriş {scenario.entry_ticks} tick · sınır {scenario.hull_limit_c:.0f} °C · "
+          f"temasta yakıt %{fuel:.2f}{'' if fuel > 0 else ' (yakıt biter: başarı olasılığı 0)'}")
+    for method in methods:
+        result = estimate(method, args.runs, args.seed, scenario)
+        ess = f"{result.ess:,.0f}" if result.ess is not None else "-"
+        extra = f" · ağırlık ESS {result.weight_ess:,.0f}" if result.weight_ess is not None else ""
+        print(f"  {method:<11} P(arıza) = {result.p_failure:.4e} ± {result.std_error:.1e} "
+              f"(%95: {result.ci95[0]:.3e} – {result.ci95[1]:.3e}) · P(başarı) = {result.p_success:.6f} · "
+              f"{result.n_runs:,} koşu · "
+              f"ess {ess}{extra} · {result.seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+FAZZ-4 CANLI OTURUMLAR (asyncio)
+
+Kokpitteki her demo oturumu eskiden bütün bir bloklayan betik koşusuydu
+(oturum başına bir iş parçacığı). Burada her oturum, simülasyonun
+eşzamansız faz üretecini (run_async) kendi SimulatedClock'uyla süren tek
+bir asyncio görevidir; tek olay döngüsü binlerce bağımsız oturumu taşır.
+
+Oturum başına kontrol: pause / resume / set_speed (src.core.sim_clock).
+Kareler son kare olarak saklanır ve abonelere sınırlı kuyruklarla dağıtılır;
+yavaş bir abone en eski kareleri kaybeder, simülasyonu yavaşlatmaz.
+
+Simülasyonlar (SIMULATIONS):
+    mars_arrival : FAZZ-10 dönüş, frenleme, yörüngeye giriş
+    earth_return : FAZZ-13 kalkış, seyir, atmosferik giriş
+
+CLI (ölçek denemesi):
+    python -m src.services.live_sessions --sessions 5000 --speed 50
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import time
+from collections import deque
+from typing import AsyncIterator, Callable, Deque, Dict, List, Optional, Set
+
+from src.core.sim_clock import SimulatedClock
+from src.simulation import registry
+
+DEFAULT_MAX_SESSIONS = 10_000
+SUBSCRIBER_QUEUE = 256
+
+
+# --- Simülasyon fabrikaları: (saat, rng) -> kare üreteci ---
+
+def _mars_arrival(clock: SimulatedClock, rng: random.Random):
+    return registry.create("mars_arrival").run_async(clock, rng)
+
+
+def _earth_return(clock: SimulatedClock, rng: random.Random):
+    return registry.create("earth_return").run_async(clock, rng)
+
+
+SIMULATIONS: Dict[str, Callable[[SimulatedClock, random.Random], AsyncIterator[dict]]] = {
+    "mars_arrival": _mars_arrival,
+    "earth_return": _earth_return,
+}
+
+
+class SessionLimitExceeded(RuntimeError):
+    """Eşzamanlı oturum sınırı doluysa yeni oturum açılamaz."""
+
+
+class Session:
+    """
+    Tek bir canlı simülasyon oturumu.
+
+    Attributes:
+        id (str): Oturum kimliği.
+        simulation (str): SIMULATIONS anahtarı.
+        seed (int | None): Rastgelelik tohumu.
+        clock (SimulatedClock): Oturumun saati.
+        state (str): running | paused | finished | cancelled | failed.
+        frames (int): Üretilen kare sayısı.
+        last_frame (dict | None): En son kare.
+    """
+
+    def __init__(self, session_id: str, simulation: str, speed: float = 1.0, seed: Optional[int] = None,
+                 paused: bool = False):
+        self.id = session_id
+        self.simulation = simulation
+        self.seed = seed
+        self.clock = SimulatedClock(speed, paused)
+        self.state = "paused" if paused else "running"
+        self.frames = 0
+        self.last_frame: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.created = time.time()
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> "Session":
+        frames = SIMULATIONS[self.simulation](self.clock, random.Random(self.seed))
+        self._task = asyncio.get_running_loop().create_task(self._drive(frames), name=f"session-{self.id}")
+        return self
+
+    async def _drive(self, frames: AsyncIterator[dict]) -> None:
+        try:
+            async for frame in frames:
+                self.frames += 1
+                self.last_frame = {"seq": self.frames, "sim_time": round(self.clock.now, 6), **frame}
+                self._publish(self.last_frame)
+            self.state = "finished"
+        except asyncio.CancelledError:
+            self.state = "cancelled"
+            raise
+        except Exception as exc:
+            self.state, self.error = "failed", repr(exc)
+        finally:
+            await frames.aclose()
+            self._publish(None)
+
+    def _publish(self, frame: Optional[dict]) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()   # Yavaş abone: en eski kareyi at
+            queue.put_nowait(frame)
+
+    # --- Kontrol ---
+
+    def add_done_callback(self, callback: Callable[["Session"], None]) -> None:
+        self._task.add_done_callback(lambda _: callback(self))
+
+    @property
+    def done(self) -> bool:
+        return self._task is not None and self._task.done()
+
+    def pause(self) -> None:
+        if not self.done:
+            self.clock.pause()
+            self.state = "paused"
+
+    def resume(self) -> None:
+        if not self.done:
+            self.clock.resume()
+            self.state = "running"
+
+    def set_speed(self, speed: float) -> None:
+        self.clock.set_speed(speed)
+
+    async def cancel(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def wait(self) -> None:
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    # --- Abonelik ---
+
+    async def subscribe(self) -> AsyncIterator[dict]:
+        """Son kareyle başlayıp oturum bitene kadar yeni kareleri verir."""
+        queue: asyncio.Queue = asyncio.Queue(SUBSCRIBER_QUEUE)
+        if self.last_frame is not None:
+            queue.put_nowait(self.last_frame)
+        if self.done:
+            queue.put_nowait(None)
+        else:
+            self._subscribers.add(queue)
+        try:
+            while (frame := await queue.get()) is not None:
+                yield frame
+        finally:
+            self._subscribers.discard(queue)
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "simulation": self.simulation, "seed": self.seed, "state": self.state,
+                "speed": self.clock.speed if self.clock.speed != float("inf") else None,
+                "sim_time": self.clock.now, "frames": self.frames, "subscribers": len(self._subscribers),
+                "last_frame": self.last_frame, "error": self.error}
+
+
+class SessionManager:
+    """
+    Tek olay döngüsündeki canlı oturumların kaydı.
+
+    Args:
+        max_sessions (int): Aynı anda bitmemiş en fazla oturum.
+        retain_finished (int): Bellekte tutulan en fazla bitmiş oturum (eskiler atılır).
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS, retain_finished: int = 1024):
+        self.max_sessions = max_sessions
+        self.retain_finished = retain_finished
+        self._sessions: Dict[str, Session] = {}
+        self._finished: Deque[str] = deque()
+        self._active = 0
+        self._ids = itertools.count(1)
+
+    def active(self) -> int:
+        return self._active
+
+    def _on_done(self, session_id: str) -> None:
+        # Sayaçlar görev bitiş geri çağrısıyla tutulur: create O(1) kalır
+        self._active -= 1
+        self._finished.append(session_id)
+        while len(self._finished) > self.retain_finished:
+            self._sessions.pop(self._finished.popleft(), None)
+
+    def create(self, simulation: str, speed: float = 1.0, seed: Optional[int] = None,
+               paused: bool = False) -> Session:
+        """
+        Raises:
+            KeyError: Simülasyon bilinmiyorsa.
+            ValueError: Hız pozitif değilse.
+            SessionLimitExceeded: Eşzamanlı oturum sınırı doluysa.
+        """
+        if simulation not in SIMULATIONS:
+            raise KeyError(simulation)
+        if self._active >= self.max_sessions:
+            raise SessionLimitExceeded(f"En fazla {self.max_sessions} eşzamanlı oturum açılabilir.")
+        session = Session(f"s{next(self._ids)}", simulation, speed, seed, paused).start()
+        session.add_done_callback(lambda _, session_id=session.id: self._on_done(session_id))
+        self._sessions[session.id] = session
+        self._active += 1
+        return session
+
+    def get(self, session_id: str) -> Session:
+        """Raises: KeyError: Oturum yoksa."""
+        return self._sessions[session_id]
+
+    def list(self) -> List[Session]:
+        return list(self._sessions.values())
+
+    async def remove(self, session_id: str) -> None:
+        session = self._sessions.pop(session_id)
+        await session.cancel()
+
+    async def close(self) -> None:
+        await asyncio.gather(*(session.cancel() for session in self._sessions.values()))
+        self._sessions.clear()
+
+    def stats(self) -> dict:
+        states: Dict[str, int] = {}
+        for session in self._sessions.values():
+            states[session.state] = states.get(session.state, 0) + 1
+        return {"sessions": len(self._sessions), "active": self.active(), "max_sessions": self.max_sessions,
+                "states": states, "frames": sum(session.frames for session in self._sessions.values())}
+
+
+async def _bench(n_sessions: int, speed: float, simulation: str) -> None:
+    manager = SessionManager(max_sessions=n_sessions, retain_finished=n_sessions)
+    names = list(SIMULATIONS) if simulation == "all" else [simulation]
+    started = time.perf_counter()
+    sessions = [manager.create(names[index % len(names)], speed, seed=index) for index in range(n_sessions)]
+    # Bir bölümünü duraklatıp sürdürerek kontrol yolunu da sına
+    for session in sessions[::10]:
+        session.pause()
+    await asyncio.sleep(0.5)
+    for session in sessions[::10]:
+        session.resume()
+    await asyncio.gather(*(session.wait() for session in sessions))
+    seconds = time.perf_counter() - started
+    stats = manager.stats()
+    sim_seconds = sum(session.clock.now for session in sessions)
+    print(f"{n_sessions:,} oturum · {stats['frames']:,} kare · {seconds:.2f} s duvar "
+          f"(0.5 s duraklatma dahil) · {stats['frames'] / seconds:,.0f} kare/s · "
+          f"simüle/duvar = {sim_seconds / seconds:,.0f}×")
+    print(f"Durumlar: {stats['states']}")
+    await manager.close()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="FAZZ-4 canlı oturum ölçek denemesi")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--speed", type=float, default=50.0, help="Simüle s / duvar s (inf: beklemesiz)")
+    parser.add_argument("--simulation", choices=["all", *SIMULATIONS], default="all")
+    args = parser.parse_args(argv)
+    asyncio.run(_bench(args.sessions, args.speed, args.simulation))
+
+
+if __name__ == "__main__":
+    main()
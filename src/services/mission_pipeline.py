@@ -0,0 +1,303 @@
+"""
+FAZZ-7 → FAZZ-13 ARTIMLI GÖREV HATTI (Incremental Mission Pipeline)
+
+Tersaneden (FAZZ-7) Dünya'ya dönüşe (FAZZ-13) kadar olan fazlar, her fazın son
+durumu bir sonrakinin girdisi olacak şekilde zincirlenir. Her faz çıktısı
+(girdi durumu, faz parametreleri, tohum) üçlüsünün özetiyle (hash) önbelleğe
+alınır: bir parametre değiştiğinde yalnızca o faz ve ondan sonrakiler yeniden
+hesaplanır. Değişen bir faz aynı çıktıyı üretirse (ör. etkisiz parametre)
+aşağı akış yine önbellekten gelir.
+
+Fazların arasında modellenmeyen manevralar, faz girişindeki eşleme işlevleriyle
+(Stage.handoff) önceki fazın durumundan türetilir:
+    launch  → tmi     : park yörüngesine yerleşme. Tırmanış ~79.800 km/h ile biter;
+                        TMI bu hızın orbit_insertion_ratio katından (~38.650 km/h,
+                        FAZZ-9'un başlangıç hızı) başlar.
+    tmi     → arrival : seyir ivmelenmesi. Frenleme TMI çıkış hızının cruise_gain
+                        katından (~1.2M km/h, FAZZ-10'un tepe hızı) başlar.
+Varsayılan oranlar özgün betiklerin sabit hızlarını verir; tırmanış veya TMI
+parametreleri değişince aşağı akış hızları da gerçekten değişir.
+
+Fazlar I/O içermez; konsol sınıflarının (Derzz_*) döngülerini ve mevcut adım
+üreteçlerini (ascent_frames, suicide_burn_frames, reentry_frames) kullanır.
+
+Örnek:
+    pipeline = MissionPipeline(seed=7)
+    first = pipeline.run()
+    second = pipeline.run(params={"arrival": {"fuel_pressure": 90.0}})
+    second.computed   # ['arrival', 'landing', 'colony', 'return']
+"""
+import hashlib
+import json
+import random
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Mapping, Optional
+
+from src.core.propulsion import alloy_composition
+from src.simulation.fazz8_launch_control import ascent_frames
+from src.simulation.fazz10_mars_arrival import suicide_burn_frames
+from src.simulation.fazz12_mars_colonization import BEST_SITE, DISCOVERY_WINDOWS
+from src.simulation.fazz13_earth_return import reentry_frames
+
+StageFunction = Callable[[dict, dict, random.Random], dict]
+Handoff = Callable[[dict, dict], dict]
+
+
+def digest(payload) -> str:
+    """JSON olarak kanonikleştirilmiş yükün blake2b özeti."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    Hattın bir fazı.
+
+    Attributes:
+        name (str): Faz adı.
+        run (StageFunction): (girdi durumu, parametreler, rng) -> yeni alanlar.
+        defaults (dict): Varsayılan parametreler.
+        version (int): Faz mantığı değiştiğinde artırılır; eski önbellek geçersizleşir.
+        handoff (Handoff): Önceki fazın durumunu bu fazın girdisine eşleyen işlev
+            (durum, parametreler) -> girdi durumu; None ise durum olduğu gibi geçer.
+    """
+    name: str
+    run: StageFunction
+    defaults: dict = field(default_factory=dict)
+    version: int = 1
+    handoff: Optional["Handoff"] = None
+
+
+@dataclass
+class MissionRun:
+    """
+    Bir hat çalıştırmasının sonucu.
+
+    Attributes:
+        outputs (Dict[str, dict]): Faz adı -> faz sonrası görev durumu.
+        computed (List[str]): Bu çalıştırmada hesaplanan fazlar.
+        reused (List[str]): Önbellekten gelen fazlar.
+        keys (Dict[str, str]): Faz adı -> önbellek anahtarı.
+    """
+    outputs: Dict[str, dict]
+    computed: List[str]
+    reused: List[str]
+    keys: Dict[str, str]
+
+    @property
+    def final(self) -> dict:
+        """Son fazdan sonraki görev durumu."""
+        return next(reversed(self.outputs.values()))
+
+
+# --- Fazlar: her biri girdi durumunu okur ve eklediği/güncellediği alanları döndürür ---
+
+def _shipyard(state: dict, params: dict, rng: random.Random) -> dict:
+    # FAZZ-7: Bölüm mukavemetleri (n + 1) · U(980, 1020), alaşım FAZZ-6 çekirdeğinden
+    n = params["n_observer"]
+    integrity = sum((n + 1) * rng.uniform(980, 1020) for _ in range(params["sections"]))
+    alloy = alloy_composition(n)
+    return {"ship_integrity": integrity, "alloy_code": alloy.alloy_code,
+            "alloy_integrity": alloy.alloy_integrity, "mars_distance_km": params["mars_distance_km"]}
+
+
+def _launch(state: dict, params: dict, rng: random.Random) -> dict:
+    # FAZZ-8: LEO'ya tırmanış; çıkış hızı tırmanışın son hızıdır
+    frame = None
+    for frame in ascent_frames(target_altitude=params["target_altitude_km"]):
+        pass
+    velocity = frame["velocity_kmh"] if frame else 0.0
+    return {"ascent_steps": frame["step"] if frame else 0,
+            "altitude_km": frame["altitude_km"] if frame else 0.0,
+            "ascent_peak_velocity_kmh": velocity, "velocity_kmh": velocity}
+
+
+def _orbit_insertion(state: dict, params: dict) -> dict:
+    # launch → tmi: park yörüngesine yerleşmede tepe hızın orbit_insertion_ratio katı korunur
+    return {**state, "velocity_kmh": state["velocity_kmh"] * params["orbit_insertion_ratio"]}
+
+
+def _tmi(state: dict, params: dict, rng: random.Random) -> dict:
+    # FAZZ-9: v += basınç · 100 + 50 · t, kaçış hızının overshoot katına kadar
+    velocity, seconds = state["velocity_kmh"], 0
+    target = params["escape_velocity_kmh"] * params["overshoot"]
+    while velocity < target:
+        seconds += 1
+        velocity += params["fuel_pressure"] * 100 + seconds * 50
+    return {"tmi_burn_seconds": seconds, "velocity_kmh": velocity, "fuel_pressure": params["fuel_pressure"]}
+
+
+def _cruise(state: dict, params: dict) -> dict:
+    # tmi → arrival: seyir ivmelenmesi TMI çıkış hızını cruise_gain katına çıkarır
+    return {**state, "velocity_kmh": state["velocity_kmh"] * params["cruise_gain"]}
+
+
+def _arrival(state: dict, params: dict, rng: random.Random) -> dict:
+    # FAZZ-10: Seyir tepe hızından yörünge hızına frenleme; yarı yolda başlar
+    frame = None
+    for frame in suicide_burn_frames(velocity=state["velocity_kmh"],
+                                     target_velocity=params["orbit_velocity_kmh"],
+                                     distance_to_mars=state["mars_distance_km"] / 2,
+                                     integrity=100.0, fuel_pressure=params["fuel_pressure"], rng=rng):
+        pass
+    return {"burn_cycles": frame["burn_cycle"] if frame else 0,
+            "velocity_kmh": frame["velocity_kmh"] if frame else state["velocity_kmh"],
+            "armor_integrity_pct": frame["integrity"] if frame else 100.0}
+
+
+def _landing(state: dict, params: dict, rng: random.Random) -> dict:
+    # FAZZ-11: Yörüngeden çıkış, atmosferik giriş ve itkili iniş
+    velocity = state["velocity_kmh"] - 3 * 2000
+    altitude, hull_temp, fuel = params["orbit_altitude_m"], -120.0, params["fuel_pct"]
+    # Orijinal giriş döngüsü 10 km'ye hiç ulaşmaz (hız geometrik azalır); üst sınırla kesilir
+    for _ in range(params["entry_max_ticks"]):
+        if altitude <= 10000:
+            break
+        altitude -= velocity / 100
+        hull_temp += rng.uniform(50, 150)
+        if hull_temp > 1500:
+            hull_temp = 1200
+        velocity *= 0.95
+    # İtkili inişte hız en az descent_velocity tutulur (aksi halde orijinal döngü durur)
+    descent_ticks = 0
+    while altitude > 0:
+        descent_ticks += 1
+        fuel = max(0.0, fuel - 0.1)
+        velocity = max(velocity, params["descent_velocity_kmh"]) if altitude >= 1000 else velocity
+        altitude -= velocity / 10
+        if altitude < 1000:
+            velocity = min(velocity, max(altitude, 0.0) / 2)
+        elif velocity > 300:
+            velocity -= 50
+        if altitude < 5:
+            altitude = 0.0
+    return {"entry_altitude_m": params["orbit_altitude_m"], "max_hull_temp_c": hull_temp,
+            "descent_ticks": descent_ticks, "fuel_pct": fuel, "velocity_kmh": 0.0}
+
+
+def _colony(state: dict, params: dict, rng: random.Random) -> dict:
+    # FAZZ-12: 4 saatlik radyasyon hasadı, %100 tavan ve drone keşifleri
+    hours, step = params["total_hours"], params["step_hours"]
+    fuel = min(100.0, state["fuel_pct"] + sum(rng.uniform(1.2, 2.5) for _ in range(hours // step)))
+    best = None
+    for start, end, site in DISCOVERY_WINDOWS:
+        first = (start // step + 1) * step
+        if first < end and first <= hours and (site == BEST_SITE or best != BEST_SITE):
+            best = site
+    return {"surface_days": hours // 24, "fuel_pct": fuel, "base_site": best}
+
+
+def _return(state: dict, params: dict, rng: random.Random) -> dict:
+    # FAZZ-13: Mars kalkışı (5 × 0.5%), 6 günlük seyir (6 × 5%) ve atmosferik giriş
+    fuel = state["fuel_pct"] - 5 * 0.5 - params["cruise_days"] * params["fuel_per_day_pct"]
+    frame = None
+    for frame in reentry_frames(params["reentry_altitude_m"], rng=rng):
+        pass
+    return {"fuel_pct": fuel, "reentry_max_temp_c": frame["max_temp_c"] if frame else 0,
+            "splashdown": fuel >= 0}
+
+
+STAGES: List[Stage] = [
+    Stage("shipyard", _shipyard, {"n_observer": 12, "sections": 4, "mars_distance_km": 225_000_000}),
+    Stage("launch", _launch, {"target_altitude_km": 400.0}),
+    # Varsayılan oranlar özgün hızları verir: 79.793 · 0.4844 ≈ 38.650, 62.352 · 19.25 ≈ 1.2M km/h
+    Stage("tmi", _tmi, {"orbit_insertion_ratio": 0.4844, "fuel_pressure": 78.0, "escape_velocity_kmh": 40320.0,
+                        "overshoot": 1.5}, handoff=_orbit_insertion),
+    Stage("arrival", _arrival, {"cruise_gain": 19.25, "orbit_velocity_kmh": 14_000.0, "fuel_pressure": 78.0},
+          handoff=_cruise),
+    Stage("landing", _landing, {"orbit_altitude_m": 400000.0, "fuel_pct": 12.0, "entry_max_ticks": 300,
+                                "descent_velocity_kmh": 300.0}),
+    Stage("colony", _colony, {"total_hours": 96, "step_hours": 4}),
+    Stage("return", _return, {"cruise_days": 6, "fuel_per_day_pct": 5.0, "reentry_altitude_m": 100000}),
+]
+
+
+class MissionPipeline:
+    """
+    Fazları zincirleyen ve çıktıları içerik özetiyle önbelleğe alan görev hattı.
+
+    Bir fazın anahtarı (faz adı, sürüm, girdi durumunun özeti, parametreler,
+    tohum) özetidir. Girdi durumu bir önceki fazın çıktısı olduğundan, bir
+    parametre değişikliği yalnızca kendi fazından itibaren anahtarları değiştirir.
+
+    Attributes:
+        seed (int): Görev tohumu; her faz kendi alt tohumunu türetir.
+        hits (int): Önbellekten gelen faz sayısı.
+        misses (int): Hesaplanan faz sayısı.
+    """
+
+    def __init__(self, stages: Optional[List[Stage]] = None, seed: int = 0, max_entries: int = 1024):
+        self.stages = list(stages if stages is not None else STAGES)
+        self.seed = seed
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._params: Dict[str, dict] = {stage.name: dict(stage.defaults) for stage in self.stages}
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
+
+    def set_params(self, stage: str, **params) -> None:
+        """Bir fazın kalıcı parametrelerini günceller (sonraki run() çağrıları için)."""
+        self._params[stage].update(self._checked(stage, params))
+
+    def params(self, stage: str) -> dict:
+        return dict(self._params[stage])
+
+    def _checked(self, stage: str, params: Mapping) -> dict:
+        if stage not in self._params:
+            raise KeyError(f"Bilinmeyen faz: {stage}")
+        unknown = set(params) - set(self._params[stage])
+        if unknown:
+            raise KeyError(f"{stage} fazında bilinmeyen parametre(ler): {', '.join(sorted(unknown))}")
+        return dict(params)
+
+    def run(self, params: Optional[Mapping[str, Mapping]] = None, seed: Optional[int] = None,
+            initial_state: Optional[dict] = None) -> MissionRun:
+        """
+        Hattı baştan sona çalıştırır; önbellekte olan fazları atlar.
+
+        Args:
+            params (Mapping): Bu çalıştırmaya özel {faz: {parametre: değer}} geçersiz kılmaları.
+            seed (int): Bu çalıştırmanın tohumu; verilmezse hattın tohumu.
+            initial_state (dict): İlk fazın girdi durumu.
+
+        Returns:
+            MissionRun: Faz çıktıları ve hangi fazların yeniden hesaplandığı.
+        """
+        overrides = {stage: self._checked(stage, values) for stage, values in (params or {}).items()}
+        seed = self.seed if seed is None else seed
+        state = dict(initial_state or {})
+        outputs, keys, computed, reused = {}, {}, [], []
+
+        for stage in self.stages:
+            stage_params = {**self._params[stage.name], **overrides.get(stage.name, {})}
+            key = digest([stage.name, stage.version, digest(state), stage_params, seed])
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                reused.append(stage.name)
+                state = cached
+            else:
+                rng = random.Random(f"{seed}:{stage.name}")
+                inputs = stage.handoff(state, stage_params) if stage.handoff else state
+                state = {**inputs, **stage.run(inputs, stage_params, rng)}
+                self._store(key, state)
+                self.misses += 1
+                computed.append(stage.name)
+            outputs[stage.name] = dict(state)
+            keys[stage.name] = key
+        return MissionRun(outputs, computed, reused, keys)
+
+    def _store(self, key: str, state: dict) -> None:
+        self._cache[key] = state
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Tüm faz önbelleğini boşaltır."""
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,250 @@
+"""
+FAZZ-4 GLOBAL DUYARLILIK ANALİZİ (Sobol indisleri)
+
+N_OBSERVER, Gd kesiti, radyasyon akısı aralığı, verim katsayısı, %35
+soğutma oranı... hangi parametre çıktının varyansını gerçekten sürüyor,
+hangisi sabitlenebilir? Saltelli tasarımı (src.core.sensitivity) üzerinde
+birinci ve toplam derece Sobol indisleri hesaplanır.
+
+Modeller (MODELS):
+    reactor : (n_observer, cross_section, flux_low, flux_high) -> valf, basınç, H2 (FAZZ-5.1)
+    harvest : (radiation_flux, target_area, efficiency_factor, cooling_ratio) -> Bengaluru hasadı
+
+Değerlendirme:
+    - Tasarım blokları (A, B, AB_i) iki kuvveti sınırlarına hizalı, en çok
+      batch_size satırlık partilere bölünür; her parti tek vektörel çağrıdır ve
+      partiler süreç havuzuna dağıtılır.
+    - Her parti satırlarının içeriğiyle adreslenerek disk önbelleğine
+      (src.infrastructure.result_cache) yazılır. Sobol önekleri korunduğundan
+      ve parti sınırları N'den bağımsız olduğundan, N'yi ikiye katlayan ikinci
+      bir koşu (N >= MIN_BATCH_ROWS) yalnızca yeni satırları hesaplar.
+
+CLI:
+    python -m src.services.sensitivity --model reactor --n 1024 --workers 4
+"""
+import argparse
+import hashlib
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from src.core.sensitivity import SobolIndices, saltelli_design, scale, sobol_indices
+
+MIN_BATCH_ROWS = 64   # İlk hizalı aralık [0, 64); daha küçük N'lerin partileri sonraki koşularla paylaşılmaz
+
+
+# --- Vektörel modeller (süreç havuzunda çalışır; modül düzeyinde olmalı) ---
+
+def evaluate_reactor(x: np.ndarray) -> Dict[str, np.ndarray]:
+    from src.simulation.fazz5_gadolinium_h2 import reactor_batch
+
+    return reactor_batch(x[:, 0], x[:, 1], x[:, 2], x[:, 3])
+
+
+def evaluate_harvest(x: np.ndarray) -> Dict[str, np.ndarray]:
+    from fazz4_bengaluru_sim import harvest
+
+    return harvest(*x.T)
+
+
+@dataclass(frozen=True)
+class Model:
+    """
+    Duyarlılığı incelenen vektörel simülasyon.
+
+    Attributes:
+        name (str): Model adı.
+        parameters (dict): Parametre adı -> (lo, hi) aralığı.
+        outputs (Tuple[str, ...]): evaluate çıktısındaki anahtarlar.
+        evaluate (Callable): (n, d) parametre matrisi -> {çıktı: (n,) dizi}.
+        version (int): Model mantığı değişince artırılır (önbellek anahtarı).
+    """
+    name: str
+    parameters: Dict[str, Tuple[float, float]]
+    outputs: Tuple[str, ...]
+    evaluate: Callable[[np.ndarray], Dict[str, np.ndarray]]
+    version: int = 1
+
+
+MODELS: Dict[str, Model] = {
+    "reactor": Model("reactor", {"n_observer": (4, 24), "cross_section": (200_000.0, 320_000.0),
+                                 "flux_low": (400.0, 600.0), "flux_high": (1000.0, 1400.0)},
+                     ("valve_releases", "peak_pressure", "h2_tank"), evaluate_reactor),
+    "harvest": Model("harvest", {"radiation_flux": (400.0, 700.0), "target_area": (4000.0, 6000.0),
+                                 "efficiency_factor": (0.80, 0.98), "cooling_ratio": (0.25, 0.45)},
+                     ("harvested_mw", "h2_kg_h", "cooling_kw"), evaluate_harvest),
+}
+
+
+def _evaluate_batches(name: str, batches: List[np.ndarray]) -> List[np.ndarray]:
+    model = MODELS[name]
+    out = []
+    for x in batches:
+        result = model.evaluate(x)
+        out.append(np.column_stack([np.broadcast_to(result[key], len(x)) for key in model.outputs]))
+    return out
+
+
+# --- Analiz ---
+
+@dataclass
+class SensitivityReport:
+    """
+    Attributes:
+        model (str): Model adı.
+        n (int): Taban örnek sayısı N (değerlendirme = N·(d + 2)).
+        evaluations (int): Toplam model değerlendirmesi.
+        computed (int): Bu koşuda hesaplanan (önbellekte olmayan) değerlendirme.
+        indices (Dict[str, SobolIndices]): Çıktı -> indisler.
+        seconds (float): Süre.
+    """
+    model: str
+    n: int
+    evaluations: int
+    computed: int
+    indices: Dict[str, SobolIndices] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    def negligible(self, threshold: float = 0.01) -> List[str]:
+        """Hiçbir çıktıda toplam etkisi eşiği aşmayan parametreler."""
+        sets = [set(indices.negligible(threshold)) for indices in self.indices.values()]
+        names = next(iter(self.indices.values())).names if self.indices else ()
+        return [name for name in names if all(name in found for found in sets)]
+
+    def to_dict(self, threshold: float = 0.01) -> dict:
+        return {"model": self.model, "n": self.n, "evaluations": self.evaluations, "computed": self.computed,
+                "seconds": self.seconds, "negligible": self.negligible(threshold),
+                "outputs": {output: indices.to_dict() for output, indices in self.indices.items()}}
+
+
+def _batch_key(model: Model, x: np.ndarray) -> str:
+    from src.infrastructure.result_cache import cache_key
+
+    digest = hashlib.blake2b(np.ascontiguousarray(x).tobytes(), digest_size=20).hexdigest()
+    return cache_key(f"sensitivity/{model.name}", model.version, {"rows": digest, "shape": list(x.shape)})
+
+
+def _row_ranges(n: int, batch_size: int) -> Iterator[Tuple[int, int]]:
+    """[0, n)'yi [0, 64), [64, 128), [128, 256), ... aralıklarına, onları da en çok batch_size satıra böler."""
+    start = 0
+    while start < n:
+        end = min(start + batch_size, max(MIN_BATCH_ROWS, 1 << start.bit_length()), n)
+        yield start, end
+        start = end
+
+
+def evaluate_design(name: str, blocks: Dict[str, np.ndarray], batch_size: int = 1024, workers: int = 0,
+                    cache=None) -> Tuple[Dict[str, np.ndarray], int]:
+    """
+    Tasarım bloklarını partiler halinde değerlendirir.
+
+    Parti sınırları N'den bağımsızdır (_row_ranges): satırlar iki kuvveti
+    aralıklarına ayrılır, batch_size yalnızca bu aralıkları böler. Böylece N = 2^k >= MIN_BATCH_ROWS
+    ile yapılmış bir koşunun partileri, daha büyük N'li koşunun önekiyle aynı
+    anahtarları üretir (ör. N=512'den sonra N=1024 yalnızca [512, 1024)'ü hesaplar).
+
+    Returns:
+        (blok adı -> (N, m) çıktılar, hesaplanan değerlendirme sayısı)
+    """
+    model = MODELS[name]
+    bounds = list(model.parameters.values())
+    batches, keys, results = [], [], {}
+    for block, unit in blocks.items():
+        x = scale(unit, bounds)
+        for start, end in _row_ranges(len(x), batch_size):
+            batches.append((block, start, x[start:end]))
+    missing = []
+    for index, (_, _, x) in enumerate(batches):
+        key = _batch_key(model, x) if cache is not None else None
+        keys.append(key)
+        hit = cache.get(key) if cache is not None else None
+        if hit is None:
+            missing.append(index)
+        else:
+            results[index] = hit["y"]
+
+    todo = [batches[index][2] for index in missing]
+    if workers > 1 and len(todo) > 1:
+        step = math.ceil(len(todo) / workers)
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [pool.submit(_evaluate_batches, name, todo[i:i + step]) for i in range(0, len(todo), step)]
+            computed = [y for future in futures for y in future.result()]
+    else:
+        computed = _evaluate_batches(name, todo)
+    for index, y in zip(missing, computed):
+        results[index] = y
+        if cache is not None:
+            cache.put(keys[index], {"y": y})
+
+    out: Dict[str, List[np.ndarray]] = {}
+    for index, (block, _, _) in enumerate(batches):
+        out.setdefault(block, []).append(results[index])
+    return {block: np.concatenate(parts) for block, parts in out.items()}, sum(len(x) for x in todo)
+
+
+def analyse(name: str, n: int = 1024, seed: int = 0, workers: int = 0, batch_size: int = 1024,
+            cache=None, n_bootstrap: int = 200) -> SensitivityReport:
+    """
+    Modelin tüm çıktıları için Sobol indislerini hesaplar.
+
+    Args:
+        name (str): MODELS anahtarı.
+        n (int): Taban örnek sayısı (ikinin kuvveti önerilir).
+        seed (int): Sobol dijital kaydırması ve bootstrap tohumu.
+        workers (int): > 1 ise partiler süreç havuzunda değerlendirilir.
+        batch_size (int): Vektörel çağrı başına satır.
+        cache: ResultCache (None: önbellek yok).
+        n_bootstrap (int): Güven aralığı yeniden örnekleme sayısı.
+
+    Raises:
+        KeyError: Model bilinmiyorsa.
+    """
+    started = time.perf_counter()
+    model = MODELS[name]
+    names = list(model.parameters)
+    design = saltelli_design(n, len(names), np.random.default_rng(seed))
+    y, computed = evaluate_design(name, design.blocks(), batch_size, workers, cache)
+    report = SensitivityReport(name, n, n * (len(names) + 2), computed)
+    rng = np.random.default_rng(seed)
+    for column, output in enumerate(model.outputs):
+        f_ab = np.column_stack([y[f"AB{i}"][:, column] for i in range(len(names))])
+        report.indices[output] = sobol_indices(names, y["A"][:, column], y["B"][:, column], f_ab,
+                                               n_bootstrap, rng)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def main(argv=None) -> None:
+    from src.infrastructure.result_cache import default_cache
+
+    parser = argparse.ArgumentParser(description="FAZZ-4 global duyarlılık analizi (Sobol)")
+    parser.add_argument("--model", choices=sorted(MODELS), required=True)
+    parser.add_argument("--n", type=int, default=1024, help="Taban örnek sayısı (ikinin kuvveti)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--bootstrap", type=int, default=200)
+    parser.add_argument("--threshold", type=float, default=0.01, help="Sabitlenebilir sayılan en büyük ST")
+    parser.add_argument("--no-cache", action="store_true", help="Disk sonuç önbelleğini kullanma")
+    args = parser.parse_args(argv)
+
+    cache = None if args.no_cache else default_cache()
+    report = analyse(args.model, args.n, args.seed, args.workers, args.batch_size, cache, args.bootstrap)
+    print(f"{report.model}: N={report.n} · {report.evaluations:,} değerlendirme "
+          f"({report.computed:,} hesaplandı, {report.evaluations - report.computed:,} önbellekten) · "
+          f"{report.seconds:.2f} s")
+    for output, indices in report.indices.items():
+        print(f"\n  {output} (V = {indices.variance:.4g})")
+        for name, s1, c1, st, ct in zip(indices.names, indices.first_order, indices.first_order_conf,
+                                        indices.total_order, indices.total_order_conf):
+            print(f"    {name:<18} S1 = {s1:6.3f} ± {c1:.3f}   ST = {st:6.3f} ± {ct:.3f}")
+    negligible = report.negligible(args.threshold)
+    print(f"\nSabitlenebilir (ST < {args.threshold:g}): {', '.join(negligible) if negligible else '-'}")
+
+
+if __name__ == "__main__":
+    main()
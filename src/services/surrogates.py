@@ -0,0 +1,299 @@
+"""
+FAZZ-4 VEKİL MODEL KATMANI (What-if sorguları)
+
+Kokpit kaydırıcıları her hareket ettiğinde topluluk simülasyonu koşturmak
+yerine, parametre uzayında önceden eğitilmiş PCE vekil modelleri
+(src.core.surrogate) sorgulanır. Yanıt mikro saniyeler mertebesindedir ve
+her çıktı bir hata kestirimiyle (std) döner.
+
+Hedefler (TARGETS):
+    ignition : (n_observer, burn_rate, fuel_tank)        -> itki ve olurluk (FAZZ-6)
+    reactor  : (n_observer, cross_section, total_cycles) -> valf ve basınç (FAZZ-5.1)
+    arrival  : (fuel_pressure, target_velocity)          -> frenleme süresi (FAZZ-10)
+
+Eğitim alanı dışındaki sorgular gerçek simülasyona düşer (source="simulation").
+Eğitilmemiş hedefler de her sorguyu simülasyonla yanıtlar. Simülasyonun
+maliyeti parametrelerle büyüdüğünden (ör. fuel_tank / burn_rate saniye
+sayısını belirler) yedek yol sınırlıdır: nokta, eğitim aralığının her iki
+yanına FALLBACK_MARGIN genişlik kadar açılmış yedek alanda olmalı ve tek
+istekte en fazla MAX_FALLBACK_POINTS nokta simülasyona düşebilir.
+
+CLI:
+    python -m src.services.surrogates --target ignition --points 400 --degree 6 --workers 4
+"""
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.surrogate import PolynomialChaosSurrogate
+
+DEFAULT_ROOT = os.environ.get("FAZZ4_SURROGATE_DIR", "models/surrogates")
+FALLBACK_MARGIN = 0.5       # Yedek alan: eğitim aralığı ± bu oran × genişlik
+MAX_FALLBACK_POINTS = 16    # Tek istekte simülasyona düşebilecek en fazla nokta
+
+
+# --- Simülasyon hedefleri (süreç havuzunda çalışır; modül düzeyinde olmalı) ---
+
+def simulate_ignition(params: Mapping[str, float], n_samples: int = 4096, seed: int = 0) -> Dict[str, float]:
+    from src.core.propulsion import alloy_composition, ignition_monte_carlo, total_thrust
+    from src.services.design_optimizer import Constraints
+
+    alloy = alloy_composition(int(round(params["n_observer"])))
+    samples = ignition_monte_carlo(params["fuel_tank"], alloy.alloy_integrity, params["burn_rate"], n_samples,
+                                   np.random.default_rng(seed))
+    limits = Constraints()
+    feasible = ((samples["burn_seconds"] <= limits.max_burn_seconds)
+                & (samples["peak_thrust"] <= limits.max_peak_thrust))
+    return {"thrust_total": total_thrust(params["fuel_tank"], alloy.alloy_integrity),
+            "burn_seconds_mean": float(samples["burn_seconds"].mean()),
+            "peak_thrust_p99": float(np.percentile(samples["peak_thrust"], 99)),
+            "feasible_rate": float(feasible.mean())}
+
+
+def simulate_reactor(params: Mapping[str, float], n_seeds: int = 16, seed: int = 0) -> Dict[str, float]:
+    from src.simulation.fazz5_gadolinium_h2 import reactor_trajectory
+
+    runs = [reactor_trajectory(total_cycles=int(round(params["total_cycles"])), seed=seed * n_seeds + index,
+                               n_observer=int(round(params["n_observer"])), cross_section=params["cross_section"])
+            for index in range(n_seeds)]
+    return {"valve_releases": float(np.mean([run["valve"].sum() for run in runs])),
+            "peak_pressure": float(np.mean([run["pressure"].max() for run in runs])),
+            "h2_tank": float(np.mean([run["h2_tank"][-1] for run in runs]))}
+
+
+def simulate_arrival(params: Mapping[str, float], n_runs: int = 2000, seed: int = 0) -> Dict[str, float]:
+    from src.simulation.dynamics import simulate_phase
+
+    result = simulate_phase("mars_arrival", n_runs=n_runs, seed=seed,
+                            overrides={"fuel_pressure": params["fuel_pressure"],
+                                       "target_velocity": params["target_velocity"]})
+    return {"duration_mean": float(result.t.mean()), "duration_p95": float(np.percentile(result.t, 95)),
+            "integrity_mean": float(result.y[:, 2].mean())}
+
+
+@dataclass(frozen=True)
+class Target:
+    """
+    Vekil modeli eğitilebilen bir simülasyon.
+
+    Attributes:
+        name (str): Hedef adı (model dosyası adı).
+        parameters (dict): Parametre adı -> (lo, hi) eğitim aralığı.
+        outputs (Tuple[str, ...]): simulate çıktısındaki anahtarlar.
+        simulate (Callable): params -> {çıktı: değer}.
+        degree (int): Varsayılan PCE derecesi.
+    """
+    name: str
+    parameters: Dict[str, Tuple[float, float]]
+    outputs: Tuple[str, ...]
+    simulate: Callable[[Mapping[str, float]], Dict[str, float]]
+    degree: int = 4
+
+    def fallback_bounds(self, margin: float = FALLBACK_MARGIN) -> Dict[str, Tuple[float, float]]:
+        """
+        Simülasyonun yedek olarak koşturulabileceği aralıklar.
+
+        Eğitim aralığı her iki yana margin × genişlik kadar açılır; pozitif alt
+        sınırlar en fazla (1 - margin) katına iner, sıfıra veya eksiye geçmez
+        (ör. burn_rate → 0 yanma süresini ve bellek kullanımını sınırsız yapar).
+        """
+        bounds = {}
+        for key, (lo, hi) in self.parameters.items():
+            width = hi - lo
+            lower = lo - margin * width
+            if lo > 0:
+                lower = max(lower, lo * (1 - margin))
+            bounds[key] = (lower, hi + margin * width)
+        return bounds
+
+
+TARGETS: Dict[str, Target] = {
+    "ignition": Target("ignition", {"n_observer": (1, 64), "burn_rate": (50.0, 1000.0), "fuel_tank": (1000.0, 10000.0)},
+                       ("thrust_total", "burn_seconds_mean", "peak_thrust_p99", "feasible_rate"),
+                       simulate_ignition, degree=6),
+    "reactor": Target("reactor", {"n_observer": (4, 40), "cross_section": (100_000.0, 400_000.0),
+                                  "total_cycles": (100, 2000)},
+                      ("valve_releases", "peak_pressure", "h2_tank"), simulate_reactor, degree=5),
+    "arrival": Target("arrival", {"fuel_pressure": (60.0, 100.0), "target_velocity": (10_000.0, 20_000.0)},
+                      ("duration_mean", "duration_p95", "integrity_mean"), simulate_arrival, degree=5),
+}
+
+
+# --- Eğitim ---
+
+def latin_hypercube(bounds: Sequence[Tuple[float, float]], n_points: int, rng: np.random.Generator) -> np.ndarray:
+    """Her boyutta n_points eşit tabakaya birer nokta düşen (n_points, d) tasarım."""
+    bounds = np.asarray(bounds, dtype=np.float64)
+    strata = (rng.permuted(np.tile(np.arange(n_points), (len(bounds), 1)), axis=1).T
+              + rng.uniform(size=(n_points, len(bounds)))) / n_points
+    return bounds[:, 0] + strata * (bounds[:, 1] - bounds[:, 0])
+
+
+def _simulate_many(name: str, points: List[Dict[str, float]], seeds: List[int]) -> List[Dict[str, float]]:
+    return [TARGETS[name].simulate(point, seed=seed) for point, seed in zip(points, seeds)]
+
+
+def train(name: str, n_points: int = 256, degree: Optional[int] = None, seed: int = 0,
+          workers: int = 0) -> PolynomialChaosSurrogate:
+    """
+    Hedefin parametre uzayında Latin hiperküp tasarımıyla simülasyon koşturur
+    ve PCE modelini uydurur. Simülasyonlar workers > 1 ise süreç havuzunda çalışır.
+    """
+    target = TARGETS[name]
+    names = list(target.parameters)
+    x = latin_hypercube(list(target.parameters.values()), n_points, np.random.default_rng(seed))
+    points = [dict(zip(names, map(float, row))) for row in x]
+    # Her nokta ayrı tohumla koşar: LOO artıkları Monte Carlo gürültüsünü de içerir ve
+    # std, tek bir tohumun gerçekleşmesine değil simülasyonun kendisine göre kalibre olur.
+    seeds = [seed * n_points + index for index in range(n_points)]
+    if workers > 1:
+        step = math.ceil(len(points) / workers)
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [pool.submit(_simulate_many, name, points[i:i + step], seeds[i:i + step])
+                       for i in range(0, len(points), step)]
+            results = [result for future in futures for result in future.result()]
+    else:
+        results = _simulate_many(name, points, seeds)
+    y = np.array([[result[output] for output in target.outputs] for result in results])
+    model = PolynomialChaosSurrogate(names, list(target.parameters.values()), target.outputs,
+                                     degree=degree or target.degree)
+    return model.fit(x, y)
+
+
+# --- Sorgulama ---
+
+class SurrogateRegistry:
+    """
+    Diskteki eğitilmiş modelleri yükler ve sorguları yanıtlar.
+
+    Model dosyası değişirse (yeniden eğitim) bir sonraki sorguda yeniden yüklenir.
+
+    Args:
+        root (str | Path): <root>/<hedef>.npz dosyalarının dizini.
+    """
+
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = Path(root)
+        self._models: Dict[str, Tuple[float, PolynomialChaosSurrogate]] = {}
+        self.surrogate_hits = 0
+        self.fallbacks = 0
+
+    def path(self, name: str) -> Path:
+        return self.root / f"{name}.npz"
+
+    def model(self, name: str) -> Optional[PolynomialChaosSurrogate]:
+        path = self.path(name)
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            self._models.pop(name, None)
+            return None
+        cached = self._models.get(name)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, PolynomialChaosSurrogate.load(path))
+            self._models[name] = cached
+        return cached[1]
+
+    def save(self, name: str, model: PolynomialChaosSurrogate) -> Path:
+        return model.save(self.path(name))
+
+    def describe(self) -> Dict[str, dict]:
+        out = {}
+        for name, target in TARGETS.items():
+            model = self.model(name)
+            out[name] = {"parameters": {key: list(bound) for key, bound in target.parameters.items()},
+                         "outputs": list(target.outputs), "trained": model is not None}
+            if model is not None:
+                out[name].update(model.describe())
+        return out
+
+    def _split(self, name: str, points: Sequence[Mapping[str, float]]):
+        # (x, inside, model): doğrulanmış parametre matrisi ve vekil alanı maskesi
+        target = TARGETS[name]
+        names = list(target.parameters)
+        missing = [key for point in points for key in names if key not in point]
+        if missing:
+            raise ValueError(f"Eksik parametre(ler): {sorted(set(missing))}")
+        x = np.array([[float(point[key]) for key in names] for point in points], dtype=np.float64).reshape(-1, len(names))
+        if not np.isfinite(x).all():
+            raise ValueError("Parametreler sonlu olmalıdır.")
+        model = self.model(name)
+        inside = model.in_domain(x) if model is not None else np.zeros(len(x), dtype=bool)
+        fallback = x[~inside]
+        if len(fallback) > MAX_FALLBACK_POINTS:
+            raise ValueError(f"{len(fallback)} nokta eğitim alanı dışında; simülasyona en fazla "
+                             f"{MAX_FALLBACK_POINTS} nokta düşebilir.")
+        for column, (key, (lo, hi)) in enumerate(target.fallback_bounds().items()):
+            outside = (fallback[:, column] < lo) | (fallback[:, column] > hi)
+            if outside.any():
+                raise ValueError(f"{key}={fallback[outside, column][0]:g} izin verilen aralığın dışında "
+                                 f"[{lo:g}, {hi:g}]")
+        return x, inside, model
+
+    def validate(self, name: str, points: Sequence[Mapping[str, float]]) -> int:
+        """
+        Noktaları simülasyon koşturmadan doğrular; simülasyona düşecek nokta sayısını döndürür.
+
+        Raises:
+            KeyError: Hedef bilinmiyorsa.
+            ValueError: Bir noktada parametre eksik ya da sonlu değilse, simülasyona
+                düşecek bir nokta yedek alanın (Target.fallback_bounds) dışındaysa
+                veya bu noktalar MAX_FALLBACK_POINTS'i aşıyorsa.
+        """
+        return int((~self._split(name, points)[1]).sum())
+
+    def predict(self, name: str, points: Sequence[Mapping[str, float]]) -> List[dict]:
+        """
+        Noktaların tahminleri. Alan içindekiler tek vektörel çağrıda vekil
+        modelden, diğerleri gerçek simülasyondan (std=None) gelir.
+
+        Raises:
+            KeyError, ValueError: validate ile aynı koşullarda.
+        """
+        target = TARGETS[name]
+        names = list(target.parameters)
+        x, inside, model = self._split(name, points)
+
+        results: List[Optional[dict]] = [None] * len(x)
+        if inside.any():
+            mean, std = model.predict(x[inside])
+            for row, m, s in zip(np.flatnonzero(inside), mean.tolist(), std.tolist()):
+                results[row] = {"source": "surrogate", "outputs": {
+                    output: {"value": value, "std": error} for output, value, error in zip(target.outputs, m, s)}}
+            self.surrogate_hits += int(inside.sum())
+        for row in np.flatnonzero(~inside):
+            simulated = target.simulate(dict(zip(names, x[row].tolist())))
+            results[row] = {"source": "simulation", "outputs": {
+                output: {"value": simulated[output], "std": None} for output in target.outputs}}
+            self.fallbacks += 1
+        return results
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="FAZZ-4 vekil model eğitimi")
+    parser.add_argument("--target", choices=sorted(TARGETS), required=True)
+    parser.add_argument("--points", type=int, default=256)
+    parser.add_argument("--degree", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--root", default=DEFAULT_ROOT)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    model = train(args.target, args.points, args.degree, args.seed, args.workers)
+    path = SurrogateRegistry(args.root).save(args.target, model)
+    print(f"{args.target}: {model.n_train} nokta · {len(model.indices)} terim · "
+          f"{time.perf_counter() - started:.1f} s -> {path}")
+    for output, rmse in zip(model.outputs, model.loo_rmse):
+        print(f"  {output:<20} LOO RMSE = {rmse:.6g}")
+
+
+if __name__ == "__main__":
+    main()
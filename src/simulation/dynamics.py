@@ -0,0 +1,268 @@
+"""
+FAZZ-8..13 KİNEMATİK FAZLARIN TÜREV FONKSİYONLARI
+
+Her fazın elle yazılmış skaler Euler döngüsü burada sürekli zamanlı bir
+türev fonksiyonu olarak ifade edilir ve src.core.integrators ile tüm topluluk
+için tek çağrıda entegre edilir. Zaman birimi, orijinal döngülerin bir adımıdır
+(tick); durum birimleri orijinal sınıflarla aynıdır.
+
+Fazlar:
+    launch_ascent   (FAZZ-8)  durum: [irtifa km, hız km/h]
+    tmi_burn        (FAZZ-9)  durum: [hız km/h]
+    mars_arrival    (FAZZ-10) durum: [hız km/h, Mars'a mesafe km, zırh %]
+    mars_landing    (FAZZ-11) durum: [irtifa m, hız km/h, gövde °C]  (atmosferik giriş)
+    earth_reentry   (FAZZ-13) durum: [irtifa m, tepe sıcaklık °C]
+
+Türev fonksiyonuyla ifade edilemeyen ayrık sıçramalar (Ag-Gd boşaltımında
+1500 → 1200 °C sıfırlaması, tick başına çekilen sürtünme ısısının tepe değeri)
+fazın observe dönüşümüyle entegrasyondan sonra kapalı biçimde uygulanır.
+Orijinal döngülerin her tick'te yeniden çektiği gürültü (FAZZ-10 frenleme ve
+zırh stresi) TickNoise ile tick başına çekilir; koşu başına tek çekiliş
+topluluğun dağılımını bozar.
+
+Örnek:
+    result = simulate_phase("mars_arrival", n_runs=100_000, seed=7, method="dopri")
+    result.y[:, 0]   # tüm koşuların yörünge giriş hızları
+"""
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, Optional
+
+import numpy as np
+
+from src.core.integrators import IntegrationResult, dormand_prince, rk4
+from src.simulation.fazz11_mars_landing import HULL_LIMIT_C
+
+# Ayrık çarpanların sürekli karşılıkları: x_{k+1} = g·x_k  <=>  dx/dt = ln(g)·x
+PHASE_VERSION = 3   # Faz mantığı değiştiğinde artırılır; disk önbelleğindeki eski topluluk sonuçları geçersizleşir
+_ASCENT_RATE = math.log(1.05)
+_ENTRY_DRAG = math.log(0.95)
+_HULL_RESET_C = 1200.0          # Ag-Gd boşaltımından sonraki gövde sıcaklığı (°C)
+_REENTRY_ALTITUDE_M = 100000.0  # Karman Hattı
+_REENTRY_STEP_M = 2500.0        # Dünya'ya girişte tick başına irtifa kaybı
+
+
+@dataclass(frozen=True)
+class Phase:
+    """
+    Entegre edilebilir bir kinematik faz.
+
+    Attributes:
+        initial_state (Callable): (n_runs, rng) -> (y0, params) üretir.
+        derivative (Callable): params -> f(t, y) türev fonksiyonu.
+        stop (Callable): params -> stop(t, y) durma koşulu.
+        state_names (tuple): Durum sütunlarının adları.
+        t_max (float): Güvenlik için en uzun faz süresi (tick).
+        observe (Callable): (params, t, y) -> y; entegre edilen son durumu
+            raporlanan sütunlara dönüştürür. None ise durum olduğu gibi döner.
+    """
+    initial_state: Callable
+    derivative: Callable
+    stop: Callable
+    state_names: tuple
+    t_max: float
+    observe: Optional[Callable] = None
+
+
+# --- FAZZ-8: Tırmanış. v_{k+1} = 1.05·v_k + 150, h += v/3600 ---
+
+def _ascent_init(n_runs, rng):
+    y0 = np.zeros((n_runs, 2))
+    return y0, {"target_altitude": np.full(n_runs, 400.0)}
+
+def _ascent_derivative(params):
+    # Doğrusal ODE'nin tam ayrık karşılığı: dv/dt = r·(v + 3000), r = ln(1.05)
+    def f(t, y):
+        return np.column_stack([y[:, 1] / 3600, _ASCENT_RATE * (y[:, 1] + 3000.0)])
+    return f
+
+def _ascent_stop(params):
+    return lambda t, y: y[:, 0] >= params["target_altitude"]
+
+
+# --- FAZZ-9: TMI yakması. v += basınç·100 + 50·k ---
+
+def _tmi_init(n_runs, rng):
+    y0 = np.full((n_runs, 1), 38650.0)
+    return y0, {"fuel_pressure": np.full(n_runs, 78.0), "target_velocity": np.full(n_runs, 40320.0 * 1.5)}
+
+def _tmi_derivative(params):
+    def f(t, y):
+        return (params["fuel_pressure"] * 100 + 50 * (t + 0.5))[:, None]
+    return f
+
+def _tmi_stop(params):
+    return lambda t, y: y[:, 0] >= params["target_velocity"]
+
+
+class TickNoise:
+    """
+    Tick başına bağımsız çekilişlerin birikimli toplamı, gerektikçe bloklar hâlinde üretilir.
+
+    cumulative[:, k], 1..k tick'lerinin çekilişlerinin toplamıdır; tick içinde
+    doğrusal aralanır. Böylece tick sınırlarına hizalı RK4 adımları toplamı kesin
+    integre eder. Bloklar sırayla çekildiğinden sonuç yalnızca tohuma bağlıdır,
+    hangi t'lerin sorgulandığına bağlı değildir.
+    """
+
+    def __init__(self, rng: np.random.Generator, n_runs: int, low: float, high: float,
+                 every: int = 1, block: int = 128):
+        self._rng, self._low, self._high, self._every, self._block = rng, low, high, every, block
+        self.cumulative = np.zeros((n_runs, 1))
+
+    def _extend(self, ticks: int) -> None:
+        while self.cumulative.shape[1] <= ticks:
+            first = self.cumulative.shape[1]
+            draws = self._rng.uniform(self._low, self._high, (self.cumulative.shape[0], self._block))
+            draws[:, (np.arange(first, first + self._block) % self._every) != 0] = 0.0
+            self.cumulative = np.hstack([self.cumulative, self.cumulative[:, -1:] + np.cumsum(draws, axis=1)])
+
+    def at(self, t: np.ndarray) -> np.ndarray:
+        """t anına kadar birikmiş toplam (tick içinde doğrusal)."""
+        k = np.floor(t).astype(np.int64)
+        self._extend(int(k.max()) + 1)
+        rows = np.arange(len(k))
+        base = self.cumulative[rows, k]
+        return base + (t - k) * (self.cumulative[rows, k + 1] - base)
+
+    def completed(self, t: np.ndarray) -> np.ndarray:
+        """Tamamlanmış tick'lerin (floor t) toplamı; basamaklı büyüklükler için."""
+        k = np.floor(t + 1e-9).astype(np.int64)
+        self._extend(int(k.max()))
+        return self.cumulative[np.arange(len(k)), k]
+
+
+# --- FAZZ-10: Frenleme. v -= basınç·200 + U(0, 500); mesafe -= v/3600·0.1; her 10. tick zırh -= U(0.01, 0.05) ---
+# Durumun hız sütunu yalnızca deterministik frenlemeyi taşır; tick başına çekilen
+# rastgele frenleme (TickNoise) durma koşulunda ve gözlemde çıkarılır.
+
+def _arrival_init(n_runs, rng):
+    y0 = np.column_stack([np.full(n_runs, 1_200_000.0), np.full(n_runs, 112_500_000.0), np.full(n_runs, 100.0)])
+    jitter_rng, stress_rng = rng.spawn(2)
+    return y0, {
+        "fuel_pressure": np.full(n_runs, 78.0),
+        "jitter": TickNoise(jitter_rng, n_runs, 0.0, 500.0),
+        "stress": TickNoise(stress_rng, n_runs, 0.01, 0.05, every=10),
+        "target_velocity": np.full(n_runs, 14_000.0),
+    }
+
+def _arrival_derivative(params):
+    def f(t, y):
+        velocity = y[:, 0] - params["jitter"].at(t)
+        return np.column_stack([-params["fuel_pressure"] * 200,
+                                -velocity / 3600 * 0.1, np.zeros(y.shape[0])])
+    return f
+
+def _arrival_stop(params):
+    return lambda t, y: y[:, 0] - params["jitter"].at(t) <= params["target_velocity"]
+
+def _arrival_observe(params, t, y):
+    y = y.copy()
+    y[:, 0] -= params["jitter"].at(t)
+    y[:, 2] -= params["stress"].completed(t)
+    return y
+
+
+# --- FAZZ-11: Atmosferik giriş. h -= v/100, v *= 0.95, ısı += U(50, 150); ısı > 1500 ise 1200 ---
+
+def _landing_init(n_runs, rng):
+    y0 = np.column_stack([np.full(n_runs, 400000.0), np.full(n_runs, 14000.0 - 3 * 2000), np.full(n_runs, -120.0)])
+    return y0, {"heating": rng.uniform(50, 150, n_runs), "floor_altitude": np.full(n_runs, 10000.0)}
+
+def _landing_derivative(params):
+    def f(t, y):
+        # Gövde sütunu boşaltımsız toplam ısıdır; sıfırlama _landing_observe'da uygulanır
+        return np.column_stack([-y[:, 1] / 100, _ENTRY_DRAG * y[:, 1], params["heating"]])
+    return f
+
+def _landing_stop(params):
+    return lambda t, y: y[:, 0] <= params["floor_altitude"]
+
+def _landing_observe(params, t, y):
+    # Sabit tick ısısı h ile orijinal döngü kapalı biçimde çözülür: ilk first tick
+    # doğrudan ısınır, ardından gövde her cycle tick'te bir 1500'ü aşıp 1200'e döner.
+    heating, start = params["heating"], -120.0
+    ticks = np.asarray(t, dtype=np.float64)
+    first = np.floor((HULL_LIMIT_C - start) / heating) + 1
+    cycle = np.floor((HULL_LIMIT_C - _HULL_RESET_C) / heating) + 1
+    reset = _HULL_RESET_C + np.mod(ticks - first, cycle) * heating
+    y = y.copy()
+    y[:, 2] = np.where(ticks < first, y[:, 2], reset)
+    return y
+
+
+# --- FAZZ-13: Dünya'ya giriş. h -= 2500, ısı = 2000 + randint(0, 1500), tepe = max(ısı) ---
+
+def _reentry_init(n_runs, rng):
+    # Tick ısıları kinematikten bağımsızdır: 40 tick'in çekilişleri baştan alınır,
+    # tepe sütunu gözlemde tamamlanan tick sayısına göre okunur (reentry_frames ile aynı dağılım)
+    ticks = math.ceil(_REENTRY_ALTITUDE_M / _REENTRY_STEP_M)
+    draws = 2000 + rng.integers(0, 1500, size=(n_runs, ticks), endpoint=True, dtype=np.int16)
+    y0 = np.column_stack([np.full(n_runs, _REENTRY_ALTITUDE_M), np.zeros(n_runs)])
+    return y0, {"running_peak": np.maximum.accumulate(draws, axis=1)}
+
+def _reentry_derivative(params):
+    def f(t, y):
+        return np.column_stack([np.full(y.shape[0], -_REENTRY_STEP_M), np.zeros(y.shape[0])])
+    return f
+
+def _reentry_stop(params):
+    return lambda t, y: y[:, 0] <= 0
+
+def _reentry_observe(params, t, y):
+    running_peak = params["running_peak"]
+    ticks = np.clip(np.ceil(t - 1e-9).astype(np.int64), 0, running_peak.shape[1])
+    y = y.copy()
+    y[:, 1] = np.where(ticks > 0, running_peak[np.arange(y.shape[0]), np.maximum(ticks - 1, 0)], 0.0)
+    return y
+
+
+PHASES: Dict[str, Phase] = {
+    "launch_ascent": Phase(_ascent_init, _ascent_derivative, _ascent_stop, ("altitude_km", "velocity_kmh"), 500),
+    "tmi_burn": Phase(_tmi_init, _tmi_derivative, _tmi_stop, ("velocity_kmh",), 500),
+    "mars_arrival": Phase(_arrival_init, _arrival_derivative, _arrival_stop,
+                          ("velocity_kmh", "distance_km", "integrity"), 1000, _arrival_observe),
+    "mars_landing": Phase(_landing_init, _landing_derivative, _landing_stop,
+                          ("altitude_m", "velocity_kmh", "hull_temp_c"), 300, _landing_observe),
+    "earth_reentry": Phase(_reentry_init, _reentry_derivative, _reentry_stop,
+                           ("altitude_m", "max_temp_c"), 100, _reentry_observe),
+}
+
+
+def simulate_phase(name: str, n_runs: int = 1, seed: int = 0, method: str = "rk4",
+                   dt: float = 1.0, overrides: Optional[Mapping[str, float]] = None,
+                   **tolerances) -> IntegrationResult:
+    """
+    Bir kinematik fazı tüm topluluk için tek çağrıda entegre eder.
+
+    Args:
+        name (str): PHASES içindeki faz adı.
+        n_runs (int): Topluluk büyüklüğü.
+        seed (int): Koşu parametrelerinin rastgelelik tohumu.
+        method (str): "rk4" (sabit adım dt) veya "dopri" (uyarlamalı).
+        dt (float): RK4 adım büyüklüğü (tick).
+        overrides (Mapping[str, float]): Faz parametrelerini tüm koşular için
+            sabit değerle değiştirir (ör. {"fuel_pressure": 90.0}).
+        **tolerances: dormand_prince'e iletilen rtol/atol/h_max. h_max verilmezse
+            dt kullanılır; böylece durma koşulu en fazla bir tick geç yakalanır.
+
+    Returns:
+        IntegrationResult: t sütunu faz süresidir (tick).
+    """
+    phase = PHASES[name]
+    y0, params = phase.initial_state(n_runs, np.random.default_rng(seed))
+    for key, value in (overrides or {}).items():
+        if key not in params:
+            raise ValueError(f"{name} fazının '{key}' parametresi yok (geçerli: {', '.join(params)})")
+        params[key] = np.full(n_runs, float(value))
+    f, stop = phase.derivative(params), phase.stop(params)
+    if method == "rk4":
+        result = rk4(f, y0, dt=dt, t_end=phase.t_max, stop=stop)
+    elif method == "dopri":
+        tolerances.setdefault("h_max", dt)
+        result = dormand_prince(f, y0, t_end=phase.t_max, stop=stop, **tolerances)
+    else:
+        raise ValueError(f"Bilinmeyen entegrasyon yöntemi: {method}")
+    if phase.observe is not None:
+        result.y = phase.observe(params, result.t, result.y)
+    return result
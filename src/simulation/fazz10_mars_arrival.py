@@ -2,6 +2,36 @@ import time
 import sys
 import random
 
+
+def suicide_burn_frames(velocity: float = 1_200_000.0, target_velocity: float = 14_000.0,
+                        distance_to_mars: float = 112_500_000, integrity: float = 100.0,
+                        fuel_pressure: float = 78.0, rng=random):
+    """
+    Frenleme (Suicide Burn) fazının I/O içermeyen adım üreteci.
+
+    Args:
+        rng: uniform() sağlayan rastgele kaynak; varsayılan global random modülü.
+
+    Yields:
+        dict: burn_cycle, velocity_kmh, distance_km, integrity, deceleration
+    """
+    burn_cycle = 0
+    while velocity > target_velocity:
+        burn_cycle += 1
+
+        # Frenleme Formülü (Derzz Fiziği: Ters İvme)
+        deceleration = (fuel_pressure * 200) + rng.uniform(0, 500)
+        velocity -= deceleration
+        distance_to_mars -= (velocity / 3600) * 0.1  # Zaman ölçeklemesi
+
+        # Zırh Stresi (Frenleme sırasında yapısal yük)
+        if burn_cycle % 10 == 0:
+            integrity -= rng.uniform(0.01, 0.05)
+
+        yield {"burn_cycle": burn_cycle, "velocity_kmh": velocity, "distance_km": distance_to_mars,
+               "integrity": integrity, "deceleration": deceleration}
+
+
 class DerzzMarsArrival:
     """
     FAZZ-10: MARS ARRIVAL (FLIP & BURN) PROTOCOL
@@ -17,13 +47,15 @@ class DerzzMarsArrival:
         fuel_pressure (float): Yakıt basıncı (Bar).
     """
     
-    def __init__(self):
+    def __init__(self, banner: bool = True):
         self.velocity = 1_200_000.0       # km/h (Maksimum Seyir Hızı)
         self.target_velocity = 14_000.0   # km/h (Yörüngeye Giriş Hızı)
         self.distance_to_mars = 112_500_000 # km (Yarı yol/Frenleme Başlangıcı)
         self.integrity = 100.0            # Zırh %
         self.fuel_pressure = 78.0         # Bar
-        
+
+        if not banner:
+            return
         print("\033[1;36m>>> FAZZ-10: MARS YAKLAŞMA VE FRENLEME PROTOKOLÜ AKTİF <<<\033[0m")
         print("\033[1;33m[NAVİGASYON] Yarı Yol (Midpoint) Geçildi. Dönüş Hazırlığı...\033[0m")
         time.sleep(1)
@@ -53,22 +85,12 @@ class DerzzMarsArrival:
         print(f"\n\033[1;31m[KOMUTAN] FRENLEME BAŞLATILIYOR (DECELERATION BURN)!\033[0m")
         time.sleep(1)
         
-        burn_cycle = 0
-        while self.velocity > self.target_velocity:
-            burn_cycle += 1
-            
-            # Frenleme Formülü (Derzz Fiziği: Ters İvme)
-            # Yakıt basıncı ve rastgele faktörlerle frenleme gücü
-            deceleration = (self.fuel_pressure * 200) + random.uniform(0, 500)
-            
-            # Hız düşüşü ve mesafe kısalması
-            self.velocity -= deceleration
-            self.distance_to_mars -= (self.velocity / 3600) * 0.1 # Zaman ölçeklemesi
-            
-            # Zırh Stresi (Frenleme sırasında yapısal yük)
-            if burn_cycle % 10 == 0:
-                stress = random.uniform(0.01, 0.05)
-                self.integrity -= stress
+        for frame in suicide_burn_frames(self.velocity, self.target_velocity, self.distance_to_mars,
+                                         self.integrity, self.fuel_pressure):
+            burn_cycle, deceleration = frame["burn_cycle"], frame["deceleration"]
+            self.velocity = frame["velocity_kmh"]
+            self.distance_to_mars = frame["distance_km"]
+            self.integrity = frame["integrity"]
 
             # Durum Güncellemesi (Her 15 döngüde veya son aşamada)
             if burn_cycle % 15 == 0 or self.velocity <= self.target_velocity + deceleration:
@@ -106,6 +128,45 @@ class DerzzMarsArrival:
         print(f"\n\n\033[1;35m>>> GÖREV BAŞARILI: DERZZ-ONE MARS YÖRÜNGESİNDE! <<<\033[0m")
         print(f"\033[1;32m[GÖRÜNTÜ] Kızıl Gezegen Pencerede. Olympus Mons Selamlıyor.\033[0m")
 
+    # --- Eşzamansız fazlar (canlı oturumlar; çıktı yok, time.sleep yerine clock.sleep) ---
+
+    async def flip_maneuver_async(self, clock):
+        """flip_maneuver'ın adım başına kare veren eşzamansız sürümü."""
+        for angle in (0, 45, 90, 135, 180):
+            yield {"phase": "flip", "angle_deg": angle}
+            await clock.sleep(0.3)
+        await clock.sleep(1)
+
+    async def suicide_burn_async(self, clock, rng=random):
+        """suicide_burn'ün eşzamansız sürümü; her frenleme döngüsü bir karedir."""
+        await clock.sleep(1)
+        for frame in suicide_burn_frames(self.velocity, self.target_velocity, self.distance_to_mars,
+                                         self.integrity, self.fuel_pressure, rng):
+            self.velocity = frame["velocity_kmh"]
+            self.distance_to_mars = frame["distance_km"]
+            self.integrity = frame["integrity"]
+            yield {"phase": "burn", **frame}
+            # Betikle aynı tempo: durum satırı basılan döngülerde 0.05 s
+            if frame["burn_cycle"] % 15 == 0 or self.velocity <= self.target_velocity + frame["deceleration"]:
+                await clock.sleep(0.05)
+        await clock.sleep(1)
+
+    async def orbital_insertion_async(self, clock):
+        """orbital_insertion'ın eşzamansız sürümü; her alçalma adımı bir karedir."""
+        await clock.sleep(1)
+        orbit_alt, target_orbit = 20000, 400 # km (Low Mars Orbit)
+        while orbit_alt > target_orbit:
+            orbit_alt = max(orbit_alt - 2000, target_orbit)
+            yield {"phase": "insertion", "orbit_alt_km": orbit_alt, "integrity": self.integrity}
+            await clock.sleep(0.1)
+
+    async def run_async(self, clock, rng=random):
+        """Üç fazın (dönüş, frenleme, yörüngeye giriş) ardışık kare akışı."""
+        for phase in (self.flip_maneuver_async(clock), self.suicide_burn_async(clock, rng),
+                      self.orbital_insertion_async(clock)):
+            async for frame in phase:
+                yield frame
+
 if __name__ == "__main__":
     arrival = DerzzMarsArrival()
     
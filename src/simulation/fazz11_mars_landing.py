@@ -2,6 +2,69 @@ import time
 import sys
 import random
 
+import numpy as np
+
+HULL_LIMIT_C = 1500.0           # Ag-Gd termal sınırı (Nizam); aşılınca Gd boşaltımı devreye girer
+ENTRY_HEATING = (50.0, 150.0)   # Giriş tick'i başına sürtünme ısısı (°C)
+MAX_ENTRY_TICKS = 100           # Üstünde giriş hızı ~0'a iner ve itkili iniş döngüsü pratikte bitmez
+
+
+def entry_peak_temperature(u: np.ndarray, start_temp: float = -120.0) -> np.ndarray:
+    """
+    atmospheric_entry ısı döngüsünün vektörel tekrarı.
+
+    Args:
+        u (np.ndarray): (n_runs, entry_ticks) U(0, 1) çekilişleri; tick ısısı
+            ENTRY_HEATING aralığına doğrusal eşlenir. Çekilişleri dışarıdan almak
+            antitetik / önem örneklemesi dönüşümlerine izin verir.
+        start_temp (float): Uzay soğuğundaki başlangıç sıcaklığı (°C).
+
+    Returns:
+        np.ndarray: Her koşunun girişte ulaştığı en yüksek gövde sıcaklığı
+        (1500 → 1200 kırpmasından önceki değer).
+    """
+    low, high = ENTRY_HEATING
+    hull_temp = np.full(u.shape[0], start_temp)
+    peak = hull_temp.copy()
+    for column in u.T:
+        hull_temp = hull_temp + low + (high - low) * column
+        np.maximum(peak, hull_temp, out=peak)
+        hull_temp = np.where(hull_temp > HULL_LIMIT_C, 1200.0, hull_temp)
+    return peak
+
+
+def descent_fuel(entry_ticks: int, velocity: float = 14000.0 - 3 * 2000, fuel: float = 12.0,
+                 floor_altitude: float = 10000.0) -> float:
+    """
+    touchdown döngüsünün I/O içermeyen tekrarı; kalan yakıt yüzdesini döndürür.
+
+    Girişin entry_ticks tick sürüp 10 km'de bittiği varsayılır (hız her tick'te
+    0.95 ile çarpılır). atmospheric_entry döngüsünün kendisi 10 km'ye inmez; bkz.
+    src.services.landing_estimation. İniş rastgelelik içermez; yakıt yalnızca
+    giriş süresine bağlıdır.
+
+    Raises:
+        ValueError: entry_ticks [0, MAX_ENTRY_TICKS] dışındaysa. 100 tick'te
+            iniş ~2.000 tick sürer; 200 tick'te hız 0.3 km/h'e düşer ve döngü
+            yüz binlerce tick'e uzar.
+    """
+    if not 0 <= entry_ticks <= MAX_ENTRY_TICKS:
+        raise ValueError(f"entry_ticks 0 ile {MAX_ENTRY_TICKS} arasında olmalıdır: {entry_ticks}")
+    velocity *= 0.95 ** entry_ticks
+    altitude = floor_altitude
+    while altitude > 0:
+        fuel -= 0.1
+        if fuel < 0:
+            fuel = 0
+        altitude -= velocity / 10
+        if altitude < 1000:
+            velocity = min(velocity, altitude / 2)
+        elif velocity > 300:
+            velocity -= 50
+        if altitude < 5:
+            altitude = 0
+    return fuel
+
 class DerzzMarsLanding:
     """
     FAZZ-11: THE LANDING (PRECISION DESCENT) PROTOCOL
@@ -17,13 +80,15 @@ class DerzzMarsLanding:
         hull_temp (float): Gövde sıcaklığı (°C).
     """
     
-    def __init__(self):
+    def __init__(self, banner: bool = True):
         self.altitude = 400000.0  # metre (400 km - Yörünge İrtifası)
         self.velocity = 14000.0   # km/h (Yörünge Hızı)
         self.fuel = 12.0          # % (Kalan Rezerv)
         self.hull_temp = -120.0   # °C (Uzay Soğuğu)
         self.status = "ORBITAL"
-        
+
+        if not banner:
+            return
         print("\033[1;31m>>> FAZZ-11: MARS YÜZEY İNİŞ PROTOKOLÜ (SILENT DESCENT) <<<\033[0m")
         print("\033[1;33m[KOMUTAN] 'Sakin İniş' Modu Aktif. Paraşütler Devre Dışı. Sadece İtki.\033[0m")
         time.sleep(1)
@@ -2,6 +2,17 @@ import time
 import sys
 import random
 
+import numpy as np
+
+# Drone keşif pencereleri: (başlangıç saati, bitiş saati, bölge) - uçlar hariç
+DISCOVERY_WINDOWS = [
+    (20, 30, "Krater (Düşük Koruma)"),
+    (40, 50, "Kanyon (Orta Koruma)"),
+    (70, 80, "Lava Tüpü (Mükemmel Koruma)"),
+]
+BEST_SITE = "Lava Tüpü (Mükemmel Koruma)"
+
+
 class DerzzMarsBase:
     """
     FAZZ-12: MARS COLONIZATION & QUANTUM LINK
@@ -18,13 +29,15 @@ class DerzzMarsBase:
         earth_link (str): Bağlantı durumu.
     """
     
-    def __init__(self):
+    def __init__(self, banner: bool = True):
         self.fuel_level = 9.5  # % (İniş sonrası kalan rezerv)
         self.days_passed = 0
         self.scout_drones = ["Alpha", "Beta", "Gamma"]
         self.best_location = None
         self.earth_link = "CONNECTED (QUANTUM)"
-        
+
+        if not banner:
+            return
         print("\033[1;31m>>> FAZZ-12: MARS YÜZEY OPERASYONU BAŞLATILDI <<<\033[0m")
         print("\033[1;36m[İLETİŞİM] Kuantum Dolanıklığı (Ag-Qubits) Aktif. Gecikme: 0.00 ms\033[0m")
         time.sleep(1)
@@ -109,6 +122,74 @@ class DerzzMarsBase:
         print(f"[SONUÇ] Dönüş Yakıtı: %{self.fuel_level:.1f} (Tam Kapasite)")
         print(f"[KONUM] En Uygun Üs Bölgesi: \033[1;32m{self.best_location}\033[0m")
         print("[HAZIRLIK] Eve Dönüş veya Kalıcı Üs Kurulumu İçin Hazır.")
+
+    def run_event_driven(self, total_hours: int = 96, seed: int = 0, step_hours: int = 4,
+                         discovery_windows=DISCOVERY_WINDOWS) -> dict:
+        """
+        run_4_day_cycle'ın ayrık olay (discrete-event) sürümü; I/O ve bekleme içermez.
+
+        Keşifler ve gün dönümleri olay olarak planlanır; saat doğrudan bir sonraki
+        olaya atlar. İki olay arasındaki radyasyon hasadı, aradaki 4 saatlik adım
+        sayısı kadar akının tek vektörel toplamıdır (akı pozitif olduğundan %100
+        tavanı olay anında uygulanabilir). Çok haftalık senaryolar olay sayısıyla
+        orantılı Python işi yapar.
+
+        Args:
+            total_hours (int): Senaryo süresi (saat).
+            seed (int): Radyasyon akısı tohumu.
+            step_hours (int): Hasat adımı (saat).
+            discovery_windows (list): (başlangıç, bitiş, bölge) keşif pencereleri.
+
+        Returns:
+            dict: fuel_level, days_passed, best_location, day_reports, events
+        """
+        from src.core.event_kernel import EventScheduler
+
+        rng = np.random.default_rng(seed)
+        kernel = EventScheduler()
+        harvested_until = 0
+        day_reports = []
+
+        def harvest_to(hour):
+            nonlocal harvested_until
+            steps = (int(hour) - harvested_until) // step_hours
+            if steps > 0:
+                flux = float(rng.uniform(1.2, 2.5, size=steps).sum())
+                self.fuel_level = min(100.0, self.fuel_level + flux)
+                harvested_until += steps * step_hours
+
+        def on_discovery(k, event):
+            harvest_to(k.now)
+            # Daha iyi bir yer bulursa günceller
+            if event.payload == BEST_SITE or self.best_location != BEST_SITE:
+                self.best_location = event.payload
+
+        def on_day(k, event):
+            harvest_to(k.now)
+            self.days_passed += 1
+            day_reports.append({"day": self.days_passed, "fuel_level": self.fuel_level})
+            if k.now + 24 <= total_hours:
+                k.schedule_in(24, "day")
+
+        kernel.on("discovery", on_discovery)
+        kernel.on("day", on_day)
+        for start, end, site in discovery_windows:
+            # Pencere içindeki ilk adım saati (run_4_day_cycle ile aynı ızgara)
+            first = (start // step_hours + 1) * step_hours
+            if first < end and first <= total_hours:
+                kernel.schedule(first, "discovery", site)
+        if total_hours >= 24:
+            kernel.schedule(24, "day")
+
+        kernel.run(until=total_hours)
+        harvest_to(total_hours)
+        return {
+            "fuel_level": self.fuel_level,
+            "days_passed": self.days_passed,
+            "best_location": self.best_location,
+            "day_reports": day_reports,
+            "events": kernel.processed,
+        }
         
         
 
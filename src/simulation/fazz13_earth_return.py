@@ -2,6 +2,31 @@ import time
 import sys
 import random
 
+
+def reentry_frames(altitude: float = 100000, rng=random):
+    """
+    Atmosferik giriş fazının I/O içermeyen adım üreteci.
+
+    Args:
+        altitude (float): Başlangıç irtifası (metre, Karman Hattı).
+        rng: randint() sağlayan rastgele kaynak; varsayılan global random modülü.
+
+    Yields:
+        dict: altitude_m, temp_c, max_temp_c, hull_critical
+    """
+    max_temp_reached = 0
+    while altitude > 0:
+        altitude -= 2500
+
+        # Sürtünme Isısı (Dünya'da çok yüksektir)
+        current_temp = 2000 + rng.randint(0, 1500)
+        if current_temp > max_temp_reached:
+            max_temp_reached = current_temp
+
+        yield {"altitude_m": altitude, "temp_c": current_temp, "max_temp_c": max_temp_reached,
+               "hull_critical": current_temp >= 3500}
+
+
 class DerzzEarthReturn:
     """
     FAZZ-13: THE HOMECOMING (RETURN TO EARTH) PROTOCOL
@@ -16,13 +41,15 @@ class DerzzEarthReturn:
         hull_temp (float): Gövde sıcaklığı (°C).
     """
     
-    def __init__(self):
+    def __init__(self, banner: bool = True):
         self.fuel = 74.8          # % (Mars'tan toplanan radyasyon hasadı)
         self.velocity = 0.0       # km/h
         self.distance_to_earth = 225_000_000 # km
         self.hull_temp = -60.0    # °C (Mars Yüzey Isısı)
         self.status = "PRE-LAUNCH"
-        
+
+        if not banner:
+            return
         print("\033[1;32m>>> FAZZ-13: DÜNYA'YA DÖNÜŞ PROTOKOLÜ (THE HOMECOMING) <<<\033[0m")
         print("\033[1;33m[KOMUTAN] Hafta sonu bitti. Eve dönüyoruz.\033[0m")
         time.sleep(1)
@@ -72,19 +99,14 @@ class DerzzEarthReturn:
         print("[BİLGİ] Dünya atmosferi Mars'tan 100 kat daha yoğundur. Zırh Testi Başlıyor.")
         time.sleep(1)
         
-        altitude = 100000 # metre (Karman Hattı)
         max_temp_reached = 0
         
-        while altitude > 0:
-            altitude -= 2500
-            
-            # Sürtünme Isısı (Dünya'da çok yüksektir)
-            current_temp = 2000 + random.randint(0, 1500)
-            if current_temp > max_temp_reached: 
-                max_temp_reached = current_temp
+        for frame in reentry_frames(100000): # metre (Karman Hattı)
+            altitude, current_temp = frame["altitude_m"], frame["temp_c"]
+            max_temp_reached = frame["max_temp_c"]
             
             # Ag-Gd Soğutma Tepkisi (Nizam)
-            hull_status = "\033[1;32mSTABİL\033[0m" if current_temp < 3500 else "\033[1;33mKRİTİK YÜK\033[0m"
+            hull_status = "\033[1;33mKRİTİK YÜK\033[0m" if frame["hull_critical"] else "\033[1;32mSTABİL\033[0m"
             
             # Görsel (Ateş Topu)
             fire = "🔥" * (current_temp // 500)
@@ -115,6 +137,47 @@ class DerzzEarthReturn:
         print("📢 'Hafta sonu tatilinden döndük. Pazartesi iş başı yapıyoruz.'")
         print("="*60 + "\033[0m")
 
+    # --- Eşzamansız fazlar (canlı oturumlar; çıktı yok, time.sleep yerine clock.sleep) ---
+
+    async def mars_ascent_async(self, clock):
+        """mars_ascent'in adım başına kare veren eşzamansız sürümü."""
+        self.status = "ASCENT"
+        await clock.sleep(1)
+        for i in range(1, 6):
+            self.velocity += 5000
+            self.fuel -= 0.5
+            yield {"phase": "ascent", "altitude_km": i * 50, "velocity_kmh": self.velocity, "fuel": self.fuel}
+            await clock.sleep(0.5)
+        await clock.sleep(1)
+
+    async def cruise_phase_async(self, clock):
+        """cruise_phase'in eşzamansız sürümü; her gün bir karedir."""
+        self.status = "CRUISE"
+        for day in ("Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma", "Cumartesi"):
+            self.distance_to_earth -= (225_000_000 / 6)
+            self.fuel -= 5.0
+            yield {"phase": "cruise", "day": day, "distance_km": max(0, self.distance_to_earth), "fuel": self.fuel}
+            await clock.sleep(0.8)
+        await clock.sleep(1)
+
+    async def earth_reentry_async(self, clock, rng=random):
+        """earth_reentry'nin eşzamansız sürümü; her irtifa adımı bir karedir."""
+        self.status = "REENTRY"
+        await clock.sleep(1)
+        for frame in reentry_frames(100000, rng):
+            self.hull_temp = frame["temp_c"]
+            yield {"phase": "reentry", **frame}
+            await clock.sleep(0.1)
+        self.status = "SPLASHDOWN"
+        await clock.sleep(1)
+
+    async def run_async(self, clock, rng=random):
+        """Kalkış, seyir ve atmosferik giriş fazlarının ardışık kare akışı."""
+        for phase in (self.mars_ascent_async(clock), self.cruise_phase_async(clock),
+                      self.earth_reentry_async(clock, rng)):
+            async for frame in phase:
+                yield frame
+
 if __name__ == "__main__":
     home = DerzzEarthReturn()
     
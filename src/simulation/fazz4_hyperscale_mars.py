@@ -3,12 +3,49 @@ import sys
 import random
 from datetime import datetime
 
+import numpy as np
+
 # --- FAZZ-4: HYPER-SCALE ARCHITECT (v4.2) ---
 # TARGET: MARS (225.0M KM) | STATUS: AGGRESSIVE SYNC
 # DOI: 10.5281/zenodo.DerzzProtocol
 
+def cruise_trajectory(target_dist: float = 225_000_000, seed: int = 0,
+                      c: float = 299.792, n_observer: int = 12) -> dict:
+    """
+    launch() döngüsünün I/O içermeyen, vektörel yörünge kaydı.
+
+    Formüller launch() ile aynıdır; her 10. döngüdeki rastgele boost dışında adım
+    sabittir. Uzun menziller (ör. target_dist=1e12) milyonlarca nokta üretir.
+
+    Args:
+        target_dist (float): Hedef mesafe (km).
+        seed (int): Boost rastgeleliği tohumu.
+        c (float): Işık hızı katsayısı.
+        n_observer (int): Nizam sabiti.
+
+    Returns:
+        dict: cycle, distance_km, integrity, energy sütunları (np.ndarray).
+    """
+    rng = np.random.default_rng(seed)
+    # En küçük boost 1.1 olduğundan döngü sayısı bu üst sınırı aşamaz
+    n = int(np.ceil(target_dist / (c * 800 * 1.1))) + 1
+    cycles = np.arange(1, n + 1, dtype=np.float64)
+    boost = np.full(n, 1.1)
+    boost[9::10] = rng.uniform(1.2, 2.0, size=len(boost[9::10]))
+    step = c * 800 * boost
+    distance = np.cumsum(step)
+    n = int(np.searchsorted(distance, target_dist, side="left")) + 1
+    cycles, step, distance = cycles[:n], step[:n], distance[:n]
+    return {
+        "cycle": cycles,
+        "distance_km": distance,
+        "integrity": (distance / 100) * (n_observer + 1),
+        "energy": np.cumsum((step * 0.00005) * (1 + cycles / 1000)),
+    }
+
+
 class Derzz_Architect_UI:
-    def __init__(self):
+    def __init__(self, banner: bool = True):
         self.C = 299.792    
         self.N_OBSERVER = 12  
         self.TARGET_DIST = 225_000_000 
@@ -16,7 +53,9 @@ class Derzz_Architect_UI:
         self.total_energy = 0.0
         self.cycle = 0
         self.log_file = "derzz_flight_archive.log"
-        
+
+        if not banner:
+            return
         # Başlangıç Ekranı
         print("\033[1;36m" + "╔" + "═"*58 + "╗")
         print(f"║ DERZZ PROTOCOL v4.2: COMMANDER INTERFACE{' '*16}║")
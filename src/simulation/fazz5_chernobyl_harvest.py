@@ -2,6 +2,38 @@ import time
 import random
 import math
 
+import numpy as np
+
+# Uzun ufuklu (1e8 döngü) hasat için varsayılan parça boyutu: ~8 MB / dizi
+HARVEST_CHUNK_SIZE = 1 << 20
+
+
+def harvest_chunk(start_cycle: int, n_cycles: int, rng: np.random.Generator,
+                  c: float = 299.792, panic_threshold: float = 78.0):
+    """
+    run_harvest döngüsünün I/O içermeyen, vektörel tek parça (chunk) çekirdeği.
+
+    [start_cycle + 1, start_cycle + n_cycles] aralığındaki döngüleri tek seferde
+    hesaplar; formüller run_harvest ile birebir aynıdır.
+
+    Args:
+        start_cycle (int): Bu parçadan önce tamamlanmış döngü sayısı.
+        n_cycles (int): Parçadaki döngü sayısı.
+        rng (np.random.Generator): Kaos akısı için tohumlanmış üreteç.
+        c (float): Işık hızı katsayısı.
+        panic_threshold (float): CEO Panik Valfi eşiği (Rezonans Birimi).
+
+    Returns:
+        tuple: (parça hasadı toplamı MeV, valf aktivasyon sayısı)
+    """
+    cycles = np.arange(start_cycle + 1, start_cycle + n_cycles + 1, dtype=np.float64)
+    chaos_flux = rng.uniform(50, 150, size=n_cycles) * (cycles / 10)
+    l_path = c * cycles
+    harvest = (l_path ** 2) * 1e-9 * chaos_flux / 10000
+    valve = chaos_flux > panic_threshold * 10
+    harvest[valve] *= 0.5
+    return float(harvest.sum()), int(np.count_nonzero(valve))
+
 class ChernobylHarvester:
     def __init__(self):
         self.C = 299.792
@@ -60,5 +92,57 @@ class ChernobylHarvester:
         except KeyboardInterrupt:
             print("\n[!] Operasyon durduruldu.")
 
+    def run_harvest_chunked(self, total_cycles: int = 100_000_000, seed: int = 0,
+                            chunk_size: int = HARVEST_CHUNK_SIZE) -> dict:
+        """
+        Uzun ufuklu hasat modu: 1e8 döngüye kadar sabit boyutlu parçalarla çalışır.
+
+        Bellek kullanımı chunk_size ile sınırlıdır; döngü içi hesap tamamen
+        NumPy üzerindedir. Aynı tohum (seed) her parça boyutunda aynı kaos akısı
+        dizisini üretir. Parça toplamları Neumaier telafili toplama ile float64
+        olarak biriktirilir; sonlu olmayan bir ara toplam FloatingPointError
+        fırlatır.
+
+        Args:
+            total_cycles (int): Hesaplanacak toplam döngü sayısı.
+            seed (int): Deterministik kaos akısı tohumu.
+            chunk_size (int): Parça başına döngü sayısı.
+
+        Returns:
+            dict: cycles, total_energy_mev ve valve_activations alanları.
+        """
+        if total_cycles < 0 or chunk_size < 1:
+            raise ValueError("total_cycles negatif, chunk_size sıfır olamaz.")
+        rng = np.random.default_rng(seed)
+        total, compensation = self.total_energy_mev, 0.0
+
+        done = 0
+        while done < total_cycles:
+            n = min(chunk_size, total_cycles - done)
+            chunk_energy, chunk_valves = harvest_chunk(
+                self.cycle + done, n, rng, self.C, self.CEO_PANIC_THRESHOLD
+            )
+            if not math.isfinite(chunk_energy):
+                raise FloatingPointError(
+                    f"Hasat toplamı {self.cycle + done + n}. döngüde float64 sınırını aştı."
+                )
+            # Neumaier telafili toplama (parçalar arası yuvarlama kaybını önler)
+            running = total + chunk_energy
+            if abs(total) >= abs(chunk_energy):
+                compensation += (total - running) + chunk_energy
+            else:
+                compensation += (chunk_energy - running) + total
+            total = running
+            self.valve_activations += chunk_valves
+            done += n
+
+        self.cycle += total_cycles
+        self.total_energy_mev = total + compensation
+        return {
+            "cycles": self.cycle,
+            "total_energy_mev": self.total_energy_mev,
+            "valve_activations": self.valve_activations,
+        }
+
 if __name__ == "__main__":
     ChernobylHarvester().run_harvest()
@@ -2,13 +2,105 @@ import time
 import sys
 import random
 
+import numpy as np
+
 # --- FAZZ-5.1: GADOLINIUM HYDRO-GEN PROTOCOL ---
 # LOCATION: CHERNOBYL EXCLUSION ZONE (PRIPYAT)
 # ELEMENT: GADOLINIUM (Gd-157)
 # GOAL: RADIOLYSIS -> H2 PRODUCTION
 
+
+def reactor_trajectory(total_cycles: int = 250, seed: int = 0, c: float = 299.792,
+                       n_observer: int = 12, cross_section: float = 259000) -> dict:
+    """
+    run_reactor döngüsünün döngü başına yörünge kaydı (tank, basınç, valf).
+
+    Basınç artışları tek seferde hesaplanır; iki valf tahliyesi arasındaki her
+    segment kümülatif toplamın bir dilimidir. Python döngüsü döngü sayısıyla
+    değil valf tahliyesi sayısıyla orantılıdır. Rastgelelik akışı
+    run_reactor_event_driven(seed=seed) ile aynıdır.
+
+    Args:
+        total_cycles (int): Kaydedilecek döngü sayısı.
+        seed (int): Radyasyon akısı tohumu.
+        c (float): Işık hızı katsayısı.
+        n_observer (int): Nizam sabiti.
+        cross_section (float): Gd nötron yakalama kesiti (barn).
+
+    Returns:
+        dict: cycle, h2_tank, pressure (valf sonrası), valve (bool) sütunları.
+    """
+    rng = np.random.default_rng(seed)
+    valve_limit = (n_observer * (n_observer + 1)) / 2
+    cycles = np.arange(1, total_cycles + 1, dtype=np.float64)
+    surface_area = ((c / 1000) * (cycles * 0.01)) ** 2
+    h2 = (surface_area * rng.uniform(500, 1200, size=total_cycles) * (cross_section / 1e6)) / n_observer
+    cum = np.cumsum(h2 * 0.05)
+
+    pressure = np.empty(total_cycles)
+    valve = np.zeros(total_cycles, dtype=bool)
+    start, base = 0, 0.0
+    while start < total_cycles:
+        already = cum[start - 1] if start else 0.0
+        hit = start + int(np.searchsorted(cum[start:], already + valve_limit - base, side="right"))
+        stop = min(hit + 1, total_cycles)
+        pressure[start:stop] = base + (cum[start:stop] - already)
+        if hit >= total_cycles:
+            break
+        pressure[hit] *= 0.6
+        valve[hit] = True
+        start, base = hit + 1, pressure[hit]
+    return {"cycle": cycles, "h2_tank": np.cumsum(h2), "pressure": pressure, "valve": valve}
+
+
+def reactor_batch(n_observer, cross_section, flux_low, flux_high, total_cycles: int = 250,
+                  n_seeds: int = 8, seed: int = 0, c: float = 299.792) -> dict:
+    """
+    Satır başına bir parametre seti olan reaktör topluluğunun özetleri.
+
+    Parametreler (n,) dizileridir; döngü ekseni Python'da, satır ve tohum
+    eksenleri NumPy'da ilerler. Tüm satırlar aynı tohumun tekdüze
+    çekilişlerini paylaşır (ortak rastgele sayılar): akı = low + (high - low)·u.
+    Böylece sonuç, satırın yalnızca kendi parametrelerinin deterministik bir
+    fonksiyonudur ve aynı satır hangi partide hesaplanırsa hesaplansın aynı
+    değeri verir (duyarlılık analizi ve önbellek için gerekli).
+
+    Args:
+        n_observer: (n,) Nizam sabiti (tam sayıya yuvarlanır).
+        cross_section: (n,) Gd nötron yakalama kesiti (barn).
+        flux_low, flux_high: (n,) radyasyon akısı aralığı (W/m2).
+        total_cycles (int): Döngü sayısı.
+        n_seeds (int): Ortalaması alınan akı gerçekleşmesi.
+        seed (int): Ortak akı çekilişlerinin tohumu.
+        c (float): Işık hızı katsayısı.
+
+    Returns:
+        dict: (n,) valve_releases, peak_pressure, h2_tank (tohum ortalamaları).
+    """
+    n_observer = np.rint(np.asarray(n_observer, dtype=np.float64))[:, None]
+    cross_section, flux_low, flux_high = (np.asarray(value, dtype=np.float64)[:, None]
+                                          for value in (cross_section, flux_low, flux_high))
+    u = np.random.default_rng(seed).uniform(size=(total_cycles, n_seeds))
+    valve_limit = (n_observer * (n_observer + 1)) / 2
+    rate = (cross_section / 1e6) / n_observer
+    shape = np.broadcast_shapes(rate.shape, (1, n_seeds))
+    pressure, peak, tank = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+    releases = np.zeros(shape)
+    for cycle in range(1, total_cycles + 1):
+        surface_area = ((c / 1000) * (cycle * 0.01)) ** 2
+        h2 = surface_area * (flux_low + (flux_high - flux_low) * u[cycle - 1]) * rate
+        tank += h2
+        pressure += h2 * 0.05
+        np.maximum(peak, pressure, out=peak)
+        valve = pressure > valve_limit
+        pressure[valve] *= 0.6
+        releases += valve
+    return {"valve_releases": releases.mean(axis=1), "peak_pressure": peak.mean(axis=1),
+            "h2_tank": tank.mean(axis=1)}
+
+
 class Chernobyl_Gadolinium_Core:
-    def __init__(self):
+    def __init__(self, banner: bool = True):
         self.C = 299.792    # Işık Hızı (Reaksiyon Hızı)
         self.N_OBSERVER = 12  # Nizam Sabiti
         self.CEO_VALVE = (self.N_OBSERVER * (self.N_OBSERVER + 1)) / 2 # Sabit: 78
@@ -19,7 +111,9 @@ class Chernobyl_Gadolinium_Core:
         self.cycle = 0
         self.h2_tank = 0.0   # Depolanan Hidrojen (Litre)
         self.pressure = 0.0   # Tank Basıncı (Bar)
-        
+
+        if not banner:
+            return
         print(f"\033[1;36m>>> GADOLINIUM MATRİSİ YERLEŞTİRİLDİ <<<\033[0m")
         print(f"\033[1;31m>>> ÇERNOBYL RADYASYON AKIŞI BAŞLATILIYOR...\033[0m")
         print("-" * 60)
@@ -75,5 +169,90 @@ class Chernobyl_Gadolinium_Core:
         except KeyboardInterrupt:
             print(f"\n\n\033[1;31m[!] ACİL DURDURMA.\033[0m")
 
+    def run_reactor_event_driven(self, total_cycles: int = 250, seed: int = 0,
+                                 chunk_size: int = 1 << 16) -> dict:
+        """
+        run_reactor'ın ayrık olay sürümü: CEO valfi tahliyeleri planlanmış olaylardır.
+
+        Radyasyon akısı ve H2 üretimi basınçtan bağımsız olduğundan basınç artışları
+        parça parça önceden hesaplanır. Artışlar pozitif olduğundan kümülatif toplam
+        monotondur; bir sonraki eşik aşımı searchsorted ile O(log n) bulunur ve valf
+        olayı o döngüye planlanır. Saat olaylar arasındaki döngüleri atlar.
+
+        Args:
+            total_cycles (int): Toplam reaktör döngüsü.
+            seed (int): Radyasyon akısı tohumu.
+            chunk_size (int): Önceden hesaplanan döngü bloğu (bellek sınırı).
+
+        Returns:
+            dict: cycles, h2_tank, pressure, valve_releases, released_bar, events
+        """
+        from src.core.event_kernel import EventScheduler
+
+        rng = np.random.default_rng(seed)
+        kernel = EventScheduler(start=self.cycle)
+        end_cycle = self.cycle + total_cycles
+        released = {"count": 0, "bar": 0.0}
+        block = {}
+
+        def load_block(first_cycle):
+            # [first_cycle, first_cycle + n) döngülerinin basınç artışları
+            n = min(chunk_size, end_cycle - first_cycle + 1)
+            cycles = np.arange(first_cycle, first_cycle + n, dtype=np.float64)
+            surface_area = ((self.C / 1000) * (cycles * 0.01)) ** 2
+            flux = rng.uniform(500, 1200, size=n)
+            h2 = (surface_area * flux * (self.Gd_cross_section / 1e6)) / self.N_OBSERVER
+            block.update(first=first_cycle, h2=h2, cum=np.cumsum(h2 * 0.05), base=0.0)
+
+        def advance_to(cycle):
+            # Bloktaki son işlenen döngüden `cycle`a kadar üretimi tanka ve basınca ekler
+            start = self.cycle - block["first"] + 1
+            stop = cycle - block["first"] + 1
+            self.h2_tank += float(block["h2"][start:stop].sum())
+            self.pressure += float(block["cum"][stop - 1] - (block["cum"][start - 1] if start else 0.0))
+            self.cycle = cycle
+
+        def plan_next(k):
+            # Bu blokta basıncın eşiği aşacağı ilk döngüyü bul ve olay planla
+            if self.cycle >= end_cycle:
+                return
+            if self.cycle + 1 > block["first"] + len(block["h2"]) - 1:
+                load_block(self.cycle + 1)
+            offset = self.cycle - block["first"] + 1
+            already = block["cum"][offset - 1] if offset else 0.0
+            threshold = already + (self.CEO_VALVE - self.pressure)
+            hit = offset + int(np.searchsorted(block["cum"][offset:], threshold, side="right"))
+            block_last = block["first"] + len(block["h2"]) - 1
+            if hit < len(block["h2"]) and block["first"] + hit <= end_cycle:
+                k.schedule(block["first"] + hit, "valve")
+            else:
+                k.schedule(min(block_last, end_cycle), "horizon")
+
+        def on_valve(k, event):
+            advance_to(int(event.time))
+            release_amount = self.pressure * 0.4
+            self.pressure -= release_amount
+            released["count"] += 1
+            released["bar"] += release_amount
+            plan_next(k)
+
+        def on_horizon(k, event):
+            advance_to(int(event.time))
+            plan_next(k)
+
+        kernel.on("valve", on_valve)
+        kernel.on("horizon", on_horizon)
+        load_block(self.cycle + 1)
+        plan_next(kernel)
+        kernel.run()
+        return {
+            "cycles": self.cycle,
+            "h2_tank": self.h2_tank,
+            "pressure": self.pressure,
+            "valve_releases": released["count"],
+            "released_bar": released["bar"],
+            "events": kernel.processed,
+        }
+
 if __name__ == "__main__":
     Chernobyl_Gadolinium_Core().run_reactor()
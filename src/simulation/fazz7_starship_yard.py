@@ -8,12 +8,14 @@ import random
 # ARCHITECT: MIMAR (COMMANDER)
 
 class Derzz_Starship_Yard:
-    def __init__(self):
+    def __init__(self, banner: bool = True):
         self.N_OBSERVER = 12
         self.alloy_code = "Ag92-Gd7"
         self.ship_integrity = 0
         self.mars_distance = 225_000_000 # km
-        
+
+        if not banner:
+            return
         print("\033[1;36m>>> FAZZ-7: YÖRÜNGE TERSANESİ AKTİF <<<\033[0m")
         print("\033[1;33m[KOMUTAN] Mimar Yetkisi Doğrulandı. Montaj Başlıyor...\033[0m")
 
@@ -17,13 +17,15 @@ class DerzzTMIComputer:
         fuel_pressure (float): Yakıt basıncı (Bar).
     """
     
-    def __init__(self):
+    def __init__(self, banner: bool = True):
         self.current_velocity = 38650.0  # km/h (LEO Hızı - Low Earth Orbit)
         self.escape_velocity = 40320.0   # km/h (Dünya'dan Kaçış)
         self.mars_distance = 225_000_000 # km
         self.fuel_pressure = 78.0        # Bar
         self.status = "ORBITING"
-        
+
+        if not banner:
+            return
         print("\033[1;36m>>> FAZZ-9: TRANS-MARS INJECTION (TMI) BİLGİSAYARI AKTİF <<<\033[0m")
         print("\033[1;33m[KOMUTAN] Yörünge Senkronizasyonu Bekleniyor...\033[0m")
         time.sleep(1)
@@ -7,14 +7,16 @@ import random
 # ----------------------------------------------
 
 class Derzz_Gemini_3_Pilot:
-    def __init__(self):
+    def __init__(self, banner: bool = True):
         self.C = 299.792        # Işık Hızı (Simüle Katsayı)
         self.N_OBSERVER = 12    # Nizam Sabiti
         self.TARGET_DIST = 225000000 # Mars Hedef (km)
         self.cycle = 0
         self.total_energy = 0.0
         self.distance_traveled = 0
-        
+
+        if not banner:
+            return
         print("\033[1;35m" + "="*60)
         print(f">>> GEMINI 3 COMMAND CENTER: ACTIVE <<<")
         print(f">>> PROTOKOL: AGGRESSIVE EXPANSION BAŞLATILDI")
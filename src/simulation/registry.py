@@ -0,0 +1,140 @@
+"""
+FAZZ-4 TEMBEL SİMÜLASYON KAYDI
+
+Simülasyonlar adla bulunur; modülleri yalnızca ilk kullanımda içe aktarılır.
+Kayıt modülünün kendisi yalnızca standart kütüphaneye dayanır: adları
+listelemek, açıklamaları göstermek veya bir adı çözmek NumPy'yi, FastAPI'yi
+ya da herhangi bir simülasyon modülünü yüklemez. CLI'ın ve yeni uvicorn
+işçilerinin soğuk başlangıcı bu sayede kullanılmayan simülasyonların
+maliyetini ödemez (bkz. benchmarks/startup.py bütçe kontrolü).
+
+Adlar üç biçimde çözülür:
+    "mars_arrival"          kayıt adı
+    "fazz10_mars_arrival"   modül adı
+    "fazz10"                FAZZ numarası (tekilse)
+
+Kurulum (create) varsayılan olarak başlık (banner) basmaz ve uyumaz.
+"""
+import importlib
+import pkgutil
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PACKAGE = "src.simulation"
+
+
+@dataclass(frozen=True)
+class SimulationSpec:
+    """
+    Bir simülasyonun içe aktarmadan bilinen tanımı.
+
+    Attributes:
+        name (str): Kayıt adı.
+        module (str): src.simulation altındaki modül adı.
+        attr (str): Simülasyon sınıfının adı.
+        title (str): Kısa açıklama.
+        banner (bool): Sınıf kurucusu banner=False kabul ediyor mu (başlık + uyku).
+    """
+    name: str
+    module: str
+    attr: str
+    title: str
+    banner: bool = True
+
+    @property
+    def qualified_module(self) -> str:
+        return f"{PACKAGE}.{self.module}"
+
+
+SIMULATIONS: Dict[str, SimulationSpec] = {spec.name: spec for spec in (
+    SimulationSpec("hyperscale_mars", "fazz4_hyperscale_mars", "Derzz_Architect_UI",
+                   "FAZZ-4 hiper ölçek Mars seyri"),
+    SimulationSpec("chernobyl_harvest", "fazz5_chernobyl_harvest", "ChernobylHarvester",
+                   "FAZZ-5 Çernobil enerji hasadı", banner=False),
+    SimulationSpec("gadolinium_h2", "fazz5_gadolinium_h2", "Chernobyl_Gadolinium_Core",
+                   "FAZZ-5.1 gadolinyum H2 reaktörü"),
+    SimulationSpec("metallurgy_ignition", "fazz6_metallurgy_ignition", "DerzzPropulsionLab",
+                   "FAZZ-6 alaşım ve ateşleme laboratuvarı"),
+    SimulationSpec("starship_yard", "fazz7_starship_yard", "Derzz_Starship_Yard",
+                   "FAZZ-7 yörünge tersanesi"),
+    SimulationSpec("launch_control", "fazz8_launch_control", "Derzz_Launch_Control",
+                   "FAZZ-8 fırlatma kontrolü", banner=False),
+    SimulationSpec("trans_mars_injection", "fazz9_trans_mars_injection", "DerzzTMIComputer",
+                   "FAZZ-9 Mars transfer ateşlemesi"),
+    SimulationSpec("mars_arrival", "fazz10_mars_arrival", "DerzzMarsArrival",
+                   "FAZZ-10 Mars varışı (dönüş ve frenleme)"),
+    SimulationSpec("mars_landing", "fazz11_mars_landing", "DerzzMarsLanding",
+                   "FAZZ-11 Mars yüzey inişi"),
+    SimulationSpec("mars_colonization", "fazz12_mars_colonization", "DerzzMarsBase",
+                   "FAZZ-12 Mars yüzey operasyonu"),
+    SimulationSpec("earth_return", "fazz13_earth_return", "DerzzEarthReturn",
+                   "FAZZ-13 Dünya'ya dönüş"),
+    SimulationSpec("gemini3_pilot", "gemini3_pilot", "Derzz_Gemini_3_Pilot",
+                   "Gemini 3 komuta merkezi"),
+)}
+
+
+def names() -> List[str]:
+    return list(SIMULATIONS)
+
+
+def resolve(name: str) -> SimulationSpec:
+    """
+    Kayıt adını, modül adını veya FAZZ numarasını tanıma çevirir.
+
+    Raises:
+        KeyError: Ad bilinmiyorsa ya da birden çok simülasyona uyuyorsa.
+    """
+    if name in SIMULATIONS:
+        return SIMULATIONS[name]
+    matches = [spec for spec in SIMULATIONS.values()
+               if spec.module == name or spec.module.split("_", 1)[0] == name]
+    if len(matches) != 1:
+        hint = "belirsiz" if matches else "bilinmiyor"
+        raise KeyError(f"Simülasyon {hint}: {name!r} (geçerli: {', '.join(SIMULATIONS)})")
+    return matches[0]
+
+
+def load_module(name: str):
+    """Simülasyon modülünü ilk çağrıda içe aktarır (sonrakiler sys.modules'tan gelir)."""
+    return importlib.import_module(resolve(name).qualified_module)
+
+
+def load(name: str) -> type:
+    """Simülasyon sınıfı."""
+    spec = resolve(name)
+    return getattr(load_module(spec.name), spec.attr)
+
+
+def create(name: str, banner: bool = False):
+    """Simülasyon örneği; banner=False iken başlık basılmaz ve uyunmaz."""
+    spec = resolve(name)
+    cls = load(spec.name)
+    return cls(banner=banner) if spec.banner else cls()
+
+
+def loaded() -> List[str]:
+    """Bu süreçte modülü içe aktarılmış simülasyonlar."""
+    return [spec.name for spec in SIMULATIONS.values() if spec.qualified_module in sys.modules]
+
+
+def discover() -> List[str]:
+    """
+    src/simulation altında kayda geçmemiş simülasyon modülleri.
+
+    Dosya sistemi taranır; modüller içe aktarılmaz.
+    """
+    known = {spec.module for spec in SIMULATIONS.values()}
+    helpers = {"registry", "dynamics"}
+    root = Path(__file__).resolve().parent
+    return sorted(info.name for info in pkgutil.iter_modules([str(root)])
+                  if info.name not in known and info.name not in helpers)
+
+
+def describe(name: Optional[str] = None) -> Dict[str, dict]:
+    """Ad -> {module, class, title, loaded}; içe aktarma yapmaz."""
+    specs = [resolve(name)] if name is not None else list(SIMULATIONS.values())
+    return {spec.name: {"module": spec.qualified_module, "class": spec.attr, "title": spec.title,
+                        "loaded": spec.qualified_module in sys.modules} for spec in specs}